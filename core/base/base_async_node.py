@@ -0,0 +1,94 @@
+"""BaseAsyncNode class is the asyncio counterpart of BaseNode.
+
+Async nodes run as tasks on an event loop instead of in a thread each, so one
+loop can drive many I/O-bound nodes (bot handlers, network sinks). They use an
+AsyncZMQMailbox, whose ``receive`` wakes up as soon as a message arrives.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class BaseAsyncNode(ABC):
+    """Abstract base class for nodes driven by an asyncio event loop.
+
+    Unlike BaseNode, the node is not started in ``__init__``: call ``start()``
+    from a coroutine running on the loop that should drive it.
+    """
+
+    def __init__(self, mailbox: Any, logger: Any, id: str = "BaseAsyncNode"):
+        """Initialize the node with a mailbox and a logger."""
+        super().__init__()
+        self.mailbox = mailbox
+        self.logger = logger
+        self.task: asyncio.Task | None = None
+        self._stop_event = asyncio.Event()
+        self.is_running = False
+        self.id = id
+
+    async def _collect_data(self) -> Any:
+        """Grabs data from mailbox."""
+        return await self.mailbox.receive()
+
+    @staticmethod
+    def from_config(config: dict[str, Any]) -> "BaseAsyncNode":
+        """Create a node instance from the given configuration.
+
+        Args:
+            config (dict[str, Any]): Configuration details for the node.
+
+        Returns:
+            BaseAsyncNode: A node instance.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by a subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def process(self, *args, **kwargs) -> Any:
+        """Execute the node's main functionality.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by a subclass.
+        """
+        raise NotImplementedError
+
+    async def run(self) -> None:
+        """Run the node processing loop until the node is stopped."""
+        while not self._stop_event.is_set():
+            try:
+                data = await self._collect_data()
+                if data is not None:
+                    result = await self.process(data)
+                    await self.mailbox.send(result)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.exception(f"Error while processing: {e}")
+
+    def start(self) -> asyncio.Task:
+        """Schedule the run loop on the running event loop."""
+        self.logger.info("Starting node...")
+        self._stop_event.clear()
+        self.task = asyncio.get_running_loop().create_task(self.run(), name=self.id)
+        self.is_running = True
+        self.logger.info("Node started.")
+        return self.task
+
+    async def stop(self) -> None:
+        """Cancel the run loop, wait for it and close the mailbox."""
+        self.logger.info("Stopping node...")
+        self._stop_event.set()
+        if self.task is not None and not self.task.done():
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+        self.mailbox.stop()
+        self.is_running = False
+        self.logger.info("Node stopped.")
@@ -0,0 +1,110 @@
+"""Abstract base class for message codecs.
+
+A codec turns a message into a list of ZeroMQ frames and back. Every codec has a
+short ``tag`` that is sent in front of the payload, so receivers can decode
+messages without knowing which codec the sender picked. Encode and decode calls
+are timed and accumulated in ``CodecStats``.
+"""
+
+from __future__ import annotations
+
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class CodecStats:
+    """Accumulated encode/decode timings of a codec."""
+
+    encode_count: int = 0
+    encode_ns: int = 0
+    decode_count: int = 0
+    decode_ns: int = 0
+
+    @property
+    def encode_avg_us(self) -> float:
+        """Average encode time in microseconds."""
+        return self.encode_ns / self.encode_count / 1000 if self.encode_count else 0.0
+
+    @property
+    def decode_avg_us(self) -> float:
+        """Average decode time in microseconds."""
+        return self.decode_ns / self.decode_count / 1000 if self.decode_count else 0.0
+
+
+class BaseCodec(ABC):
+    """Interface for codecs used by queues and mailboxes.
+
+    Subclasses implement ``_encode`` and ``_decode``; the public methods add timing.
+    """
+
+    name: str = ""
+    tag: bytes = b""
+
+    def __init__(self) -> None:
+        """Initialize the codec statistics."""
+        self.stats = CodecStats()
+
+    def __str__(self) -> str:
+        """Magic methods for string representation of codec."""
+        return f"{self.__class__.__name__}(tag={self.tag!r})"
+
+    def encode(self, item: Any) -> list[Any]:
+        """Encode a message into frames.
+
+        Args:
+        ----
+            item (Any): Message to encode.
+
+        Returns:
+        -------
+            list[Any]: Bytes-like frames.
+
+        """
+        start = time.perf_counter_ns()
+        frames = self._encode(item)
+        self.stats.encode_ns += time.perf_counter_ns() - start
+        self.stats.encode_count += 1
+        return frames
+
+    def decode(self, frames: list[memoryview]) -> Any:
+        """Decode a message from frames.
+
+        Args:
+        ----
+            frames (list[memoryview]): Frames produced by ``encode``.
+
+        Returns:
+        -------
+            Any: Decoded message.
+
+        """
+        start = time.perf_counter_ns()
+        item = self._decode(frames)
+        self.stats.decode_ns += time.perf_counter_ns() - start
+        self.stats.decode_count += 1
+        return item
+
+    @abstractmethod
+    def _encode(self, item: Any) -> list[Any]:
+        """Encode a message into frames.
+
+        Raises
+        ------
+            NotImplementedError: If the method is not implemented.
+
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def _decode(self, frames: list[memoryview]) -> Any:
+        """Decode a message from frames.
+
+        Raises
+        ------
+            NotImplementedError: If the method is not implemented.
+
+        """
+        raise NotImplementedError
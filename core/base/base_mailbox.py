@@ -7,6 +7,7 @@ The class provides an interface for sending and receiving messages, as well as m
 
 from __future__ import annotations
 
+import time
 from abc import ABC, abstractmethod
 from typing import Generic, TypeVar
 
@@ -39,3 +40,52 @@ class BaseMailbox(ABC, Generic[T]):
 
         This method should be overridden by subclasses to implement the specific receiving logic for the mailbox.
         """
+
+    def interrupt(self) -> None:
+        """Wake up a ``receive`` call that is blocked waiting for messages.
+
+        No-op by default; mailboxes whose ``receive`` can block indefinitely override it.
+        """
+
+    def wait_ready(self, timeout: float = 1.0) -> bool:
+        """Wait until the receivers of all outgoing edges are connected.
+
+        Returns True by default; mailboxes that can lose messages sent before that override it.
+        """
+        return True
+
+    @property
+    def has_outputs(self) -> bool:
+        """Whether sent messages go anywhere; True unless the mailbox knows it has no outputs."""
+        return True
+
+    @property
+    def pending(self) -> int:
+        """Number of received messages not yet taken by ``receive``; 0 if unknown."""
+        return 0
+
+    def send_many(self, messages: list[T]) -> None:
+        """Send several messages.
+
+        Falls back to one ``send`` per message; subclasses may send them as one batch.
+        """
+        for message in messages:
+            self.send(message)
+
+    def receive_many(self, max_items: int, timeout: float | None = None, linger: float = 0.0) -> list[T]:
+        """Receive up to ``max_items`` messages.
+
+        Falls back to ``receive`` calls, which use their own timeout, for up to
+        ``linger`` seconds after the first message; subclasses may drain several
+        messages at once.
+        """
+        message = self.receive()
+        if message is None:
+            return []
+        messages = [message]
+        deadline = time.monotonic() + linger
+        while len(messages) < max_items and time.monotonic() < deadline:
+            message = self.receive()
+            if message is not None:
+                messages.append(message)
+        return messages
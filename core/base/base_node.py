@@ -2,11 +2,38 @@
 
 Nodes are the fundamental building blocks that process data and communicate with
 each other through mailboxes.
+
+Runtime options (see ``BaseNode.RUNTIME_OPTIONS``) are taken from the node config
+by ``BaseNode.runtime_options`` and forwarded to ``BaseNode.__init__``. With
+``max_batch > 1`` the run loop collects up to ``max_batch`` messages, waiting at
+most ``max_wait_ms`` after the first one, and hands them to ``process_batch``.
+
+Every node records messages in and out, errors and the duration of each
+``process``/``process_batch`` call in the metrics registry, labelled with its id
+(see ``neudc.core.utils.metrics``).
+
+With ``trace_sample_rate > 0`` a source node (one whose input has no ``trace``
+field) starts a trace on that fraction of its results; every node stamps its
+hop into the ``trace`` of traced messages and nodes without outputs hand
+finished traces to the trace collector (see ``neudc.core.utils.tracing``).
+
+With ``max_age_ms > 0`` a node skips messages older than that, measured from
+their ``timestamp`` (wall clock, see Frame.timestamp), before calling
+``process``. A message with a ``deadline`` (wall-clock seconds) is skipped once
+the deadline has passed, whatever ``max_age_ms`` is. Skipped messages are
+counted in ``pycore_node_expired_total``. With ``deadline_ms > 0`` a source node
+(one whose input has no ``deadline`` field) stamps ``deadline = timestamp +
+deadline_ms`` on its results, giving each frame an end-to-end budget.
 """
 
 from abc import ABC, abstractmethod
 from typing import Any
+import random
 import threading
+import time
+
+from neudc.core.utils.metrics import get_registry
+from neudc.core.utils.tracing import extend_trace, get_collector
 
 
 class BaseNode(ABC):
@@ -19,17 +46,65 @@ class BaseNode(ABC):
     Nodes are the fundamental building blocks that process data and communicate
     with each other through mailboxes.
     """
-    def __init__(self, mailbox: Any, logger: Any, id:str = "BaseNode"):
-        """Initialize the node with a mailbox and a logger."""
+
+    RUNTIME_OPTIONS = ("id", "max_batch", "max_wait_ms", "autostart", "trace_sample_rate", "max_age_ms", "deadline_ms")
+
+    def __init__(
+        self,
+        mailbox: Any,
+        logger: Any,
+        id:str = "BaseNode",
+        max_batch: int = 1,
+        max_wait_ms: float = 0.0,
+        autostart: bool = True,
+        trace_sample_rate: float = 0.0,
+        max_age_ms: float = 0.0,
+        deadline_ms: float = 0.0,
+    ):
+        """Initialize the node with a mailbox and a logger.
+
+        Args:
+            mailbox (Any): Mailbox the node receives from and sends to.
+            logger (Any): Logger of the node.
+            id (str): Node id used in logs.
+            max_batch (int): Max messages handed to ``process_batch`` at once. 1 disables batching.
+            max_wait_ms (float): Max time to wait for a batch to fill after its first message.
+            autostart (bool): Start the node thread right away. Pipeline starts nodes itself once their edges are ready.
+            trace_sample_rate (float): Fraction of results on which a source node starts a trace. 0 disables sampling.
+            max_age_ms (float): Skip messages whose ``timestamp`` is older than this. 0 disables the age check.
+            deadline_ms (float): Budget a source node stamps on its results as ``deadline``. 0 stamps none.
+        """
         super().__init__()
         self.mailbox = mailbox
         self.logger = logger
         self.thread = None
         self._stop_event = threading.Event()
-        self._join_timeout = 0.1
+        self._join_timeout = 1.0
+        self._receive_timeout = 0.1
         self.is_running = False
         self.id = id
-        self.start()
+        self.max_batch = max_batch
+        self.max_wait_ms = max_wait_ms
+        self.trace_sample_rate = trace_sample_rate
+        self.max_age = max_age_ms / 1000
+        self.deadline = deadline_ms / 1000
+        registry = get_registry()
+        self.messages_in = registry.counter("pycore_node_messages_in_total", "Messages taken from the mailbox", node=id)
+        self.messages_out = registry.counter("pycore_node_messages_out_total", "Results sent to the outputs", node=id)
+        self.expired = registry.counter(
+            "pycore_node_expired_total", "Messages skipped as older than max_age_ms or past their deadline", node=id
+        )
+        self.errors = registry.counter("pycore_node_errors_total", "Exceptions raised while processing", node=id)
+        self.process_time = registry.histogram(
+            "pycore_node_process_seconds", "Duration of one process() or process_batch() call", node=id
+        )
+        if autostart:
+            self.start()
+
+    @staticmethod
+    def runtime_options(config: dict[str, Any]) -> dict[str, Any]:
+        """Pick the runtime options of ``BaseNode.__init__`` from a node config."""
+        return {key: config[key] for key in BaseNode.RUNTIME_OPTIONS if key in config}
 
     def _collect_data(self)-> Any:
         """Grabs data from mailbox."""
@@ -62,16 +137,117 @@ class BaseNode(ABC):
             NotImplementedError: If the method is not implemented by a subclass.
         """
         raise NotImplementedError
+
+    def process_batch(self, batch: list[Any]) -> list[Any]:
+        """Process several messages at once.
+
+        Override it for vectorized work; by default ``process`` is called per message.
+
+        Args:
+            batch (list[Any]): Up to ``max_batch`` received messages.
+
+        Returns:
+            list[Any]: Results to send; None entries are skipped.
+        """
+        return [self.process(data) for data in batch]
+
+    def _trace(self, data: Any, result: Any, started: float, finished: float) -> None:
+        """Stamp this node's hop into the trace of a traced message, or start a sampled trace."""
+        trace = getattr(data, "trace", None)
+        if trace is None:
+            # Only sources sample; a message with an empty trace field was not sampled upstream.
+            if not self.trace_sample_rate or hasattr(data, "trace") or random.random() >= self.trace_sample_rate:
+                return
+        trace = extend_trace(trace, self.id, started, finished)
+        if result is None or not self.mailbox.has_outputs:
+            get_collector().collect(trace)
+        elif hasattr(result, "trace"):
+            result.trace = trace
+
+    def _stamp_deadline(self, data: Any, result: Any) -> None:
+        """Set the deadline of a source node's result from its timestamp."""
+        if not self.deadline or hasattr(data, "deadline") or getattr(result, "deadline", False) is not None:
+            return
+        timestamp = getattr(result, "timestamp", None)
+        if timestamp is not None:
+            result.deadline = timestamp + self.deadline
+
+    def _expired(self, data: Any) -> bool:
+        """Check whether a message is past its deadline or older than ``max_age_ms``."""
+        deadline = getattr(data, "deadline", None)
+        if deadline is None:
+            if not self.max_age:
+                return False
+            timestamp = getattr(data, "timestamp", None)
+            if timestamp is None:
+                return False
+            deadline = timestamp + self.max_age
+        return time.time() > deadline
+
+    def _collect_batch(self) -> list[Any]:
+        """Grabs up to ``max_batch`` messages from mailbox.
+
+        Nodes that override ``_collect_data`` (sources) build the batch from repeated
+        ``_collect_data`` calls instead, so their own input still applies.
+        """
+        if type(self)._collect_data is not BaseNode._collect_data:
+            batch = []
+            while len(batch) < self.max_batch and not self._stop_event.is_set():
+                data = self._collect_data()
+                if data is None:
+                    break
+                batch.append(data)
+            return batch
+        return self.mailbox.receive_many(
+            self.max_batch, timeout=self._receive_timeout, linger=self.max_wait_ms / 1000
+        )
+
     def run(self):
-        """Run the node processing loop."""
-        while True:
+        """Run the node processing loop until the node is stopped."""
+        while not self._stop_event.is_set():
             try:
+                if self.max_batch > 1:
+                    batch = self._collect_batch()
+                    if batch:
+                        self.messages_in.inc(len(batch))
+                        fresh = [data for data in batch if not self._expired(data)]
+                        if len(fresh) < len(batch):
+                            self.expired.inc(len(batch) - len(fresh))
+                            batch = fresh
+                            if not batch:
+                                continue
+                        started, wall_started = time.perf_counter(), time.time()
+                        results = self.process_batch(batch)
+                        duration = time.perf_counter() - started
+                        self.process_time.record(duration)
+                        if len(results) == len(batch):
+                            for data, result in zip(batch, results):
+                                self._stamp_deadline(data, result)
+                                self._trace(data, result, wall_started, wall_started + duration)
+                        results = [result for result in results if result is not None]
+                        self.mailbox.send_many(results)
+                        self.messages_out.inc(len(results))
+                    continue
                 data = self._collect_data()
                 if data is not None:
+                    self.messages_in.inc()
+                    if self._expired(data):
+                        self.expired.inc()
+                        continue
+                    started, wall_started = time.perf_counter(), time.time()
                     result = self.process(data)
-                    self.mailbox.send(result)
+                    duration = time.perf_counter() - started
+                    self.process_time.record(duration)
+                    self._stamp_deadline(data, result)
+                    self._trace(data, result, wall_started, wall_started + duration)
+                    if result is not None:
+                        self.mailbox.send(result)
+                        self.messages_out.inc()
             except Exception as e:
+                self.errors.inc()
                 self.logger.exception(f"Error while processing: {e}")
+        if self.thread is threading.current_thread():
+            self.mailbox.stop()  # stop() was called from the node itself
     
     def start(self):
         """Start the thread with the run method."""
@@ -84,7 +260,13 @@ class BaseNode(ABC):
         """Signal the thread to stop and wait for it."""
         self.logger.info("Stopping node...")
         self._stop_event.set()
-        self.mailbox.stop()
+        if self.thread is threading.current_thread():
+            # Called from process(): the run loop closes the mailbox once the iteration is done.
+            self.logger.info("Node stopping after the current iteration.")
+            return
+        self.mailbox.interrupt()
+        # Let the current iteration finish before the mailbox closes its sockets.
         if self.thread and self.thread.is_alive():
             self.thread.join(timeout=self._join_timeout)
+        self.mailbox.stop()
         self.logger.info("Node stopped.")
@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
+import queue
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Iterable
 
 
 class QueueLike(ABC):
     """Interface for queue-like communication classes.
 
     Defines the standard methods any inter-process queue must implement.
+    ``put_many``/``get_many`` fall back to one call per item; transports that can
+    move a batch in one message override them.
     """
 
     @abstractmethod
@@ -75,3 +78,41 @@ class QueueLike(ABC):
 
         """
         raise NotImplementedError
+
+    def put_many(self, messages: Iterable[Any]) -> None:
+        """Put several items into the queue.
+
+        Args:
+        ----
+            messages (Iterable[Any]): The messages to enqueue, in order.
+
+        """
+        for message in messages:
+            self.put(message)
+
+    def get_many(self, max_items: int, timeout: float | None = None) -> list[Any]:
+        """Get up to ``max_items`` items, waiting up to a timeout for the first one.
+
+        Args:
+        ----
+            max_items (int): Maximum number of messages to return.
+            timeout (Optional[float]): Time in seconds to wait for the first message.
+
+        Returns:
+        -------
+            list[Any]: Received messages; empty if the timeout expired.
+
+        """
+        first = self.get(timeout)
+        if first is None:
+            return []
+        messages = [first]
+        while len(messages) < max_items:
+            try:
+                message = self.get_nowait()
+            except queue.Empty:
+                break
+            if message is None:
+                break
+            messages.append(message)
+        return messages
@@ -0,0 +1,10 @@
+"""Benchmarks for transports, mailboxes and pipelines.
+
+Suites (see runner.SUITES):
+    - serialization: encode/decode cost and wire size of Frame and Box per codec,
+    - transport: single-edge throughput and latency per transport class, transport and payload size,
+    - fanout: scaling of one sender to N receivers and N senders to one receiver,
+    - pipeline: frames per second of the reference reader -> resize -> saver pipeline.
+Results are written as JSON and can be compared with a previous run:
+    python -m neudc.core.benchmarks transport --out new.json --compare baseline.json
+"""
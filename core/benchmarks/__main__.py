@@ -0,0 +1,43 @@
+"""
+Command line entry point of the benchmark suite.
+
+Usage:
+    python -m neudc.core.benchmarks [suite ...] [--quick] [--out results.json] [--compare baseline.json]
+
+Without suite names every suite runs. With --compare the run is compared to a
+previous results file; the exit status is 1 if any metric regressed by more
+than --threshold.
+"""
+
+import argparse
+import logging
+import sys
+
+from neudc.core.benchmarks.runner import DEFAULT_THRESHOLD, SUITES, compare, load_results, run_suites, save_results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m neudc.core.benchmarks", description="Benchmark transports, mailboxes and pipelines.")
+    parser.add_argument("suites", nargs="*", help=f"Suites to run: {', '.join(SUITES)} (default: all).")
+    parser.add_argument("--quick", action="store_true", help="Run a reduced version of every suite.")
+    parser.add_argument("--out", default="benchmark_results.json", help="Results file to write.")
+    parser.add_argument("--compare", help="Results file of a previous run to compare with.")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Relative change counted as a regression.")
+    parser.add_argument("--log-level", default="WARNING", help="Log level; per-message debug logs distort the timings.")
+    args = parser.parse_args(argv)
+    logging.getLogger().setLevel(args.log_level)
+
+    document = run_suites(args.suites or SUITES, quick=args.quick)
+    save_results(document, args.out)
+    print(f"Wrote {len(document['results'])} results to {args.out}")
+    if not args.compare:
+        return 0
+    rows = compare(load_results(args.compare), load_results(args.out), args.threshold)
+    for row in rows:
+        marker = "REGRESSION" if row["regression"] else ""
+        print(f"{row['case']} {row['metric']}: {row['baseline']:.6g} -> {row['current']:.6g} (x{row['ratio']:.2f}) {marker}")
+    return 1 if any(row["regression"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
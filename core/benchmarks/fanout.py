@@ -0,0 +1,89 @@
+"""
+Fan-out and fan-in scaling benchmarks.
+
+Fan-out: one ZeroQueuePub connected to N ZeroQueueSub queues; every message
+is encoded once and delivered to all N subscribers. Fan-in: N ZeroQueuePub
+queues connected to one ZeroQueueSub. Both are swept over N with a fixed
+payload, so the results show how aggregate throughput and latency scale with
+the number of peers.
+"""
+
+from typing import Any, Dict
+
+from neudc.core.benchmarks.harness import BenchmarkResult, endpoint, make_frame, message_count, run_load
+from neudc.core.communication.zero_queue import ZeroQueuePub, ZeroQueueSub
+
+
+class FanoutBenchmark:
+    """
+    Throughput and latency of one sender to N receivers and of N senders to one receiver.
+    """
+
+    PEERS = (1, 2, 4, 8)
+    QUICK_PEERS = (1, 4)
+    TRANSPORTS = ("inproc", "tcp")
+    PAYLOAD_BYTES = 1_000_000
+    MESSAGES = 1000
+    MIN_MESSAGES = 20
+    BYTE_BUDGET = 1_000_000_000
+    WINDOW = 16
+    RECEIVE_TIMEOUT = 0.1
+
+    def __init__(self, quick: bool = False, payload_bytes: int = PAYLOAD_BYTES, codec: str = "pickle"):
+        """
+        Args:
+            quick (bool): Fewer peer counts and messages, for a fast sanity run.
+            payload_bytes (int): Image size of every sent frame.
+            codec (str): Codec used by the publishers.
+        """
+        self.peers = self.QUICK_PEERS if quick else self.PEERS
+        self.payload_bytes = payload_bytes
+        self.codec = codec
+        messages = self.MESSAGES // 10 if quick else self.MESSAGES
+        self.messages = message_count(payload_bytes, messages, self.BYTE_BUDGET, self.MIN_MESSAGES)
+
+    def _receive(self, sub: ZeroQueueSub) -> Any:
+        return lambda: sub.get_many(timeout=self.RECEIVE_TIMEOUT)
+
+    def run_case(self, pattern: str, transport: str, peers: int) -> BenchmarkResult:
+        """
+        Measure one pattern ("fan_out" or "fan_in") with ``peers`` receivers or senders.
+
+        In fan-in every sender sends ``messages`` frames, so the receiver gets ``peers`` times as many.
+        """
+        if pattern == "fan_out":
+            subs = [ZeroQueueSub(address=endpoint(transport)) for _ in range(peers)]
+            pubs = [ZeroQueuePub(address=[sub.addresses[0] for sub in subs], codec=self.codec)]
+        elif pattern == "fan_in":
+            subs = [ZeroQueueSub(address=endpoint(transport))]
+            pubs = [ZeroQueuePub(address=subs[0].addresses, codec=self.codec) for _ in range(peers)]
+        else:
+            raise ValueError(f"Unknown pattern: {pattern}")
+        senders = [pub.put for pub in pubs]
+        receivers = [self._receive(sub) for sub in subs]
+        frame = make_frame(self.payload_bytes)
+        try:
+            run_load(senders, receivers, frame, self.MIN_MESSAGES, 1)  # warm up connections and buffers
+            metrics: Dict[str, float] = run_load(senders, receivers, frame, self.messages, self.WINDOW)
+        finally:
+            for queue in [*pubs, *subs]:
+                queue.stop()
+        params = {
+            "pattern": pattern,
+            "transport": transport,
+            "peers": peers,
+            "payload_bytes": self.payload_bytes,
+            "codec": self.codec,
+            "messages": self.messages,
+            "window": self.WINDOW,
+        }
+        return BenchmarkResult("fanout", params, metrics)
+
+    def run(self) -> list[BenchmarkResult]:
+        """Run every case of the suite."""
+        return [
+            self.run_case(pattern, transport, peers)
+            for pattern in ("fan_out", "fan_in")
+            for transport in self.TRANSPORTS
+            for peers in self.peers
+        ]
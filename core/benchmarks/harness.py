@@ -0,0 +1,154 @@
+"""
+Measurement helpers shared by the benchmark suites.
+
+run_load drives one or more senders and receivers in threads of this process
+and measures what arrives: throughput and per-message latency (send to
+receive, taken from the perf_counter timestamp stamped into Frame.timestamp).
+Senders keep at most "window" messages in flight per sender, so a slow
+receiver slows the senders down instead of overflowing socket buffers, and
+dropped messages show up as "lost" instead of hanging the run.
+"""
+
+import os
+import tempfile
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Sequence
+
+import numpy as np
+
+from neudc.core.communication.messaging.types import Box, Frame
+from neudc.core.utils.metrics import Histogram
+
+Send = Callable[[Any], None]
+Receive = Callable[[], list]
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    One measured case: what was run ("params") and what was measured ("metrics").
+    """
+
+    name: str
+    params: Dict[str, Any] = field(default_factory=dict)
+    metrics: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def key(self) -> str:
+        """Identity of the case, used to match results of two runs."""
+        return self.name + "[" + ",".join(f"{key}={value}" for key, value in sorted(self.params.items())) + "]"
+
+
+def make_box(index: int = 0) -> Box:
+    """A detection box with typical field values."""
+    return Box(x1=10.0 + index, y1=20.0, x2=110.0 + index, y2=220.0, class_id="person", score=0.9)
+
+
+def make_frame(payload_bytes: int, boxes: int = 0) -> Frame:
+    """A Frame whose image is a uint8 array of ``payload_bytes`` bytes."""
+    return Frame(
+        image=np.zeros(payload_bytes, dtype=np.uint8),
+        timestamp=0.0,
+        source_frame="benchmark",
+        frame_id=0,
+        boxes=[make_box(index) for index in range(boxes)],
+    )
+
+
+def endpoint(transport: str) -> str:
+    """A fresh endpoint to bind for "inproc", "ipc" or "tcp"."""
+    name = uuid.uuid4().hex[:12]
+    if transport == "inproc":
+        return f"inproc://benchmark-{name}"
+    if transport == "ipc":
+        return f"ipc://{os.path.join(tempfile.gettempdir(), f'pycore-benchmark-{name}.ipc')}"
+    if transport == "tcp":
+        return "tcp://127.0.0.1:*"
+    raise ValueError(f"Unknown transport: {transport}")
+
+
+def message_count(payload_bytes: int, messages: int, byte_budget: int, min_messages: int) -> int:
+    """Messages to send for a payload size, so large payloads stay within ``byte_budget``."""
+    return max(min(messages, byte_budget // max(payload_bytes, 1)), min_messages)
+
+
+def run_load(
+    senders: Sequence[Send],
+    receivers: Sequence[Receive],
+    frame: Frame,
+    messages: int,
+    window: int,
+    idle_timeout: float = 5.0,
+) -> Dict[str, float]:
+    """
+    Send ``messages`` frames from every sender and measure them at every receiver.
+
+    Every receiver is expected to get the messages of all senders (PUB/SUB); a run ends
+    when they did, or when nothing arrived for ``idle_timeout`` seconds.
+
+    Args:
+        senders (Sequence[Send]): Send callables, each run in its own thread.
+        receivers (Sequence[Receive]): Callables returning the received messages (possibly none),
+            each run in its own thread.
+        frame (Frame): Message to send; every sender sends a copy with a fresh timestamp.
+        messages (int): Messages per sender.
+        window (int): Max messages in flight per sender. 1 measures unloaded latency.
+        idle_timeout (float): Give up after this many seconds without progress.
+
+    Returns:
+        Dict[str, float]: Throughput in messages and megabytes per second (of received
+            payload), latency percentiles in seconds and the number of lost messages.
+    """
+    expected = messages * len(senders)
+    in_flight = window * len(senders)
+    received = [0] * len(receivers)
+    sent = [0]
+    latency = Histogram()
+    cond = threading.Condition()
+
+    def send_loop(send: Send) -> None:
+        message = frame.model_copy()
+        for _ in range(messages):
+            with cond:
+                if not cond.wait_for(lambda: sent[0] - min(received) < in_flight, idle_timeout):
+                    return
+                sent[0] += 1
+            message.timestamp = time.perf_counter()
+            send(message)
+
+    def receive_loop(index: int, receive: Receive) -> None:
+        last_progress = time.monotonic()
+        while received[index] < expected:
+            items = receive()
+            if not items:
+                if time.monotonic() - last_progress > idle_timeout:
+                    return
+                continue
+            now = time.perf_counter()
+            last_progress = time.monotonic()
+            with cond:
+                for item in items:
+                    latency.record(now - item.timestamp)
+                received[index] += len(items)
+                cond.notify_all()
+
+    threads = [threading.Thread(target=receive_loop, args=args, daemon=True) for args in enumerate(receivers)]
+    threads += [threading.Thread(target=send_loop, args=(send,), daemon=True) for send in senders]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    total = sum(received)
+    return {
+        "messages_per_s": total / elapsed,
+        "mb_per_s": total * frame.image.nbytes / elapsed / 1e6,
+        "latency_p50_s": latency.percentile(50),
+        "latency_p99_s": latency.percentile(99),
+        "latency_max_s": latency.max,
+        "lost": expected * len(receivers) - total,
+    }
@@ -0,0 +1,126 @@
+"""
+Reference pipeline benchmark: reader -> ResizeNode -> SaveImageNode.
+
+The pipeline is built with the Pipeline runtime from generated JPEG images
+of a given resolution. The reader runs without frame delay and the edges are
+flow controlled ("credit_window"), so the pipeline runs as fast as its
+slowest node without dropping frames. After a warm-up the frames reaching
+the saver are counted for a fixed duration; a sample of the frames is traced
+for the end-to-end latency (see neudc.core.utils.tracing).
+
+Every resolution runs with two readers: FolderImageNode decoding the JPEGs
+("folder") and RawFrameNode replaying them from a raw frame container
+("raw", see neudc.core.utils.raw_frames), which measures the pipeline
+without decode cost.
+"""
+
+import logging
+import os
+import tempfile
+import time
+from typing import Any, Dict
+
+import cv2
+import numpy as np
+
+from neudc.core.benchmarks.harness import BenchmarkResult
+from neudc.core.runtime.pipeline import Pipeline
+from neudc.core.utils.raw_frames import write_raw_frames
+from neudc.core.utils.tracing import get_collector
+
+
+class PipelineBenchmark:
+    """
+    Frames per second and end-to-end latency of the reference reader -> resize -> saver pipeline.
+    """
+
+    RESOLUTIONS = ((1280, 720), (1920, 1080), (3840, 2160))
+    QUICK_RESOLUTIONS = ((1920, 1080),)
+    READERS = ("folder", "raw")
+    TARGET_SIZE = (640, 360)
+    IMAGES = 16
+    DURATION = 10.0
+    QUICK_DURATION = 2.0
+    WARMUP = 1.0
+    CREDIT_WINDOW = 8
+    TRACE_SAMPLE_RATE = 0.1
+    PATH = "reader>resize>saver"
+
+    def __init__(self, quick: bool = False, duration: float | None = None):
+        """
+        Args:
+            quick (bool): One resolution and a short run, for a fast sanity check.
+            duration (float | None): Measured seconds per resolution. Defaults to DURATION (QUICK_DURATION if quick).
+        """
+        self.resolutions = self.QUICK_RESOLUTIONS if quick else self.RESOLUTIONS
+        self.duration = duration or (self.QUICK_DURATION if quick else self.DURATION)
+
+    def _write_images(self, folder: str, width: int, height: int) -> None:
+        """Write IMAGES gradient images with some noise, so JPEG decoding does real work."""
+        rng = np.random.default_rng(0)
+        gradient = np.linspace(0, 255, width, dtype=np.uint8)[None, :, None]
+        for index in range(self.IMAGES):
+            image = np.broadcast_to(gradient, (height, width, 3)).copy()
+            image += rng.integers(0, 16, size=image.shape, dtype=np.uint8)
+            cv2.imwrite(os.path.join(folder, f"{index:04d}.jpg"), image)
+
+    def config(self, image_dir: str, save_dir: str, reader: str = "folder") -> Dict[str, Any]:
+        """Pipeline config of the reference pipeline with the "folder" or "raw" reader."""
+        if reader == "folder":
+            reader_cfg = {"type": "FolderImageNode", "folder_path": image_dir, "frame_delay": 0.0}
+        elif reader == "raw":
+            reader_cfg = {"type": "RawFrameNode", "path": os.path.join(image_dir, "frames.raw")}
+        else:
+            raise ValueError(f"Unknown reader: {reader}")
+        return {
+            "nodes": [
+                {"id": "reader", "mode": "loop", "outputs": ["resize"], **reader_cfg},
+                {
+                    "id": "resize",
+                    "type": "ResizeNode",
+                    "target_width": self.TARGET_SIZE[0],
+                    "target_height": self.TARGET_SIZE[1],
+                    "outputs": ["saver"],
+                },
+                {"id": "saver", "type": "SaveImageNode", "save_dir": save_dir},
+            ],
+            "credit_window": self.CREDIT_WINDOW,
+            "trace_sample_rate": self.TRACE_SAMPLE_RATE,
+        }
+
+    def run_case(self, width: int, height: int, reader: str = "folder") -> BenchmarkResult:
+        """Run the pipeline on images of one resolution."""
+        collector = get_collector()
+        with tempfile.TemporaryDirectory() as image_dir, tempfile.TemporaryDirectory() as save_dir:
+            self._write_images(image_dir, width, height)
+            if reader == "raw":
+                write_raw_frames(image_dir, os.path.join(image_dir, "frames.raw"))
+            pipeline = Pipeline(self.config(image_dir, save_dir, reader), logger=logging.getLogger(__name__))
+            started = time.monotonic()
+            pipeline.start()
+            startup_s = time.monotonic() - started
+            try:
+                time.sleep(self.WARMUP)
+                collector.clear()
+                saved = pipeline.nodes["saver"].messages_in
+                first, started = saved.value, time.perf_counter()
+                time.sleep(self.duration)
+                frames, elapsed = saved.value - first, time.perf_counter() - started
+                process_p50 = {node_id: node.process_time.percentile(50) for node_id, node in pipeline.nodes.items()}
+            finally:
+                pipeline.stop(drain=False)
+        total = collector.report().get(self.PATH, {}).get("total", {})
+        metrics = {
+            "fps": frames / elapsed,
+            "frames": frames,
+            "startup_s": startup_s,
+            "latency_p50_s": total.get("p50", 0.0),
+            "latency_p99_s": total.get("p99", 0.0),
+            **{f"{node_id}_process_p50_s": value for node_id, value in process_p50.items()},
+        }
+        params = {"reader": reader, "width": width, "height": height, "duration_s": self.duration, "credit_window": self.CREDIT_WINDOW}
+        return BenchmarkResult("pipeline", params, metrics)
+
+    def run(self) -> list[BenchmarkResult]:
+        """Run every case of the suite."""
+        return [self.run_case(width, height, reader) for width, height in self.resolutions for reader in self.READERS]
@@ -0,0 +1,119 @@
+"""
+Run benchmark suites, write their results as JSON and compare two runs.
+
+A results file is a JSON document:
+    {
+        "environment": {"python": ..., "pyzmq": ..., "libzmq": ..., "numpy": ..., "platform": ..., ...},
+        "results": [{"name": "transport", "params": {...}, "metrics": {...}}, ...]
+    }
+Results of two runs are matched by name and params (see BenchmarkResult.key).
+compare() reports the ratio current / baseline of every metric both runs have
+and flags a regression when a metric got worse by more than a threshold:
+throughput metrics ("messages_per_s", "mb_per_s", "fps") should not go down,
+latency and cost metrics (every other "_s" metric) should not go up.
+"""
+
+import datetime
+import json
+import os
+import platform
+from pathlib import Path
+from typing import Any, Dict, Iterable
+
+import numpy as np
+import zmq
+
+from neudc.core.benchmarks.fanout import FanoutBenchmark
+from neudc.core.benchmarks.harness import BenchmarkResult
+from neudc.core.benchmarks.pipeline import PipelineBenchmark
+from neudc.core.benchmarks.serialization import SerializationBenchmark
+from neudc.core.benchmarks.transport import TransportBenchmark
+
+SUITES = {
+    "serialization": SerializationBenchmark,
+    "transport": TransportBenchmark,
+    "fanout": FanoutBenchmark,
+    "pipeline": PipelineBenchmark,
+}
+HIGHER_IS_BETTER = ("messages_per_s", "mb_per_s", "fps")
+DEFAULT_THRESHOLD = 0.1
+
+
+def environment() -> Dict[str, Any]:
+    """Versions and machine details the results depend on."""
+    return {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "pyzmq": zmq.pyzmq_version(),
+        "libzmq": zmq.zmq_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def run_suites(names: Iterable[str], quick: bool = False) -> Dict[str, Any]:
+    """
+    Run the given suites in order.
+
+    Args:
+        names (Iterable[str]): Suite names, keys of SUITES.
+        quick (bool): Run the reduced version of every suite.
+
+    Returns:
+        dict: Results document with "environment" and "results".
+    """
+    names = list(names)
+    unknown = [name for name in names if name not in SUITES]
+    if unknown:
+        raise ValueError(f"Unknown benchmark suites: {unknown}; choose from {list(SUITES)}")
+    results: list[BenchmarkResult] = []
+    for name in names:
+        results.extend(SUITES[name](quick=quick).run())
+    return {"environment": {**environment(), "quick": quick}, "results": [result.__dict__ for result in results]}
+
+
+def save_results(document: Dict[str, Any], path: str | Path) -> None:
+    """Write a results document as JSON."""
+    with open(path, "w") as f:
+        json.dump(document, f, indent=2)
+
+
+def load_results(path: str | Path) -> Dict[str, BenchmarkResult]:
+    """Read a results document, keyed by BenchmarkResult.key."""
+    with open(path) as f:
+        document = json.load(f)
+    results = (BenchmarkResult(**result) for result in document["results"])
+    return {result.key: result for result in results}
+
+
+def compare(
+    baseline: Dict[str, BenchmarkResult], current: Dict[str, BenchmarkResult], threshold: float = DEFAULT_THRESHOLD
+) -> list[Dict[str, Any]]:
+    """
+    Compare the metrics of two runs case by case.
+
+    Args:
+        baseline (Dict[str, BenchmarkResult]): Results of the reference run, see load_results.
+        current (Dict[str, BenchmarkResult]): Results of the run to check.
+        threshold (float): Relative change beyond which a worse metric counts as a regression.
+
+    Returns:
+        list[dict]: One row per case and timing or throughput metric (HIGHER_IS_BETTER or "_s"): "case", "metric",
+            "baseline", "current", "ratio" (current / baseline) and "regression".
+    """
+    rows = []
+    for key, result in current.items():
+        if key not in baseline:
+            continue
+        for metric, value in result.metrics.items():
+            reference = baseline[key].metrics.get(metric)
+            if not (metric in HIGHER_IS_BETTER or metric.endswith("_s")) or not reference:
+                continue
+            ratio = value / reference
+            regression = ratio < 1 - threshold if metric in HIGHER_IS_BETTER else ratio > 1 + threshold
+            rows.append(
+                {"case": key, "metric": metric, "baseline": reference, "current": value, "ratio": ratio, "regression": regression}
+            )
+    return rows
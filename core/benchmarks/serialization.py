@@ -0,0 +1,76 @@
+"""
+Serialization cost of pipeline messages.
+
+Encodes and decodes Frame and Box messages the way the transports do
+(dumps_multipart / loads_multipart, without a socket in between) and reports
+encode and decode latency percentiles and the size on the wire. Frames are
+swept over image size and box count. The pickle codec encodes the models
+directly; msgpack does not support pydantic models, so it is measured on
+their ``model_dump()`` dicts, which is what a msgpack edge has to carry.
+"""
+
+import time
+from typing import Any, Dict
+
+import zmq
+
+from neudc.core.benchmarks.harness import BenchmarkResult, make_box, make_frame
+from neudc.core.communication.codecs import CodecFactory
+from neudc.core.communication.zero_queue.serialization import dumps_multipart, loads_multipart
+from neudc.core.utils.metrics import Histogram
+
+
+class SerializationBenchmark:
+    """
+    Encode/decode latency and wire size of Frame and Box per codec.
+    """
+
+    CODECS = ("pickle", "msgpack")
+    PAYLOAD_SIZES = (100, 1_000_000, 3840 * 2160 * 3)
+    BOX_COUNTS = (0, 10, 100)
+    ITERATIONS = 2000
+    QUICK_ITERATIONS = 200
+
+    def __init__(self, quick: bool = False):
+        """
+        Args:
+            quick (bool): Fewer iterations, for a fast sanity run.
+        """
+        self.iterations = self.QUICK_ITERATIONS if quick else self.ITERATIONS
+
+    def measure(self, message: Any, codec_name: str) -> Dict[str, float]:
+        """Encode and decode ``message`` ``iterations`` times and report the timings."""
+        codec = CodecFactory.create(codec_name)
+        decoders = {codec.tag: codec}
+        encode, decode = Histogram(), Histogram()
+        for _ in range(self.iterations):
+            started = time.perf_counter()
+            parts = dumps_multipart(message, codec)
+            encode.record(time.perf_counter() - started)
+            frames = [zmq.Frame(part) for part in parts]
+            started = time.perf_counter()
+            loads_multipart(frames, decoders)
+            decode.record(time.perf_counter() - started)
+        return {
+            "encode_p50_s": encode.percentile(50),
+            "encode_p99_s": encode.percentile(99),
+            "decode_p50_s": decode.percentile(50),
+            "decode_p99_s": decode.percentile(99),
+            "wire_bytes": sum(len(frame) for frame in frames),
+            "frames": len(frames),
+        }
+
+    def run(self) -> list[BenchmarkResult]:
+        """Run every case of the suite."""
+        results = []
+        for codec_name in self.CODECS:
+            box = make_box()
+            message = box if codec_name == "pickle" else box.model_dump()
+            results.append(BenchmarkResult("serialization", {"message": "Box", "codec": codec_name}, self.measure(message, codec_name)))
+            for payload_bytes in self.PAYLOAD_SIZES:
+                for boxes in self.BOX_COUNTS:
+                    frame = make_frame(payload_bytes, boxes)
+                    message = frame if codec_name == "pickle" else frame.model_dump()
+                    params = {"message": "Frame", "codec": codec_name, "payload_bytes": payload_bytes, "boxes": boxes}
+                    results.append(BenchmarkResult("serialization", params, self.measure(message, codec_name)))
+        return results
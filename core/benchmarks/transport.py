@@ -0,0 +1,142 @@
+"""
+Single-edge benchmarks: one sender, one receiver.
+
+Every transport class is measured over a sweep of payload sizes, from a
+100 B array to a 25 MB (4K RGB) image, on every transport it supports:
+    - zero_queue: ZeroQueuePub -> ZeroQueueSub (PUB/SUB),
+    - zero_queue_push: ZeroQueuePush -> ZeroQueuePull (PUSH/PULL),
+    - zero_queue_producer: ZeroQueueProducer -> ZeroQueueConsumer (REQ/REP, tcp only),
+    - zmq_mailbox: two ZMQMailbox instances wired by RoutingFactory (inproc and ipc;
+      tcp edges only exist between hosts).
+Each case is run twice: with "window" messages in flight for throughput and
+latency under load, and with one message in flight for unloaded latency.
+"""
+
+from typing import Any, Callable, Dict, Tuple
+
+from neudc.core.benchmarks.harness import BenchmarkResult, endpoint, make_frame, message_count, run_load
+from neudc.core.communication.messaging.routing_factory import RoutingFactory
+from neudc.core.communication.zero_queue import ZeroQueuePub, ZeroQueuePull, ZeroQueuePush, ZeroQueueSub
+from neudc.core.communication.zero_queue.queue_transfer import ZeroQueueConsumer, ZeroQueueProducer
+
+Edge = Tuple[Callable[[Any], None], Callable[[], list], Callable[[], None]]
+
+
+class TransportBenchmark:
+    """
+    Throughput and latency of a single edge per transport class, transport and payload size.
+    """
+
+    PAYLOAD_SIZES = (100, 10_000, 1_000_000, 3840 * 2160 * 3)
+    QUICK_PAYLOAD_SIZES = (100, 1_000_000)
+    TRANSPORTS = {
+        "zero_queue": ("inproc", "ipc", "tcp"),
+        "zero_queue_push": ("inproc", "ipc", "tcp"),
+        "zero_queue_producer": ("tcp",),
+        "zmq_mailbox": ("inproc", "ipc"),
+    }
+    MESSAGES = 2000
+    LATENCY_MESSAGES = 200
+    MIN_MESSAGES = 20
+    BYTE_BUDGET = 2_000_000_000
+    WINDOW = 16
+    RECEIVE_TIMEOUT = 0.1
+
+    def __init__(self, quick: bool = False, codec: str = "pickle"):
+        """
+        Args:
+            quick (bool): Fewer payload sizes and messages, for a fast sanity run.
+            codec (str): Codec used on every edge.
+        """
+        self.quick = quick
+        self.codec = codec
+        self.payload_sizes = self.QUICK_PAYLOAD_SIZES if quick else self.PAYLOAD_SIZES
+        self.messages = self.MESSAGES // 10 if quick else self.MESSAGES
+        self.byte_budget = self.BYTE_BUDGET // 10 if quick else self.BYTE_BUDGET
+
+    def _zero_queue(self, transport: str) -> Edge:
+        sub = ZeroQueueSub(address=endpoint(transport))
+        pub = ZeroQueuePub(address=sub.addresses, codec=self.codec)
+
+        def stop() -> None:
+            pub.stop()
+            sub.stop()
+
+        return pub.put, lambda: sub.get_many(timeout=self.RECEIVE_TIMEOUT), stop
+
+    def _zero_queue_push(self, transport: str) -> Edge:
+        pull = ZeroQueuePull(address=endpoint(transport))
+        push = ZeroQueuePush(address=pull.addresses, codec=self.codec)
+
+        def stop() -> None:
+            push.stop()
+            pull.stop()
+
+        return push.put, lambda: pull.get_many(timeout=self.RECEIVE_TIMEOUT), stop
+
+    def _zero_queue_producer(self, transport: str) -> Edge:
+        producer = ZeroQueueProducer(codec=self.codec)
+        consumer = ZeroQueueConsumer(port=producer.port, codec=self.codec)
+
+        def receive() -> list:
+            message = consumer.get(timeout=self.RECEIVE_TIMEOUT)
+            return [] if message is None else [message]
+
+        def stop() -> None:
+            producer.stop()
+            consumer.socket_sub.close()
+
+        return producer.put, receive, stop
+
+    def _zmq_mailbox(self, transport: str) -> Edge:
+        # Nodes in different processes get an ipc edge, nodes in the same process an inproc one.
+        receiver_process = "main" if transport == "inproc" else "receiver"
+        routing = RoutingFactory(
+            {
+                "nodes": [
+                    {"id": "sender", "outputs": ["receiver"], "codec": self.codec},
+                    {"id": "receiver", "process": receiver_process, "message_queue_size": self.WINDOW},
+                ]
+            }
+        )
+        mailboxes = routing.create_mailboxes()
+
+        def stop() -> None:
+            for mailbox in mailboxes.values():
+                mailbox.stop()
+
+        receiver = mailboxes["receiver"]
+        return mailboxes["sender"].send, lambda: receiver.receive_many(64, timeout=self.RECEIVE_TIMEOUT), stop
+
+    def run_case(self, kind: str, transport: str, payload_bytes: int) -> BenchmarkResult:
+        """Measure one transport class on one transport with one payload size."""
+        frame = make_frame(payload_bytes)
+        messages = message_count(payload_bytes, self.messages, self.byte_budget, self.MIN_MESSAGES)
+        send, receive, stop = getattr(self, f"_{kind}")(transport)
+        try:
+            run_load([send], [receive], frame, self.MIN_MESSAGES, 1)  # warm up connections and buffers
+            metrics: Dict[str, float] = run_load([send], [receive], frame, messages, self.WINDOW)
+            unloaded = run_load([send], [receive], frame, min(messages, self.LATENCY_MESSAGES), 1)
+        finally:
+            stop()
+        metrics["unloaded_latency_p50_s"] = unloaded["latency_p50_s"]
+        metrics["unloaded_latency_p99_s"] = unloaded["latency_p99_s"]
+        metrics["lost"] += unloaded["lost"]
+        params = {
+            "kind": kind,
+            "transport": transport,
+            "payload_bytes": payload_bytes,
+            "codec": self.codec,
+            "messages": messages,
+            "window": self.WINDOW,
+        }
+        return BenchmarkResult("transport", params, metrics)
+
+    def run(self) -> list[BenchmarkResult]:
+        """Run every case of the suite."""
+        return [
+            self.run_case(kind, transport, payload_bytes)
+            for kind, transports in self.TRANSPORTS.items()
+            for transport in transports
+            for payload_bytes in self.payload_sizes
+        ]
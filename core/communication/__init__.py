@@ -8,7 +8,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from neudc.core.communication.mailbox.zmq_mailbox import ZMQMailbox
-from neudc.core.communication.zero_queue.queue_transfer import ZeroQueue, ZeroQueueProducer
+from neudc.core.communication.zero_queue.queue_transfer import ZeroQueue, ZeroQueueConsumer, ZeroQueueProducer
 
 if TYPE_CHECKING:
     from neudc.core.base.base_mailbox import BaseMailbox
@@ -25,6 +25,7 @@ class TransferFactory:
         - "QueueConsumer": Creates an instance of ZeroQueueConsumer.
         - "ZMQMailbox": Creates an instance of ZMQMailbox.
     The factory method takes the data type as a string and any additional arguments or keyword arguments required for the class constructor.
+    Every type accepts a ``codec`` keyword ("pickle", "msgpack", "raw") that selects the serialization of the queue.
 
     Raises
     ------
@@ -51,8 +52,10 @@ class TransferFactory:
         to_return: QueueLike | BaseMailbox = None  # type: ignore[assignment]
         if data_type == "Queue":
             to_return = ZeroQueue(*args, **kwargs)  # type: ignore[arg-type]
-        elif data_type in ("QueueProducer", "QueueConsumer"):
+        elif data_type == "QueueProducer":
             to_return = ZeroQueueProducer(*args, **kwargs)  # type: ignore[arg-type]
+        elif data_type == "QueueConsumer":
+            to_return = ZeroQueueConsumer(*args, **kwargs)  # type: ignore[arg-type]
         elif data_type == "ZMQMailbox":
             to_return = ZMQMailbox(*args, **kwargs)  # type: ignore[arg-type]
         else:
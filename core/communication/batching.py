@@ -0,0 +1,64 @@
+"""Size- and time-bounded accumulation of outgoing messages.
+
+MessageBatcher collects messages until either ``max_batch_size`` messages are
+buffered or the oldest buffered message has waited ``max_linger`` seconds.
+The owner flushes a partially filled batch once ``time_left()`` reaches zero
+(e.g. from a timer thread), so it is not held back longer than the linger time.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+
+class MessageBatcher:
+    """Accumulate messages into batches bounded by size and linger time."""
+
+    def __init__(self, max_batch_size: int, max_linger: float) -> None:
+        """Initialize the batcher.
+
+        Args:
+        ----
+            max_batch_size (int): Number of messages that triggers a flush.
+            max_linger (float): Max time in seconds the oldest message may wait.
+
+        """
+        self.max_batch_size = max_batch_size
+        self.max_linger = max_linger
+        self._buffer: list[Any] = []
+        self._first_at = 0.0
+
+    def __len__(self) -> int:
+        """Number of buffered messages."""
+        return len(self._buffer)
+
+    def add(self, message: Any) -> list[Any] | None:
+        """Buffer a message.
+
+        Returns
+        -------
+            Optional[list[Any]]: The batch to send if a limit was reached, otherwise None.
+
+        """
+        if not self._buffer:
+            self._first_at = time.monotonic()
+        self._buffer.append(message)
+        if len(self._buffer) >= self.max_batch_size or self.due():
+            return self.drain()
+        return None
+
+    def due(self) -> bool:
+        """Check whether the oldest buffered message has exceeded the linger time."""
+        return bool(self._buffer) and time.monotonic() - self._first_at >= self.max_linger
+
+    def time_left(self) -> float | None:
+        """Seconds until the oldest buffered message exceeds the linger time, None if nothing is buffered."""
+        if not self._buffer:
+            return None
+        return max(self._first_at + self.max_linger - time.monotonic(), 0.0)
+
+    def drain(self) -> list[Any]:
+        """Return and clear all buffered messages."""
+        batch, self._buffer = self._buffer, []
+        return batch
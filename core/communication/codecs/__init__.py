@@ -0,0 +1,66 @@
+"""Codecs for serializing messages sent through queues and mailboxes.
+
+Available codecs:
+- "pickle": PickleCodec, pickle protocol 5 with out-of-band buffers (default).
+- "msgpack": MsgpackCodec, msgpack with an ndarray extension (requires msgpack).
+- "raw": RawCodec, bytes passthrough.
+"""
+
+from __future__ import annotations
+
+from neudc.core.base.base_codec import BaseCodec, CodecStats
+from neudc.core.communication.codecs.msgpack_codec import MsgpackCodec
+from neudc.core.communication.codecs.pickle_codec import PickleCodec
+from neudc.core.communication.codecs.raw_codec import RawCodec
+
+DEFAULT_CODEC = "pickle"
+
+
+class CodecFactory:
+    """Factory class for creating codecs by name or by wire tag.
+
+    Raises
+    ------
+        ValueError: If the codec name or tag is not recognized.
+
+    """
+
+    CODEC_CLASS_MAP: dict[str, type[BaseCodec]] = {
+        PickleCodec.name: PickleCodec,
+        MsgpackCodec.name: MsgpackCodec,
+        RawCodec.name: RawCodec,
+    }
+
+    @staticmethod
+    def create(codec: str | BaseCodec | None = None) -> BaseCodec:
+        """Create a codec instance.
+
+        Args:
+        ----
+            codec (str | BaseCodec | None): Codec name, an existing codec instance, or None for the default.
+
+        Returns:
+        -------
+            BaseCodec: Codec instance.
+
+        """
+        if isinstance(codec, BaseCodec):
+            return codec
+        name = codec or DEFAULT_CODEC
+        codec_class = CodecFactory.CODEC_CLASS_MAP.get(name)
+        if codec_class is None:
+            msg = f"Unknown codec: {name}"
+            raise ValueError(msg)
+        return codec_class()
+
+    @staticmethod
+    def create_from_tag(tag: bytes) -> BaseCodec:
+        """Create the codec that produced a message with the given wire tag."""
+        for codec_class in CodecFactory.CODEC_CLASS_MAP.values():
+            if codec_class.tag == tag:
+                return codec_class()
+        msg = f"Unknown codec tag: {tag!r}"
+        raise ValueError(msg)
+
+
+__all__ = ["BaseCodec", "CodecFactory", "CodecStats", "MsgpackCodec", "PickleCodec", "RawCodec"]
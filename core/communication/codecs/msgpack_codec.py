@@ -0,0 +1,77 @@
+"""MessagePack codec with an ndarray extension.
+
+Cheap for small control messages built from plain data (dicts, lists, strings,
+numbers). Numpy arrays are replaced by an extension record holding dtype, shape
+and the index of an out-of-band frame, so array data is never copied into the
+msgpack stream. Pydantic models and other objects are not supported; use the
+pickle codec for them.
+
+Frames::
+
+    [msgpack stream, array 0, array 1, ...]
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+from neudc.core.base.base_codec import BaseCodec
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+NDARRAY_EXT = 1
+
+
+class MsgpackCodec(BaseCodec):
+    """Codec for plain data and numpy arrays based on msgpack."""
+
+    name = "msgpack"
+    tag = b"mpk"
+
+    def __init__(self) -> None:
+        """Initialize the codec.
+
+        Raises
+        ------
+            ImportError: If msgpack is not installed.
+
+        """
+        if msgpack is None:
+            msg = "MsgpackCodec requires the 'msgpack' package"
+            raise ImportError(msg)
+        super().__init__()
+
+    def _encode(self, item: Any) -> list[Any]:
+        """Pack a message, moving arrays to separate frames."""
+        buffers: list[memoryview] = []
+
+        def default(obj: Any) -> Any:
+            if isinstance(obj, np.ndarray):
+                array = np.ascontiguousarray(obj)
+                buffers.append(array.data)
+                meta = msgpack.packb([len(buffers) - 1, array.dtype.str, array.shape])
+                return msgpack.ExtType(NDARRAY_EXT, meta)
+            if isinstance(obj, np.generic):
+                return obj.item()
+            msg = f"MsgpackCodec cannot encode {type(obj).__name__}"
+            raise TypeError(msg)
+
+        stream = msgpack.packb(item, default=default, use_bin_type=True)
+        return [stream, *buffers]
+
+    def _decode(self, frames: list[memoryview]) -> Any:
+        """Unpack a message, rebuilding arrays as views over their frames."""
+        stream, *buffers = frames
+
+        def ext_hook(code: int, data: bytes) -> Any:
+            if code != NDARRAY_EXT:
+                return msgpack.ExtType(code, data)
+            index, dtype, shape = msgpack.unpackb(data)
+            return np.frombuffer(buffers[index], dtype=np.dtype(dtype)).reshape(shape)
+
+        return msgpack.unpackb(stream, ext_hook=ext_hook, raw=False)
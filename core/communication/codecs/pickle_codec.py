@@ -0,0 +1,39 @@
+"""Pickle protocol 5 codec with out-of-band buffers.
+
+Every contiguous buffer reachable from the message (``Frame.image``,
+``Segmentation.image`` and any other numpy array) is emitted out-of-band instead
+of being copied into the pickle stream. Buffers are sent as separate frames and
+the decoder rebuilds arrays as views over the received frames.
+
+Frames::
+
+    [pickle stream, buffer 0, buffer 1, ...]
+"""
+
+from __future__ import annotations
+
+import pickle
+from typing import Any
+
+from neudc.core.base.base_codec import BaseCodec
+
+
+class PickleCodec(BaseCodec):
+    """Codec for arbitrary Python objects. Default for all queues."""
+
+    name = "pickle"
+    tag = b"pk5"
+
+    def _encode(self, item: Any) -> list[Any]:
+        """Pickle a message, keeping buffers out-of-band.
+
+        Buffers reference the original memory, so the payload must not be modified until it is sent.
+        """
+        buffers: list[pickle.PickleBuffer] = []
+        stream = pickle.dumps(item, protocol=5, buffer_callback=buffers.append)
+        return [stream, *(buffer.raw() for buffer in buffers)]
+
+    def _decode(self, frames: list[memoryview]) -> Any:
+        """Unpickle a message on top of the received buffers."""
+        stream, *buffers = frames
+        return pickle.loads(stream, buffers=buffers)  # noqa: S301
@@ -0,0 +1,35 @@
+"""Raw bytes passthrough codec.
+
+Sends bytes-like payloads as they are, without any serialization. A single
+bytes-like object becomes one frame; a list or tuple of bytes-like objects
+becomes one frame per element. On receive, a single frame is returned as a
+``memoryview`` and several frames as a list of ``memoryview``.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from neudc.core.base.base_codec import BaseCodec
+
+
+class RawCodec(BaseCodec):
+    """Codec for payloads that are already bytes."""
+
+    name = "raw"
+    tag = b"raw"
+
+    def _encode(self, item: Any) -> list[Any]:
+        """Pass bytes-like payloads through as frames."""
+        parts = list(item) if isinstance(item, (list, tuple)) else [item]
+        try:
+            return [memoryview(part) for part in parts]
+        except TypeError as err:
+            msg = f"RawCodec expects bytes-like payloads, got {type(item).__name__}"
+            raise TypeError(msg) from err
+
+    def _decode(self, frames: list[memoryview]) -> Any:
+        """Return the received frames without decoding."""
+        if len(frames) == 1:
+            return frames[0]
+        return list(frames)
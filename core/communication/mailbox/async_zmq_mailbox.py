@@ -0,0 +1,158 @@
+"""asyncio-native mailbox built on AsyncZeroQueue.
+
+AsyncZMQMailbox has the same wiring as ZMQMailbox (bound ``endpoints``,
+``add_publisher``/``remove_publisher``, one publisher per codec) but no receiver
+thread and no receive buffer: ``await receive()`` reads straight from the
+subscriber socket and wakes up as soon as a message arrives.
+
+It can receive from and send to regular ZMQMailbox instances, since both use
+the same wire format and the process-wide context. Shared-memory images and
+send batching are only available in ZMQMailbox.
+
+Typical usage:
+    mailbox = AsyncZMQMailbox(name="bot", endpoints=["inproc://ns/bot"])
+    message = await mailbox.receive()
+    await mailbox.send(reply)
+    mailbox.stop()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+import zmq
+
+from neudc.core.base.base_codec import BaseCodec, CodecStats
+from neudc.core.base.base_mailbox import BaseMailbox
+from neudc.core.communication.codecs import CodecFactory
+from neudc.core.communication.zero_queue.async_zero_queue import AsyncZeroQueue
+from neudc.core.communication.zero_queue.zmq_state import ZeroQueueConnectionType, ZeroQueueMode
+
+
+class AsyncZMQMailbox(BaseMailbox[dict]):
+    """ZeroMQ mailbox with awaitable ``send``/``receive``."""
+
+    def __init__(
+        self,
+        *,
+        logger: logging.Logger | None = None,
+        name: str = "AsyncZMQMailbox",
+        codec: str | BaseCodec | None = None,
+        endpoints: list[str] | None = None,
+        context: zmq.Context | None = None,
+    ) -> None:
+        """Initialize the asyncio mailbox.
+
+        Args:
+        ----
+            logger (Optional[logging.Logger]): Logger for debug messages.
+            name (str): Mailbox name used in logs.
+            codec (str | BaseCodec | None): Default codec name for outgoing edges. Default is pickle.
+            endpoints (Optional[list[str]]): Addresses to receive on. If None, a random TCP port is bound.
+            context (Optional[zmq.Context]): Context shared by all sockets. Defaults to the process-wide context.
+
+        """
+        self.logger = logger or logging.getLogger(__name__)
+        self.name = name
+        self.codec = codec
+        self.context = context
+        self.sub_queue = AsyncZeroQueue(
+            mode=ZeroQueueMode.SUB,
+            contype=ZeroQueueConnectionType.BIND,
+            address=endpoints,
+            context=context,
+        )
+        self.consume_port: int = self.sub_queue.port
+        self.consume_endpoints: list[str] = list(self.sub_queue.addresses)
+        self.pub_sockets: dict[str, AsyncZeroQueue] = {}
+        self._publishers: dict[bytes, AsyncZeroQueue] = {}
+
+    def stop(self) -> None:
+        """Close all sockets of the mailbox."""
+        self.sub_queue.stop()
+        for pub_socket in self._publishers.values():
+            pub_socket.stop()
+
+    async def send(self, message: Any) -> None:  # type: ignore[override]
+        """Send a message to every output."""
+        await asyncio.gather(*(pub_socket.put(message) for pub_socket in self._publishers.values()))
+        self.logger.debug(f"[{self.name}][SEND] → {type(message)}")
+
+    async def send_many(self, messages: list[Any]) -> None:  # type: ignore[override]
+        """Send several messages to every output as multipart batches."""
+        if not messages:
+            return
+        await asyncio.gather(*(pub_socket.put_many(messages) for pub_socket in self._publishers.values()))
+        self.logger.debug(f"[{self.name}][SEND] → batch of {len(messages)}")
+
+    async def receive(self, timeout: float | None = None) -> Any | None:  # type: ignore[override]
+        """Receive a message.
+
+        Args:
+        ----
+            timeout (Optional[float]): Max time to wait in seconds. If None, waits until a message arrives.
+
+        Returns:
+        -------
+            Optional[Any]: Received message, or None if the timeout expired.
+
+        """
+        message = await self.sub_queue.get(timeout)
+        if message is not None:
+            self.logger.debug(f"[{self.name}][RECV] ← {type(message)}")
+        return message
+
+    async def receive_many(self, max_items: int, timeout: float | None = None) -> list[Any]:  # type: ignore[override]
+        """Receive up to ``max_items`` messages, waiting up to a timeout for the first one."""
+        return await self.sub_queue.get_many(max_items, timeout)
+
+    async def wait_ready(self, timeout: float = 1.0) -> bool:
+        """Wait until the receivers of all outgoing edges are connected."""
+        results = await asyncio.gather(*(pub_socket.wait_ready(timeout) for pub_socket in self._publishers.values()))
+        return all(results)
+
+    def codec_stats(self) -> dict[str, CodecStats]:
+        """Get encode/decode timings of the codecs used on incoming and outgoing edges."""
+        stats = self.sub_queue.codec_stats()
+        for pub_socket in self._publishers.values():
+            outputs = ",".join(pub_socket.addresses)
+            stats.update({f"{name}->{outputs}": value for name, value in pub_socket.codec_stats().items()})
+        return stats
+
+    @staticmethod
+    def _normalize_address(address: int | str) -> str:
+        """Turn a bare TCP port into a localhost address."""
+        return f"tcp://localhost:{address}" if isinstance(address, int) else address
+
+    def add_publisher(self, address: int | str, codec: str | BaseCodec | None = None) -> None:
+        """Connect an output to the mailbox.
+
+        Args:
+        ----
+            address (int | str): Consume address of the receiving mailbox, or its TCP port on localhost.
+            codec (str | BaseCodec | None): Codec for this edge. Defaults to the mailbox codec.
+
+        """
+        address = self._normalize_address(address)
+        codec = CodecFactory.create(codec or self.codec)
+        pub_socket = self._publishers.get(codec.tag)
+        if pub_socket is None:
+            pub_socket = self._publishers[codec.tag] = AsyncZeroQueue(
+                mode=ZeroQueueMode.PUB, address=address, codec=codec, context=self.context
+            )
+        else:
+            pub_socket.connect(address)
+        self.pub_sockets[address] = pub_socket
+        self.logger.debug(f"[{self.name}][Added publisher] → {address}")
+
+    def remove_publisher(self, address: int | str) -> None:
+        """Remove an output from the mailbox."""
+        address = self._normalize_address(address)
+        rm_pub = self.pub_sockets.pop(address)
+        rm_pub.disconnect(address)
+        if not rm_pub.addresses:
+            rm_pub.stop()
+            del self._publishers[rm_pub.codec.tag]
+        self.logger.debug(f"[{self.name}][Removed publisher] → {address}")
@@ -0,0 +1,113 @@
+"""Credit-based flow control between mailboxes.
+
+PUB/SUB drops messages at the socket high-water mark, so a producer that is
+faster than its consumers never slows down. With flow control a consumer grants
+its producer a window of credits, one per message it may send, and returns
+credits as it reads messages off its socket. A consumer whose buffer is full
+stops reading and stops returning credits, so the producer's ``send`` blocks in
+its CreditGate instead of flooding the socket. Memory per edge is bounded by
+the window and latency stays flat under overload.
+
+Credits travel as ``(key, count)`` messages over a PULL socket bound by the
+producer. ``key`` names the edge: the consumer node id, or the logical id of a
+replicated node, whose replicas share one pool of credits. A consumer grants
+its whole window when it connects, so a restarted consumer restores the
+credits lost with its in-flight messages. Time a producer spends blocked is
+recorded per edge (see ``CreditGate.stats``).
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+
+from neudc.core.communication.zero_queue import ZeroQueue
+
+
+class CreditGate:
+    """Producer side of flow control: wait for credits of every consumer before sending."""
+
+    POLL_INTERVAL = 0.1
+
+    def __init__(self, credit_queue: ZeroQueue) -> None:
+        """Initialize the gate.
+
+        Args:
+        ----
+            credit_queue (ZeroQueue): Queue the consumers send their credits to.
+
+        """
+        self.credit_queue = credit_queue
+        self.credits: dict[str, int] = {}
+        self.blocked_time: dict[str, float] = {}
+        self._interrupted = threading.Event()
+
+    def expect(self, key: str) -> None:
+        """Register a consumer; sends wait until it granted its first credits."""
+        self.credits.setdefault(key, 0)
+        self.blocked_time.setdefault(key, 0.0)
+
+    def _grant(self, message: tuple[str, int]) -> None:
+        key, count = message
+        self.expect(key)
+        self.credits[key] += count
+
+    def _drain(self) -> None:
+        """Apply every credit message that already arrived."""
+        while (message := self.credit_queue.get_nowait()) is not None:
+            self._grant(message)
+
+    def acquire(self, count: int = 1) -> bool:
+        """Wait until every consumer has credit, then spend ``count`` credits of each.
+
+        A batch may overdraw the credits; the next send then waits until they are
+        positive again. Must be called from the sending thread.
+
+        Returns
+        -------
+            bool: False if the wait was cut short by ``interrupt()``.
+
+        """
+        self._drain()
+        last = time.monotonic()
+        while starved := [key for key, credits in self.credits.items() if credits <= 0]:
+            if self._interrupted.is_set():
+                return False
+            message = self.credit_queue.get(timeout=self.POLL_INTERVAL)
+            if message is not None:
+                self._grant(message)
+                self._drain()
+            now = time.monotonic()
+            for key in starved:
+                self.blocked_time[key] += now - last
+            last = now
+        for key in self.credits:
+            self.credits[key] -= count
+        return True
+
+    def interrupt(self) -> None:
+        """Stop waiting for credits, e.g. while the mailbox shuts down."""
+        self._interrupted.set()
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """Credits left and total blocked time in seconds per consumer."""
+        return {
+            key: {"credits": credits, "blocked_s": self.blocked_time[key]} for key, credits in self.credits.items()
+        }
+
+
+@dataclass
+class CreditGrant:
+    """Consumer side of flow control for one producer: credits to return on the next flush."""
+
+    queue: ZeroQueue
+    key: str
+    window: int
+    pending: int = 0
+
+    def flush(self) -> None:
+        """Return the credits of messages read since the last flush."""
+        if self.pending:
+            self.queue.put((self.key, self.pending))
+            self.pending = 0
@@ -0,0 +1,135 @@
+"""Receive-side quality of service for mailboxes.
+
+A mailbox buffers incoming messages until its node asks for them. The drop
+policy decides what happens when the node falls behind and the buffer is full:
+
+- ``fifo``: keep every message; the receiver waits for free space (the old behavior).
+- ``latest_only``: keep only the newest message, overwriting the previous one.
+- ``drop_oldest``: bounded buffer that evicts the oldest message for a new one.
+- ``drop_newest``: bounded buffer that rejects new messages.
+
+With the dropping policies the receiver never blocks, so the end-to-end latency
+of a real-time edge stays flat when a downstream node is slower than its source.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from enum import Enum
+from queue import Empty, Full
+from typing import Any, Callable
+
+
+class DropPolicy(str, Enum):
+    """Enum for mailbox drop policies."""
+
+    FIFO = "fifo"
+    LATEST_ONLY = "latest_only"
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+
+
+class BoundedMessageBuffer:
+    """Thread-safe bounded buffer that applies a drop policy when full."""
+
+    def __init__(
+        self,
+        maxsize: int,
+        policy: str | DropPolicy = DropPolicy.FIFO,
+        on_drop: Callable[[Any], None] | None = None,
+    ) -> None:
+        """Initialize the buffer.
+
+        Args:
+        ----
+            maxsize (int): Buffer capacity. ``latest_only`` always uses a single slot.
+            policy (str | DropPolicy): Behavior when the buffer is full.
+            on_drop (Optional[Callable[[Any], None]]): Called with every dropped message.
+
+        """
+        self.policy = DropPolicy(policy)
+        self.maxsize = 1 if self.policy is DropPolicy.LATEST_ONLY else max(maxsize, 1)
+        self.on_drop = on_drop
+        self.dropped = 0
+        self._wakeups = 0
+        self._items: deque = deque()
+        self._cond = threading.Condition()
+
+    def __len__(self) -> int:
+        """Number of buffered messages."""
+        return len(self._items)
+
+    def full(self) -> bool:
+        """Check whether the buffer is at capacity."""
+        return len(self._items) >= self.maxsize
+
+    def put(self, item: Any, timeout: float | None = None) -> None:
+        """Add a message, dropping one if the policy allows it.
+
+        Raises
+        ------
+            queue.Full: With the ``fifo`` policy, if there is no space within the timeout.
+
+        """
+        dropped = None
+        with self._cond:
+            if len(self._items) >= self.maxsize:
+                if self.policy is DropPolicy.FIFO:
+                    if not self._cond.wait_for(lambda: len(self._items) < self.maxsize, timeout):
+                        raise Full
+                elif self.policy is DropPolicy.DROP_NEWEST:
+                    dropped = item
+                else:
+                    dropped = self._items.popleft()
+            if dropped is not item:
+                self._items.append(item)
+                self._cond.notify_all()
+            if dropped is not None:
+                self.dropped += 1
+        if dropped is not None and self.on_drop is not None:
+            self.on_drop(dropped)
+
+    def get(self, timeout: float | None = None) -> Any:
+        """Remove and return the oldest message.
+
+        Raises
+        ------
+            queue.Empty: If no message arrives within the timeout.
+
+        """
+        with self._cond:
+            wakeups = self._wakeups
+            if not self._cond.wait_for(lambda: self._items or self._wakeups != wakeups, timeout) or not self._items:
+                raise Empty
+            item = self._items.popleft()
+            self._cond.notify_all()
+            return item
+
+    def get_nowait(self) -> Any:
+        """Remove and return the oldest message without waiting."""
+        return self.get(timeout=0)
+
+    def get_many(self, max_items: int, timeout: float | None = None) -> list[Any]:
+        """Remove up to ``max_items`` messages, waiting up to a timeout for the first one."""
+        with self._cond:
+            wakeups = self._wakeups
+            if not self._cond.wait_for(lambda: self._items or self._wakeups != wakeups, timeout):
+                return []
+            items = [self._items.popleft() for _ in range(min(max_items, len(self._items)))]
+            self._cond.notify_all()
+            return items
+
+    def wake(self) -> None:
+        """Make the ``get`` calls that are currently waiting return without a message."""
+        with self._cond:
+            self._wakeups += 1
+            self._cond.notify_all()
+
+    def clear(self) -> list[Any]:
+        """Remove and return all buffered messages."""
+        with self._cond:
+            items = list(self._items)
+            self._items.clear()
+            self._cond.notify_all()
+            return items
@@ -0,0 +1,96 @@
+"""Bounded reorder buffer that restores ``frame_id`` order.
+
+Frames processed by replicated workers arrive out of order. ReorderBuffer holds
+them back until the next expected ``frame_id`` arrives. A gap is skipped when
+more than ``window`` frames wait behind it or the first waiting frame has been
+held for ``timeout`` seconds, so a lost frame cannot stall the stream. Frames
+that arrive after their turn was skipped are dropped and counted in ``late``.
+A ``frame_id`` more than ``window`` below the next expected one is not late but
+a new sequence (e.g. the producer restarted and counts from 0 again): the
+frames held back from the old sequence are released in order and the buffer
+re-anchors on the new ``frame_id``. Resets are counted in ``resets``.
+Messages without a ``frame_id`` attribute pass through unchanged.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import time
+from typing import Any
+
+
+class ReorderBuffer:
+    """Release messages in ascending ``frame_id`` order within a bounded window."""
+
+    def __init__(self, window: int, timeout: float) -> None:
+        """Initialize the buffer.
+
+        Args:
+        ----
+            window (int): Max number of messages held back while waiting for a gap.
+            timeout (float): Max time in seconds a message waits for a gap before it is skipped.
+
+        """
+        self.window = window
+        self.timeout = timeout
+        self.late = 0
+        self.skipped = 0
+        self.resets = 0
+        self._heap: list[tuple[int, int, float, Any]] = []
+        self._counter = itertools.count()
+        self._next: int | None = None
+
+    def __len__(self) -> int:
+        """Number of held-back messages."""
+        return len(self._heap)
+
+    def push_many(self, messages: list[Any]) -> list[Any]:
+        """Add received messages and return the ones that are ready, in order.
+
+        Call it with an empty list to release messages whose gap timed out.
+        """
+        ready = []
+        now = time.monotonic()
+        for message in messages:
+            frame_id = getattr(message, "frame_id", None)
+            if frame_id is None:
+                ready.append(message)
+            elif self._next is not None and frame_id < self._next - self.window:
+                ready.extend(self._reset(frame_id))
+                heapq.heappush(self._heap, (frame_id, next(self._counter), now, message))
+            elif self._next is not None and frame_id < self._next:
+                self.late += 1
+            else:
+                heapq.heappush(self._heap, (frame_id, next(self._counter), now, message))
+        ready.extend(self._release(now))
+        return ready
+
+    def _reset(self, frame_id: int) -> list[Any]:
+        """Start a new sequence at ``frame_id`` and return the held-back messages of the old one, in order."""
+        self.resets += 1
+        held = [message for _, _, _, message in sorted(self._heap, key=lambda item: item[:2])]
+        self._heap.clear()
+        self._next = frame_id
+        return held
+
+    def _gap_expired(self, now: float) -> bool:
+        return len(self._heap) > self.window or now - self._heap[0][2] >= self.timeout
+
+    def _release(self, now: float) -> list[Any]:
+        ready = []
+        while self._heap:
+            frame_id, _, _, message = self._heap[0]
+            if self._next is None or frame_id > self._next:
+                if not self._gap_expired(now):
+                    break
+                if self._next is not None:
+                    self.skipped += frame_id - self._next
+                self._next = frame_id
+            heapq.heappop(self._heap)
+            if frame_id < self._next:
+                self.late += 1  # duplicate frame_id
+                continue
+            ready.append(message)
+            self._next = frame_id + 1
+        return ready
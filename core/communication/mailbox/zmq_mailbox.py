@@ -13,21 +13,121 @@ Typical usage:
         msg = mailbox.receive()
     mailbox.clear()
     mailbox.stop()
+
+With ``shared_memory=True`` the mailbox writes ``message.image`` into a
+shared-memory ring once per send and only publishes a small ``ShmEnvelope``.
+Receivers map the ring and get the image as an in-place view, which stays valid
+until the next ``receive()`` call. A batched ``send`` of a message whose image
+is still such a view copies the image first, since the batch may be flushed
+after the slot was released.
+
+The receiving socket binds to ``endpoints`` (``inproc://``, ``ipc://`` or
+``tcp://`` addresses, see RoutingFactory) and publishers are keyed by the
+address they connect to. Mailboxes joined over ``inproc://`` must share a
+``zmq.Context``. Outputs that use the same codec share one publisher socket, so
+a message routed to several nodes is encoded once per codec, not once per output.
+
+``send_many``/``receive_many`` move several messages per call, and each batch
+travels as one multipart message. With ``batch_size > 1`` plain ``send`` calls
+are buffered and flushed when the batch is full or its oldest message has
+waited ``batch_linger_ms``. A linger thread flushes partial batches on time,
+so a source that never calls ``receive()`` does not hold its last frames back
+until the next send; sends are serialized with it by a lock.
+
+``qos`` sets the drop policy of the receive buffer (see ``qos.DropPolicy``):
+``latest_only`` keeps just the newest message and ``drop_oldest``/``drop_newest``
+bound the buffer to ``message_queue_size``. ``dropped_count`` reports how many
+messages were discarded. Images of dropped shared-memory messages are released
+right away.
+
+With ``receive_mode="direct"`` the mailbox starts no receiver thread: the node
+thread reads the subscriber socket itself inside ``receive()`` and blocks until a
+message arrives, a held-back reordered message times out, or ``stop()`` wakes it through an
+inproc control socket. This removes a thread handoff per message and all idle
+wakeups; the default ``"thread"`` mode keeps receiving while the node is busy.
+A direct-mode mailbox only announces its subscriptions while ``receive()`` runs,
+so senders complete their readiness handshake once the receiving node started.
+
+Replicated nodes receive with ``input_mode=PULL``, and ``add_publisher(...,
+group=...)`` connects all replicas of a node to one PUSH socket, so each message
+goes to a single replica. Shared-memory images are not used on PUSH edges,
+since only one of the replicas would release the slot. ``reorder_window``
+restores ``frame_id`` order of messages coming back from replicas (see
+``reorder.ReorderBuffer``).
+
+``credit_endpoints`` enables credit-based flow control (see ``flow_control``):
+the mailbox binds a credit socket there, stamps outgoing messages with its name
+and ``send`` blocks until every consumer registered with ``expect_credits`` has
+credit left. A consumer grants credits to a producer with
+``add_credit_source`` and returns them as it reads messages, so a consumer
+whose buffer is full slows its producers down instead of losing messages at
+the socket high-water mark. ``flow_stats`` reports credits and blocked time per
+outgoing edge. Once ``interrupt()`` cut a wait for credits short, messages that
+find no credit left are dropped instead of sent past the consumer's window and
+counted in ``pycore_mailbox_unsent_total``.
+
+The mailbox records messages sent and received, its queue depth, drops and the
+time spent blocked on send in the metrics registry, labelled with its name
+(see ``neudc.core.utils.metrics``).
 """
 
 from __future__ import annotations
-from queue import Queue, Empty, Full
+from queue import Empty, Full
+import copy
 import time
 import logging
+import uuid
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
 from typing import Any
 
+import numpy as np
+import zmq
+
+from neudc.core.base.base_codec import BaseCodec, CodecStats
 from neudc.core.base.base_mailbox import BaseMailbox
-from neudc.core.communication.zero_queue import ZeroQueuePub, ZeroQueueSub
+from neudc.core.communication.batching import MessageBatcher
+from neudc.core.communication.codecs import CodecFactory
+from neudc.core.communication.mailbox.flow_control import CreditGate, CreditGrant
+from neudc.core.communication.mailbox.qos import BoundedMessageBuffer, DropPolicy
+from neudc.core.communication.mailbox.reorder import ReorderBuffer
+from neudc.core.communication.shared_memory import SharedFrameRing, SlotRef
+from neudc.core.communication.zero_queue import ZeroQueue, ZeroQueuePub, ZeroQueuePull, ZeroQueuePush, ZeroQueueSub
+from neudc.core.communication.zero_queue.zmq_state import ZeroQueueMode
+from neudc.core.communication.zero_queue.zmq_context import get_context
+from neudc.core.utils.metrics import get_registry
 import threading
 
 
 logging.basicConfig(level=logging.DEBUG)
 
+_EMPTY_IMAGE = np.empty((0,), dtype=np.uint8)
+
+
+class ReceiveMode(str, Enum):
+    """Enum for the way a mailbox reads its subscriber socket."""
+
+    THREAD = "thread"
+    DIRECT = "direct"
+
+
+@dataclass
+class ShmEnvelope:
+    """Message whose image was moved into a shared-memory ring.
+
+    ``readers`` maps the consume address of every receiver to its reference cell in the ring.
+    """
+
+    message: Any
+    ref: SlotRef
+    readers: dict[str, int]
+
+    @property
+    def frame_id(self) -> int | None:
+        """Frame id of the wrapped message, used for reordering."""
+        return getattr(self.message, "frame_id", None)
+
 
 class ZMQMailbox(BaseMailbox[dict]):
     """ZeroMQ-based mailbox implementation."""
@@ -38,88 +138,573 @@ class ZMQMailbox(BaseMailbox[dict]):
         message_queue_size: int = 20,
         logger: logging.Logger | None = None,
         name: str = "ZMQMailbox",
+        shared_memory: bool = False,
+        shm_slots: int = 16,
+        shm_slot_size: int = 3840 * 2160 * 3,
+        shm_max_readers: int = 8,
+        codec: str | BaseCodec | None = None,
+        endpoints: list[str] | None = None,
+        context: zmq.Context | None = None,
+        batch_size: int = 1,
+        batch_linger_ms: float = 5.0,
+        qos: str | DropPolicy = DropPolicy.FIFO,
+        receive_mode: str | ReceiveMode = ReceiveMode.THREAD,
+        input_mode: str | ZeroQueueMode = ZeroQueueMode.SUB,
+        reorder_window: int = 0,
+        reorder_timeout_ms: float = 100.0,
+        credit_endpoints: list[str] | None = None,
     ) -> None:
-        """Initialize the ZeroMQ mailbox."""
+        """Initialize the ZeroMQ mailbox.
+
+        Args:
+        ----
+            message_queue_size (int): Capacity of the receive buffer.
+            logger (Optional[logging.Logger]): Logger for debug messages.
+            name (str): Mailbox name used in logs.
+            shared_memory (bool): Send ``message.image`` through a shared-memory ring.
+            shm_slots (int): Number of ring slots.
+            shm_slot_size (int): Size of a ring slot in bytes. Larger images are sent inline.
+            shm_max_readers (int): Maximum number of receivers sharing the ring.
+            codec (str | BaseCodec | None): Default codec name for outgoing edges. Default is pickle.
+            endpoints (Optional[list[str]]): Addresses to receive on. If None, a random TCP port is bound.
+            context (Optional[zmq.Context]): Context shared by all sockets of the mailbox. Defaults to the process-wide context.
+            batch_size (int): Max messages per outgoing batch. 1 sends every message immediately.
+            batch_linger_ms (float): Max time a buffered outgoing message waits for its batch to fill.
+            qos (str | DropPolicy): Drop policy of the receive buffer: "fifo", "latest_only", "drop_oldest", "drop_newest".
+            receive_mode (str | ReceiveMode): "thread" receives in a background thread, "direct" in ``receive()``.
+            input_mode (str | ZeroQueueMode): SUB receives every message, PULL a share of them (replicas).
+            reorder_window (int): Max messages held back to restore ``frame_id`` order. 0 disables reordering.
+            reorder_timeout_ms (float): Max time a message waits for a missing ``frame_id``.
+            credit_endpoints (Optional[list[str]]): Addresses to receive credits on. If None, sends are not flow controlled.
+
+        """
         self.logger = logger
-        self.pub_sockets: dict[int, ZeroQueuePub] = {}
-        self.sub_queue: ZeroQueueSub = ZeroQueueSub()
+        self.context = context or get_context()
+        self.pub_sockets: dict[str, ZeroQueuePub] = {}
+        self._publishers: dict[tuple[bytes, str | None], ZeroQueue] = {}
+        if ZeroQueueMode(input_mode) == ZeroQueueMode.PULL:
+            self.sub_queue: ZeroQueue = ZeroQueuePull(address=endpoints, context=self.context)
+        else:
+            self.sub_queue = ZeroQueueSub(address=endpoints, context=self.context)
         self.consume_port: int = self.sub_queue.port
-        self._message_queue: Queue = Queue(message_queue_size)
+        self.consume_endpoints: list[str] = list(self.sub_queue.addresses)
+        self._message_queue = BoundedMessageBuffer(message_queue_size, qos, on_drop=self._discard)
         self._running = False
         self._thread = None
         self._join_timeout = 0.5
+        self._poll_timeout = 0.1
         self.name = name
+        self.codec = codec
+        self.shared_memory = shared_memory
+        self.shm_slots = shm_slots
+        self.shm_slot_size = shm_slot_size
+        self.shm_max_readers = shm_max_readers
+        self._ring: SharedFrameRing | None = None
+        self._shm_readers: dict[str, int] = {}
+        self._held_slots: list[tuple[SharedFrameRing, SlotRef, int, np.ndarray]] = []
+        self.batch_size = batch_size
+        self._batcher = MessageBatcher(batch_size, batch_linger_ms / 1000) if batch_size > 1 else None
+        self._send_lock = threading.Condition(threading.RLock())
+        self._linger_thread: threading.Thread | None = None
+        self._reorder = ReorderBuffer(reorder_window, reorder_timeout_ms / 1000) if reorder_window > 0 else None
+        self._reordered: deque = deque()
+        self.receive_mode = ReceiveMode(receive_mode)
+        if self.receive_mode is ReceiveMode.DIRECT:
+            self._init_direct()
+        self._credit_gate: CreditGate | None = None
+        self.credit_endpoints: list[str] = []
+        if credit_endpoints:
+            credit_queue = ZeroQueuePull(address=credit_endpoints, context=self.context)
+            self.credit_endpoints = list(credit_queue.addresses)
+            self._credit_gate = CreditGate(credit_queue)
+        self._credit_grants: dict[bytes, CreditGrant] = {}
 
         if not logger:
             self.logger = logging.getLogger(__name__)
+        self._init_metrics()
         self.start()
     def _receiver_loop(self) -> None:
         """Thread loop for receiving messages from the ZeroMQ subscriber."""
-        _unsent_message: Any = None
+        _unsent_messages: list[Any] = []
         while self._running:
             try:
-                message = self.sub_queue.get(timeout=1)
-                self._message_queue.put(message, timeout=1)
-                if self.logger:
-                    self.logger.debug(f"[{self.name}][RECV] ← message")
+                _unsent_messages = _unsent_messages or self.sub_queue.get_many(timeout=self._poll_timeout)
+                while _unsent_messages:
+                    self._message_queue.put(_unsent_messages[0], timeout=self._poll_timeout)
+                    _unsent_messages.pop(0)
+                    if self.logger:
+                        self.logger.debug(f"[{self.name}][RECV] ← message")
+                self._flush_credits()
             except Empty:
                 continue
             except Full:
-                self.logger.warning("Message queue is full")
-                while self._message_queue.full():
-                    time.sleep(0.01)  # Sleep briefly to avoid busy waiting
-                self._message_queue.put(_unsent_message)
-                self.logger.debug(f"[{self.name}][SENDING] -> unsent message")
+                # fifo policy: retry until the node catches up or the mailbox stops
+                continue
             except Exception as e:
                 if self.logger:
                     self.logger.error(f"Error in receiver loop: {e}")
             
+    def _init_metrics(self) -> None:
+        """Register the mailbox metrics."""
+        registry = get_registry()
+        self.sent = registry.counter("pycore_mailbox_sent_total", "Messages sent to the outputs", node=self.name)
+        self.received = registry.counter("pycore_mailbox_received_total", "Messages handed to the node", node=self.name)
+        self.unsent = registry.counter(
+            "pycore_mailbox_unsent_total", "Messages dropped without credits after interrupt()", node=self.name
+        )
+        registry.gauge("pycore_mailbox_queue_depth", lambda: self.pending, "Received messages waiting for the node", node=self.name)
+        registry.gauge("pycore_mailbox_dropped", lambda: self.dropped_count, "Messages dropped by the QoS policy", node=self.name)
+
+    def _init_direct(self) -> None:
+        """Create the control socket pair and poller used by the direct receive mode."""
+        wake_address = f"inproc://mailbox-wake-{uuid.uuid4().hex}"
+        self._wake_recv = self.context.socket(zmq.PAIR)
+        self._wake_recv.bind(wake_address)
+        self._wake_send = self.context.socket(zmq.PAIR)
+        self._wake_send.connect(wake_address)
+        self._recv_lock = threading.Lock()
+        self._poller = zmq.Poller()
+        self._poller.register(self.sub_queue.socket_sub, zmq.POLLIN)
+        self._poller.register(self._wake_recv, zmq.POLLIN)
+
+    def _linger_loop(self) -> None:
+        """Thread loop flushing a partial send batch once its oldest message waited the linger time."""
+        with self._send_lock:
+            while self._running:
+                time_left = self._batcher.time_left()
+                if time_left is None or time_left > 0:
+                    self._send_lock.wait(time_left)
+                    continue
+                try:
+                    self.send_many(self._batcher.drain())
+                except Exception as e:
+                    if self.logger:
+                        self.logger.error(f"Error flushing batch: {e}")
+
     def start(self) -> None:
-        """Start the receiving thread."""
+        """Start the receiving thread and, with batching, the linger thread."""
         self._running = True
+        if self._batcher is not None:
+            self._linger_thread = threading.Thread(target=self._linger_loop, daemon=True)
+            self._linger_thread.start()
+        if self.receive_mode is ReceiveMode.DIRECT:
+            return
         self._thread = threading.Thread(target=self._receiver_loop, daemon=True)
         self._thread.start()
 
 
     def stop(self) -> None:
         """Stop the mailbox."""
-        self.sub_queue.stop()
-        self._running = False
+        with self._send_lock:
+            self.flush()
+            self._running = False
+            self._send_lock.notify()
+        if self._linger_thread:
+            self._linger_thread.join(timeout=self._join_timeout)
         if self._thread:
             self._thread.join(timeout=self._join_timeout)
-            
-        for pub_socket in self.pub_sockets.values():
+        if self.receive_mode is ReceiveMode.DIRECT:
+            self.interrupt()
+            with self._recv_lock:  # wait until receive() released the sockets
+                self._wake_send.close()
+                self._wake_recv.close()
+        self.sub_queue.stop()
+
+        for pub_socket in self._publishers.values():
             pub_socket.stop()
+        if self._credit_gate is not None:
+            self._credit_gate.credit_queue.stop()
+        for grant in self._credit_grants.values():
+            grant.queue.stop()
+
+        for message in self._message_queue.clear():
+            self._discard(message)
+        self._release_held_slots()
+        if self._ring is not None:
+            self._ring.close()
+            self._ring = None
+
+    def interrupt(self) -> None:
+        """Wake up a waiting ``receive()`` and stop waiting for send credits."""
+        if self._credit_gate is not None:
+            self._credit_gate.interrupt()
+        self._message_queue.wake()
+        if self.receive_mode is ReceiveMode.DIRECT and not self._wake_send.closed:
+            self._wake_send.send(b"")
+
+    def wait_ready(self, timeout: float = 1.0) -> bool:
+        """Wait until the receivers of all outgoing edges are connected.
+
+        Receivers in direct receive mode only subscribe once their node calls ``receive()``.
+        Must be called before the node thread starts sending.
+
+        Args:
+        ----
+            timeout (float): Max time to wait in seconds, shared by all edges.
+
+        Returns:
+        -------
+            bool: True if every edge completed its readiness handshake.
+
+        """
+        deadline = time.monotonic() + timeout
+        ready = [pub_socket.wait_ready(max(deadline - time.monotonic(), 0)) for pub_socket in self._publishers.values()]
+        return all(ready)
+
+    @property
+    def has_outputs(self) -> bool:
+        """Whether the mailbox has at least one publisher."""
+        return bool(self._publishers)
+
+    @property
+    def pending(self) -> int:
+        """Number of received messages not yet taken by ``receive``."""
+        held = len(self._reorder) if self._reorder is not None else 0
+        return len(self._message_queue) + len(self._reordered) + held
+
+    def flush(self, due_only: bool = False) -> None:
+        """Send messages buffered by batching.
+
+        Args:
+        ----
+            due_only (bool): Only flush if the oldest buffered message exceeded the linger time.
+
+        """
+        if self._batcher is None:
+            return
+        with self._send_lock:
+            if len(self._batcher) and (not due_only or self._batcher.due()):
+                self.send_many(self._batcher.drain())
+
+    def send_many(self, messages: list[Any]) -> None:
+        """Send several messages to every output as multipart batches."""
+        if not messages:
+            return
+        with self._send_lock:
+            self._send_many(messages)
+
+    def _send_many(self, messages: list[Any]) -> None:
+        if self._credit_gate is not None and not self._credit_gate.acquire(len(messages)):
+            self._drop_unsent(len(messages))
+            return
+        shared = [self._to_shared_memory(message) for message in messages] if self.shared_memory else messages
+        for pub_socket in self._publishers.values():
+            outgoing = shared if pub_socket.mode == ZeroQueueMode.PUB else messages
+            pub_socket.put_many(outgoing, max_batch_size=max(self.batch_size, 1))
+        if self._publishers:
+            self.sent.inc(len(messages))
+        if self.logger:
+            self.logger.debug(f"[{self.name}][SEND] → batch of {len(messages)}")
+
+    def _drop_unsent(self, count: int) -> None:
+        """Count messages dropped because the wait for credits was interrupted."""
+        self.unsent.inc(count)
+        if self.logger:
+            self.logger.warning(f"[{self.name}][SEND] dropped {count} message(s): no credits left after interrupt()")
 
     def send(self, message: Any) -> None:
         """Send a message to the mailbox."""
-        for pub_socket in self.pub_sockets.values():
+        if self._batcher is not None:
+            with self._send_lock:
+                batch = self._batcher.add(self._detach_held(message))
+                if batch:
+                    self._send_many(batch)
+                elif len(self._batcher) == 1:
+                    self._send_lock.notify()  # the linger thread waits for the new batch
+            return
+        if self._credit_gate is not None and not self._credit_gate.acquire():
+            self._drop_unsent(1)
+            return
+        shared = self._to_shared_memory(message) if self.shared_memory else message
+        for pub_socket in self._publishers.values():
             if self.logger:
                 self.logger.debug(f"[{self.name}][START SENDING] → {time.time()}")
-            pub_socket.put(message)
+            pub_socket.put(shared if pub_socket.mode == ZeroQueueMode.PUB else message)
             if self.logger:
                 self.logger.debug(f"[{self.name}][END SENDING] → {time.time()}")
+        if self._publishers:
+            self.sent.inc()
         if self.logger:
             self.logger.debug(f"[{self.name}][SEND] → {type(message)}")
 
     def receive(self) -> dict:
-        """Receive a message from the mailbox."""
+        """Receive a message from the mailbox.
+
+        Shared-memory images returned by the previous call are released here.
+        """
+        self._release_held_slots()
+        if self.receive_mode is ReceiveMode.DIRECT:
+            self._receive_direct(None)
+        messages = self._take(1, timeout=0 if self.receive_mode is ReceiveMode.DIRECT else 0.1)
+        message = messages[0] if messages else None
+        if message is not None:
+            self.received.inc()
+        if self.logger and message is not None:
+            self.logger.debug(f"[{self.name}][RECV][{time.time()}] ← {type(message)}")
+        if isinstance(message, ShmEnvelope):
+            message = self._from_shared_memory(message)
+        return message
+
+    def receive_many(self, max_items: int, timeout: float = 0.1, linger: float = 0.0) -> list[Any]:
+        """Receive up to ``max_items`` messages, waiting up to a timeout for the first one.
+
+        Args:
+        ----
+            max_items (int): Maximum number of messages to return.
+            timeout (float): Max time in seconds to wait for the first message.
+            linger (float): Max time in seconds to keep collecting after the first message.
+
+        Shared-memory images returned by the previous call are released here.
+        """
+        self._release_held_slots()
+        messages = self._take_within(max_items, timeout)
+        deadline = time.monotonic() + linger
+        while messages and len(messages) < max_items and (remaining := deadline - time.monotonic()) > 0:
+            more = self._take_within(max_items - len(messages), remaining)
+            if not more:
+                break
+            messages.extend(more)
+        self.received.inc(len(messages))
+        if self.logger and messages:
+            self.logger.debug(f"[{self.name}][RECV] ← batch of {len(messages)}")
+        messages = [self._from_shared_memory(m) if isinstance(m, ShmEnvelope) else m for m in messages]
+        return [message for message in messages if message is not None]
+
+    def _take_within(self, max_items: int, timeout: float) -> list[Any]:
+        """Take up to ``max_items`` messages, reading the socket first in direct mode."""
+        if self.receive_mode is ReceiveMode.DIRECT:
+            self._receive_direct(timeout)
+            timeout = 0
+        return self._take(max_items, timeout)
+
+    def _take(self, max_items: int, timeout: float | None) -> list[Any]:
+        """Take up to ``max_items`` messages from the receive buffer, in ``frame_id`` order if reordering."""
+        if self._reorder is None:
+            return self._message_queue.get_many(max_items, timeout=timeout)
+        if not self._reordered:
+            self._reordered.extend(self._reorder.push_many(self._message_queue.get_many(max_items, timeout=timeout)))
+        return [self._reordered.popleft() for _ in range(min(max_items, len(self._reordered)))]
+
+    @property
+    def reorder_stats(self) -> dict[str, int]:
+        """Counters of the reorder buffer: held-back, skipped and late messages and sequence resets."""
+        if self._reorder is None:
+            return {}
+        return {
+            "held": len(self._reorder),
+            "skipped": self._reorder.skipped,
+            "late": self._reorder.late,
+            "resets": self._reorder.resets,
+        }
+
+    def _receive_direct(self, timeout: float | None) -> None:
+        """Read the subscriber socket into the receive buffer from the calling thread.
+
+        Waits for the first message if the buffer is empty, then drains what is
+        already queued on the socket. The wait ends early when a held-back
+        reordered message times out or ``stop()`` is called.
+        """
+        with self._recv_lock:
+            if not self._running:
+                return
+            if not len(self._message_queue) and not self._queue_from_socket():
+                if self._reorder is not None and len(self._reorder):
+                    timeout = self._reorder.timeout if timeout is None else min(timeout, self._reorder.timeout)
+                events = dict(self._poller.poll(None if timeout is None else int(timeout * 1000)))
+                if self._wake_recv in events:
+                    self._wake_recv.recv()
+                    return
+            while self._message_queue.policy is not DropPolicy.FIFO or not self._message_queue.full():
+                if not self._queue_from_socket():
+                    break
+            self._flush_credits()
+
+    def _queue_from_socket(self) -> bool:
+        """Move one message from the subscriber socket into the receive buffer."""
+        message = self.sub_queue.get_nowait()
+        if message is None:
+            return False
+        self._message_queue.put(message, timeout=0)
+        return True
+
+    def expect_credits(self, key: str) -> None:
+        """Make sends wait for credits of a consumer; see ``flow_control.CreditGate``.
+
+        Raises
+        ------
+            ValueError: If the mailbox has no ``credit_endpoints``.
+
+        """
+        if self._credit_gate is None:
+            msg = f"Mailbox {self.name} has no credit endpoints"
+            raise ValueError(msg)
+        self._credit_gate.expect(key)
+        get_registry().gauge(
+            "pycore_mailbox_send_blocked_seconds",
+            lambda: self._credit_gate.blocked_time[key],
+            "Time send() waited for credits of a consumer",
+            node=self.name,
+            edge=key,
+        )
+
+    def add_credit_source(self, source: str, address: str, key: str, window: int) -> None:
+        """Grant credits to a producer and return them as its messages are read. This method is not thread-safe.
+
+        Args:
+        ----
+            source (str): Name of the producing mailbox.
+            address (str): Credit endpoint of the producer.
+            key (str): Edge name the producer knows this mailbox by.
+            window (int): Number of messages the producer may have in flight.
+
+        """
+        grant = CreditGrant(ZeroQueuePush(address=address, context=self.context), key, window, pending=window)
+        grant.flush()
+        self._credit_grants[source.encode()] = grant
+        self.sub_queue.on_receive = self._count_credits
+
+    def _count_credits(self, source: bytes, count: int) -> None:
+        """Note messages read from a flow-controlled producer."""
+        grant = self._credit_grants.get(source)
+        if grant is not None:
+            grant.pending += count
+
+    def _flush_credits(self) -> None:
+        """Return credits for the messages moved into the receive buffer."""
+        for grant in tuple(self._credit_grants.values()):
+            grant.flush()
+
+    @property
+    def flow_stats(self) -> dict[str, dict[str, float]]:
+        """Credits left and time blocked waiting for them per outgoing edge."""
+        return {} if self._credit_gate is None else self._credit_gate.stats()
+
+    def _to_shared_memory(self, message: Any) -> Any:
+        """Move the image of a message into the ring and wrap the rest in an envelope."""
+        image = getattr(message, "image", None)
+        if not isinstance(image, np.ndarray) or not self._shm_readers:
+            return message
+        if self._ring is None:
+            self._ring = SharedFrameRing(self.shm_slots, self.shm_slot_size, self.shm_max_readers)
+        ref = self._ring.write(image, self._shm_readers.values())
+        if ref is None:
+            self.logger.debug(f"[{self.name}][SHM] no free slot for {image.nbytes} bytes, sending inline")
+            return message
+        stub = copy.copy(message)
+        stub.image = _EMPTY_IMAGE
+        return ShmEnvelope(stub, ref, dict(self._shm_readers))
+
+    def _from_shared_memory(self, envelope: ShmEnvelope) -> Any:
+        """Restore a message whose image lives in a shared-memory ring."""
+        ring = SharedFrameRing.attach(envelope.ref.ring)
         try:
-            message = self._message_queue.get(timeout=0.1)
-            if self.logger:
-                self.logger.debug(f"[{self.name}][RECV][{time.time()}] ← {type(message)}")
-        except Empty:
-            message = None
+            image = ring.read(envelope.ref)
+        except ValueError as e:
+            self.logger.error(f"[{self.name}][SHM] {e}")
+            return None
+        reader = self._shm_reader(envelope)
+        if reader is not None:
+            self._held_slots.append((ring, envelope.ref, reader, image))
+        message = envelope.message
+        message.image = image
+        return message
+
+    def _shm_reader(self, envelope: ShmEnvelope) -> int | None:
+        """Reference cell of this mailbox in the envelope's ring."""
+        return next((envelope.readers[ep] for ep in self.consume_endpoints if ep in envelope.readers), None)
+
+    def _discard(self, message: Any) -> None:
+        """Release resources of a message dropped by the receive buffer."""
+        if not isinstance(message, ShmEnvelope):
+            return
+        reader = self._shm_reader(message)
+        if reader is None:
+            return
+        try:
+            SharedFrameRing.attach(message.ref.ring).release(message.ref, reader)
+        except FileNotFoundError:
+            pass  # the sender already removed its ring
+
+    @property
+    def dropped_count(self) -> int:
+        """Number of incoming messages dropped by the QoS policy."""
+        return self._message_queue.dropped
+
+    def _detach_held(self, message: Any) -> Any:
+        """Copy a message whose image is a view into a ring slot that receive() will release."""
+        image = getattr(message, "image", None)
+        if not self._held_slots or not isinstance(image, np.ndarray):
+            return message
+        if not any(np.may_share_memory(image, held) for *_, held in self._held_slots):
+            return message
+        message = copy.copy(message)
+        message.image = image.copy()
         return message
 
-    def add_publisher(self, port: int) -> None:
-        """Connect a publisher to the mailbox. This method is not thread-safe."""
-        self.pub_sockets[port] = ZeroQueuePub(port=port)
+    def _release_held_slots(self) -> None:
+        """Release ring slots held by messages returned from receive()."""
+        for ring, ref, reader, _ in self._held_slots:
+            ring.release(ref, reader)
+        self._held_slots.clear()
+
+    def codec_stats(self) -> dict[str, CodecStats]:
+        """Get encode/decode timings of the codecs used on incoming and outgoing edges."""
+        stats = self.sub_queue.codec_stats()
+        for pub_socket in self._publishers.values():
+            outputs = ",".join(pub_socket.addresses)
+            stats.update({f"{name}->{outputs}": value for name, value in pub_socket.codec_stats().items()})
+        return stats
+
+    @staticmethod
+    def _normalize_address(address: int | str) -> str:
+        """Turn a bare TCP port into a localhost address."""
+        return f"tcp://localhost:{address}" if isinstance(address, int) else address
+
+    def add_publisher(self, address: int | str, codec: str | BaseCodec | None = None, group: str | None = None) -> None:
+        """Connect a publisher to the mailbox. This method is not thread-safe.
+
+        Args:
+        ----
+            address (int | str): Consume address of the receiving mailbox, or its TCP port on localhost.
+            codec (str | BaseCodec | None): Codec for this edge. Defaults to the mailbox codec.
+            group (Optional[str]): Replica group of the receiver. Addresses of one group share a PUSH
+                socket, so every message goes to one of them. If None, every message goes to the address.
+
+        """
+        address = self._normalize_address(address)
+        codec = CodecFactory.create(codec or self.codec)
+        pub_socket = self._publishers.get((codec.tag, group))
+        if pub_socket is None:
+            if group is None:
+                pub_socket = ZeroQueuePub(address=address, codec=codec, context=self.context)
+            else:
+                pub_socket = ZeroQueuePush(address=address, codec=codec, context=self.context)
+            if self._credit_gate is not None:
+                pub_socket.source = self.name.encode()
+            self._publishers[codec.tag, group] = pub_socket
+        else:
+            pub_socket.connect(address)
+        self.pub_sockets[address] = pub_socket
+        if self.shared_memory and group is None:
+            free = sorted(set(range(self.shm_max_readers)) - set(self._shm_readers.values()))
+            if not free:
+                msg = f"Shared memory ring supports at most {self.shm_max_readers} receivers"
+                raise ValueError(msg)
+            self._shm_readers[address] = free[0]
         if self.logger:
-            self.logger.debug(f"[{self.name}][Added publisher] → port:{port}")
+            self.logger.debug(f"[{self.name}][Added publisher] → {address}")
 
-    def remove_publisher(self, port: int) -> None:
+    def remove_publisher(self, address: int | str) -> None:
         """Removes a publisher from the mailbox."""
-        rm_pub = self.pub_sockets.pop(port)
+        address = self._normalize_address(address)
+        rm_pub = self.pub_sockets.pop(address)
+        rm_pub.disconnect(address)
+        if not rm_pub.addresses:
+            rm_pub.stop()
+            key = next(key for key, pub_socket in self._publishers.items() if pub_socket is rm_pub)
+            del self._publishers[key]
+        reader = self._shm_readers.pop(address, None)
+        if reader is not None and self._ring is not None:
+            self._ring.release_reader(reader)
         if self.logger:
             self.logger.debug(f"[{self.name}][Removed publisher] → {rm_pub}")
\ No newline at end of file
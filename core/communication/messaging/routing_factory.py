@@ -10,10 +10,54 @@ The configuration must contain a list of node configurations.
 Each node configuration must contain an "id" parameter.
 The "outputs" parameter is optional and contains a list of target node_ids
 that the node should send messages to.
+Keys listed in RoutingFactory.MAILBOX_OPTIONS (e.g. "shared_memory", "codec") are
+passed to the node's mailbox. The optional "codecs" parameter maps target node_ids
+to the codec used on that edge, e.g. {"detector": "msgpack"}. "qos" sets the
+drop policy for messages arriving at a node, e.g. "latest_only" for live video.
+Nodes with "async": true get an AsyncZMQMailbox for use with BaseAsyncNode;
+only "codec" applies to them.
+
+"replicas": N runs N copies of a node with ids "<id>#0" ... "<id>#N-1". Senders
+distribute messages across the replicas (PUSH/PULL) instead of broadcasting.
+With "ordered": true the nodes downstream of the replicas restore frame_id
+order with a reorder buffer of "reorder_window" messages (default 32).
+
+"credit_window": N on a node (or at the top level, for every node) turns on
+credit-based flow control for the edges into it: each upstream node may have at
+most N messages in flight to it and blocks in send() until the node catches up
+(see flow_control). Credits use a separate channel bound next to the data
+endpoints; on other hosts the producing node must set a fixed "credit_port".
+Flow control applies to edges between non-async nodes only.
+
+Every edge uses the cheapest transport the placement of its nodes allows:
+    - inproc:// when both nodes have the same "host" and "process"
+    - ipc:// when both nodes have the same "host" (tcp:// on Windows)
+    - tcp:// when the nodes run on different hosts
+"host" defaults to "localhost" and "process" defaults to "main", or to the node
+id with the top-level "execution": "process" (one process per node, see
+ProcessSupervisor). Only nodes on the local host get mailboxes; nodes on other
+hosts must set a fixed "port". ipc:// endpoints are socket files in the temp
+directory named after the namespace and node id; ids too long for a socket
+path are replaced by a digest.
+
+All mailboxes share the process-wide ZeroMQ context. The optional top-level
+"io_threads" key sets its number of I/O threads.
 """
 
+import hashlib
+import os
+import socket
+import sys
+import tempfile
+import uuid
+from typing import Any, Dict, Iterable
+
+import zmq
+
+from neudc.core.communication.mailbox.async_zmq_mailbox import AsyncZMQMailbox
 from neudc.core.communication.mailbox.zmq_mailbox import ZMQMailbox
-from typing import Dict
+from neudc.core.communication.zero_queue.zmq_context import configure_context, get_context
+from neudc.core.communication.zero_queue.zmq_state import ZeroQueueMode
 
 
 class RoutingFactory:
@@ -21,29 +65,263 @@ class RoutingFactory:
     Factory responsible for creating and wiring mailboxes for nodes.
     """
 
-    def __init__(self, config: dict):
+    MAILBOX_OPTIONS = (
+        "message_queue_size",
+        "codec",
+        "shared_memory",
+        "shm_slots",
+        "shm_slot_size",
+        "shm_max_readers",
+        "batch_size",
+        "batch_linger_ms",
+        "qos",
+        "receive_mode",
+        "input_mode",
+        "reorder_window",
+        "reorder_timeout_ms",
+    )
+    ASYNC_MAILBOX_OPTIONS = ("codec",)
+    DEFAULT_HOST = "localhost"
+    DEFAULT_PROCESS = "main"
+    LOCAL_HOSTS = frozenset({"localhost", "127.0.0.1", socket.gethostname()})
+    REPLICA_SEPARATOR = "#"
+    DEFAULT_REORDER_WINDOW = 32
+    IPC_PATH_MAX = 107  # sun_path holds 108 bytes including the terminating NUL
+
+    def __init__(self, config: dict, context: zmq.Context | None = None):
+        """
+        Args:
+            config (dict): Pipeline configuration with a "nodes" list.
+            context (zmq.Context | None): Context shared by all mailboxes. Defaults to the process-wide context.
+        """
         self.config = config
+        if context is None and "io_threads" in config:
+            configure_context(config["io_threads"])
+        self.context = context or get_context()
+        self.namespace = config.get("namespace") or uuid.uuid4().hex[:8]
+        self.replicas: Dict[str, list[str]] = {}
+        self.nodes: Dict[str, dict] = self._expand_replicas(config["nodes"])
+
+    def _expand_replicas(self, node_cfgs: list[dict]) -> Dict[str, dict]:
+        """Turn every node with "replicas" into one config per replica."""
+        nodes: Dict[str, dict] = {}
+        for node_cfg in node_cfgs:
+            node_id = node_cfg["id"]
+            count = node_cfg.get("replicas", 1)
+            if count <= 1:
+                nodes[node_id] = node_cfg
+                self.replicas[node_id] = [node_id]
+                continue
+            if node_cfg.get("async"):
+                raise ValueError(f"Async node {node_id} cannot have replicas")
+            self.replicas[node_id] = [f"{node_id}{self.REPLICA_SEPARATOR}{i}" for i in range(count)]
+            for replica_id in self.replicas[node_id]:
+                nodes[replica_id] = {**node_cfg, "id": replica_id, "replica_of": node_id, "input_mode": ZeroQueueMode.PULL}
+
+        # Restore frame order behind replicated nodes
+        for node_cfg in node_cfgs:
+            if node_cfg.get("replicas", 1) <= 1 or not node_cfg.get("ordered"):
+                continue
+            window = node_cfg.get("reorder_window", self.DEFAULT_REORDER_WINDOW)
+            for target in node_cfg.get("outputs", []):
+                for target_id in self.replicas[target]:
+                    nodes[target_id] = {"reorder_window": window, **nodes[target_id]}
+        return nodes
+
+    @staticmethod
+    def _mailbox_options(node_cfg: dict) -> Dict[str, Any]:
+        """Pick mailbox keyword arguments from a node config."""
+        options = RoutingFactory.ASYNC_MAILBOX_OPTIONS if node_cfg.get("async") else RoutingFactory.MAILBOX_OPTIONS
+        return {key: node_cfg[key] for key in options if key in node_cfg}
+
+    def _host(self, node_cfg: dict) -> str:
+        host = node_cfg.get("host", self.DEFAULT_HOST)
+        return self.DEFAULT_HOST if host in self.LOCAL_HOSTS else host
+
+    def _process(self, node_cfg: dict) -> str:
+        default = node_cfg["id"] if self.config.get("execution") == "process" else self.DEFAULT_PROCESS
+        return node_cfg.get("process", default)
+
+    def process_groups(self) -> Dict[str, list[str]]:
+        """Group the ids of local nodes by the process they run in."""
+        groups: Dict[str, list[str]] = {}
+        for node_id, node_cfg in self.nodes.items():
+            if self.is_local(node_id):
+                groups.setdefault(self._process(node_cfg), []).append(node_id)
+        return groups
+
+    def topological_order(self, node_ids: Iterable[str] | None = None) -> list[str]:
+        """
+        Order nodes so that every node comes before the nodes it sends to.
+
+        Nodes on a cycle keep their config order after the acyclic part.
 
-    def create_mailboxes(self) -> Dict[str, ZMQMailbox]:
+        Args:
+            node_ids (Iterable[str] | None): Nodes to order, edges to other nodes are ignored. Defaults to every node.
+        """
+        selected = set(self.nodes if node_ids is None else node_ids)
+        node_ids = [node_id for node_id in self.nodes if node_id in selected]
+        targets = {
+            node_id: [
+                target_id
+                for target in self.nodes[node_id].get("outputs", [])
+                for target_id in self.replicas[target]
+                if target_id in selected
+            ]
+            for node_id in node_ids
+        }
+        inbound = {node_id: 0 for node_id in node_ids}
+        for node_targets in targets.values():
+            for target_id in node_targets:
+                inbound[target_id] += 1
+        order = [node_id for node_id in node_ids if inbound[node_id] == 0]
+        for node_id in order:  # the list grows while it is walked
+            for target_id in targets[node_id]:
+                inbound[target_id] -= 1
+                if inbound[target_id] == 0:
+                    order.append(target_id)
+        return order + [node_id for node_id in node_ids if node_id not in order]
+
+    def is_local(self, node_id: str) -> bool:
+        """Check whether a node runs on this host."""
+        return self._host(self.nodes[node_id]) == self.DEFAULT_HOST
+
+    def transport(self, source_id: str, target_id: str) -> str:
+        """
+        Choose the transport for an edge based on node placement.
+
+        Returns:
+            str: "inproc", "ipc" or "tcp".
+        """
+        source, target = self.nodes[source_id], self.nodes[target_id]
+        if self._host(source) != self._host(target):
+            return "tcp"
+        if self._process(source) == self._process(target):
+            return "inproc"
+        return "tcp" if sys.platform == "win32" else "ipc"
+
+    def _bind_endpoint(self, node_id: str, transport: str, channel: str = "") -> str:
+        """Address a node's mailbox binds for the given transport, e.g. on the "credit" channel."""
+        if transport == "inproc":
+            return f"inproc://{self.namespace}/{node_id}" + (f"/{channel}" if channel else "")
+        if transport == "ipc":
+            name = f"{node_id}-{channel}" if channel else node_id
+            path = os.path.join(tempfile.gettempdir(), f"pycore-{self.namespace}-{name}.ipc")
+            if len(path.encode()) > self.IPC_PATH_MAX:
+                # Long node ids: a digest keeps the path short and the same in every process.
+                digest = hashlib.sha1(name.encode()).hexdigest()[:16]
+                path = os.path.join(tempfile.gettempdir(), f"pycore-{self.namespace}-{digest}.ipc")
+            if len(path.encode()) > self.IPC_PATH_MAX:
+                raise ValueError(f"ipc:// path {path} is longer than {self.IPC_PATH_MAX} bytes; set a shorter TMPDIR")
+            return f"ipc://{path}"
+        return f"tcp://*:{self.nodes[node_id].get(self._port_key(channel), '*')}"
+
+    @staticmethod
+    def _port_key(channel: str) -> str:
+        return f"{channel}_port" if channel else "port"
+
+    def _connect_endpoint(
+        self, target_id: str, transport: str, mailboxes: Dict[str, ZMQMailbox | AsyncZMQMailbox], channel: str = ""
+    ) -> str:
+        """Address a publisher connects to for reaching a node."""
+        if target_id in mailboxes:
+            prefix = f"{transport}://"
+            endpoints = mailboxes[target_id].credit_endpoints if channel else mailboxes[target_id].consume_endpoints
+            return next(ep for ep in endpoints if ep.startswith(prefix))
+        if transport == "ipc":
+            # Built by another process of this pipeline; ipc paths only depend on the namespace.
+            return self._bind_endpoint(target_id, transport, channel)
+        target = self.nodes[target_id]
+        port_key = self._port_key(channel)
+        if port_key not in target:
+            raise ValueError(f"Node {target_id} on host {self._host(target)} needs a fixed '{port_key}'")
+        return f"tcp://{self._host(target)}:{target[port_key]}"
+
+    def credit_window(self, node_id: str) -> int:
+        """Credits a node grants each upstream node; 0 if its inbound edges are not flow controlled."""
+        node_cfg = self.nodes[node_id]
+        if node_cfg.get("async"):
+            return 0
+        return node_cfg.get("credit_window", self.config.get("credit_window", 0))
+
+    def _credit_targets(self, node_id: str) -> list[str]:
+        """Ids of the flow-controlled nodes a node sends to."""
+        if self.nodes[node_id].get("async"):
+            return []
+        return [
+            target_id
+            for target in self.nodes[node_id].get("outputs", [])
+            for target_id in self.replicas[target]
+            if self.credit_window(target_id)
+        ]
+
+    def upstream(self, node_id: str) -> list[str]:
+        """Ids of the nodes that send to a node."""
+        logical_id = self.nodes[node_id].get("replica_of", node_id)
+        return [source_id for source_id, source_cfg in self.nodes.items() if logical_id in source_cfg.get("outputs", [])]
+
+    def inbound_transports(self, node_id: str) -> list[str]:
+        """Transports used by the edges that end at a node."""
+        return sorted({self.transport(source_id, node_id) for source_id in self.upstream(node_id)})
+
+    def create_mailboxes(self, node_ids: Iterable[str] | None = None) -> Dict[str, ZMQMailbox | AsyncZMQMailbox]:
         """
         Create mailboxes for all nodes and wire their output queues.
 
+        Args:
+            node_ids (Iterable[str] | None): Only create mailboxes for these nodes, e.g. the nodes
+                of one worker process. Defaults to all local nodes.
+
         Returns:
-            Dict[str, ZMQMailbox]: Mapping of node_id to its ZMQMailbox instance.
+            Dict[str, ZMQMailbox | AsyncZMQMailbox]: Mapping of node_id to its ZMQMailbox (or AsyncZMQMailbox) instance.
         """
-        mailboxes: Dict[str, ZMQMailbox] = {}
+        mailboxes: Dict[str, ZMQMailbox | AsyncZMQMailbox] = {}
 
-        # 1. Create mailbox for every node
-        for node_cfg in self.config["nodes"]:
-            node_id = node_cfg["id"]
-            mailboxes[node_id] = ZMQMailbox(name=node_id)
+        # 1. Create mailbox for every local node, bound on every transport its inputs use
+        selected = set(self.nodes if node_ids is None else node_ids)
+        for node_id, node_cfg in self.nodes.items():
+            if not self.is_local(node_id) or node_id not in selected:
+                continue
+            transports = self.inbound_transports(node_id) or ["inproc"]
+            options = self._mailbox_options(node_cfg)
+            credit_transports = sorted({self.transport(node_id, target_id) for target_id in self._credit_targets(node_id)})
+            if credit_transports:
+                options["credit_endpoints"] = [self._bind_endpoint(node_id, transport, "credit") for transport in credit_transports]
+            mailbox_class = AsyncZMQMailbox if node_cfg.get("async") else ZMQMailbox
+            mailboxes[node_id] = mailbox_class(
+                name=node_id,
+                endpoints=[self._bind_endpoint(node_id, transport) for transport in transports],
+                context=self.context,
+                **options,
+            )
 
         # 2. Wire output connections
-        for node_cfg in self.config["nodes"]:
-            node_id = node_cfg["id"]
+        for node_id in mailboxes:
+            node_cfg = self.nodes[node_id]
             outputs = node_cfg.get("outputs", [])
-            for target_node_id in outputs:
-                pub_port = mailboxes[target_node_id].consume_port
-                mailboxes[node_id].add_publisher(pub_port)
+            codecs = node_cfg.get("codecs", {})
+            for target in outputs:
+                group = target if len(self.replicas[target]) > 1 else None
+                for target_node_id in self.replicas[target]:
+                    address = self._connect_endpoint(target_node_id, self.transport(node_id, target_node_id), mailboxes)
+                    if group is None:
+                        mailboxes[node_id].add_publisher(address, codec=codecs.get(target))
+                    else:
+                        mailboxes[node_id].add_publisher(address, codec=codecs.get(target), group=group)
+            for target_id in self._credit_targets(node_id):
+                mailboxes[node_id].expect_credits(self.nodes[target_id].get("replica_of", target_id))
+
+        # 3. Grant credits to the upstream nodes of flow-controlled nodes
+        for node_id in mailboxes:
+            window = self.credit_window(node_id)
+            if not window:
+                continue
+            key = self.nodes[node_id].get("replica_of", node_id)
+            for source_id in self.upstream(node_id):
+                if self.nodes[source_id].get("async"):
+                    continue
+                transport = self.transport(source_id, node_id)
+                address = self._connect_endpoint(source_id, transport, mailboxes, "credit")
+                mailboxes[node_id].add_credit_source(source_id, address, key, window)
 
         return mailboxes
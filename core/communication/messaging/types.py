@@ -92,13 +92,22 @@ class Keypoints(BaseModel):
 
 
 class Frame(BaseModel):
-    """Frame with image, timestamp, and boxes."""
+    """Frame with image, timestamp, and boxes.
+
+    ``trace`` is only set on sampled frames: one ``(node id, start, end)`` hop per
+    node, with wall-clock process() times (see ``neudc.core.utils.tracing``).
+    ``deadline`` (wall-clock seconds) gives a frame an end-to-end budget: every
+    node skips the frame once it has passed. Sources set it from their
+    ``deadline_ms`` option (see ``BaseNode``).
+    """
 
     image: np.ndarray
     timestamp: float
     source_frame: str
     frame_id: int
     boxes: list[Box]
+    trace: list[tuple[str, float, float]] | None = None
+    deadline: float | None = None
 
     class Config:
         """Pydantic config for Frame class."""
@@ -0,0 +1,9 @@
+"""Shared-memory transport primitives for nodes running on the same host.
+
+Large arrays are written once into a shared-memory ring and only small slot
+references are sent through ZeroMQ.
+"""
+
+from neudc.core.communication.shared_memory.ring_buffer import SharedFrameRing, SlotRef
+
+__all__ = ["SharedFrameRing", "SlotRef"]
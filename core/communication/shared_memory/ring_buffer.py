@@ -0,0 +1,213 @@
+"""Shared-memory ring of fixed-size frame slots.
+
+A ``SharedFrameRing`` owns a ``multiprocessing.shared_memory`` block split into
+``slot_count`` slots of ``slot_size`` bytes. The producer copies an array into a
+free slot once and only a small ``SlotRef`` (slot index, generation counter,
+shape and dtype) travels over ZeroMQ. Consumers map the same block and read the
+array in place.
+
+Memory layout::
+
+    [geometry: int64 x 4][generations: int64 x slots][readers: uint8 x slots x max_readers][slot data]
+
+Slots are reference counted with one cell per reader: the producer sets the
+cells of every reader it publishes to, and each reader clears only its own cell
+on release. Every cell has a single writer at a time, so no cross-process lock
+is needed. A slot is reused only when all of its cells are clear.
+"""
+
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Iterable
+
+import numpy as np
+
+_ALIGNMENT = 64
+_GEOMETRY_FIELDS = 4
+_MAGIC = 0x70_79_63_6F_72_65  # "pycore"
+
+# Rings created or attached by this process, keyed by shared memory name.
+_LOCAL_RINGS: dict[str, SharedFrameRing] = {}
+
+
+def _align(value: int) -> int:
+    return (value + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+@dataclass(frozen=True)
+class SlotRef:
+    """Reference to an array stored in a ring slot."""
+
+    ring: str
+    slot: int
+    generation: int
+    shape: tuple[int, ...]
+    dtype: str
+
+
+class SharedFrameRing:
+    """Ring buffer of fixed-size slots in shared memory."""
+
+    def __init__(
+        self,
+        slot_count: int = 16,
+        slot_size: int = 3840 * 2160 * 3,
+        max_readers: int = 8,
+        name: str | None = None,
+    ) -> None:
+        """Create a new ring.
+
+        Args:
+        ----
+            slot_count (int): Number of frame slots.
+            slot_size (int): Capacity of a slot in bytes. Larger arrays are rejected.
+            max_readers (int): Maximum number of consumers that may hold a slot.
+            name (Optional[str]): Shared memory name. If None, a random name is chosen.
+
+        """
+        data_offset = _align(8 * (_GEOMETRY_FIELDS + slot_count) + slot_count * max_readers)
+        self._shm = SharedMemory(name=name, create=True, size=data_offset + slot_count * _align(slot_size))
+        self._owner = True
+        self._map_layout(slot_count, _align(slot_size), max_readers)
+        self._geometry[:] = (_MAGIC, slot_count, self.slot_size, max_readers)
+        self._generations[:] = 0
+        self._readers[:] = 0
+        self._cursor = 0
+        _LOCAL_RINGS[self.name] = self
+
+    @classmethod
+    def attach(cls, name: str) -> SharedFrameRing:
+        """Map an existing ring created by another mailbox.
+
+        Args:
+        ----
+            name (str): Shared memory name of the ring.
+
+        Returns:
+        -------
+            SharedFrameRing: Ring bound to the existing block. Rings already mapped
+            by this process are reused.
+
+        """
+        if name in _LOCAL_RINGS:
+            return _LOCAL_RINGS[name]
+        ring = cls.__new__(cls)
+        ring._shm = SharedMemory(name=name)
+        if sys.version_info < (3, 13):
+            # Only the creating process may unlink the block on exit.
+            resource_tracker.unregister(ring._shm._name, "shared_memory")  # type: ignore[attr-defined]
+        ring._owner = False
+        geometry = np.ndarray((_GEOMETRY_FIELDS,), dtype=np.int64, buffer=ring._shm.buf)
+        if geometry[0] != _MAGIC:
+            ring._shm.close()
+            msg = f"Shared memory block {name} is not a frame ring"
+            raise ValueError(msg)
+        ring._map_layout(int(geometry[1]), int(geometry[2]), int(geometry[3]))
+        ring._cursor = 0
+        _LOCAL_RINGS[name] = ring
+        return ring
+
+    def _map_layout(self, slot_count: int, slot_size: int, max_readers: int) -> None:
+        """Create numpy views over the header and data regions."""
+        self.closed = False
+        self.slot_count = slot_count
+        self.slot_size = slot_size
+        self.max_readers = max_readers
+        buf = self._shm.buf
+        offset = 8 * _GEOMETRY_FIELDS
+        self._geometry = np.ndarray((_GEOMETRY_FIELDS,), dtype=np.int64, buffer=buf)
+        self._generations = np.ndarray((slot_count,), dtype=np.int64, buffer=buf, offset=offset)
+        offset += 8 * slot_count
+        self._readers = np.ndarray((slot_count, max_readers), dtype=np.uint8, buffer=buf, offset=offset)
+        self._data_offset = _align(offset + slot_count * max_readers)
+
+    def __str__(self) -> str:
+        """Magic methods for string representation of ring."""
+        return f"{self.__class__.__name__}(name={self.name}, slots={self.slot_count}, slot_size={self.slot_size})"
+
+    @property
+    def name(self) -> str:
+        """Get the shared memory name."""
+        return self._shm.name
+
+    def _slot_view(self, slot: int, shape: tuple[int, ...], dtype: np.dtype) -> np.ndarray:
+        offset = self._data_offset + slot * self.slot_size
+        return np.ndarray(shape, dtype=dtype, buffer=self._shm.buf, offset=offset)
+
+    def write(self, array: np.ndarray, readers: Iterable[int]) -> SlotRef | None:
+        """Copy an array into a free slot and mark it as held by the given readers.
+
+        Args:
+        ----
+            array (np.ndarray): Array to store.
+            readers (Iterable[int]): Reader cells that must release the slot.
+
+        Returns:
+        -------
+            Optional[SlotRef]: Reference to the slot, or None if the array does not
+            fit into a slot or every slot is still held.
+
+        """
+        if array.nbytes > self.slot_size:
+            return None
+        for step in range(self.slot_count):
+            slot = (self._cursor + step) % self.slot_count
+            if not self._readers[slot].any():
+                break
+        else:
+            return None
+        self._cursor = (slot + 1) % self.slot_count
+
+        np.copyto(self._slot_view(slot, array.shape, array.dtype), array, casting="no")
+        self._generations[slot] += 1
+        for reader in readers:
+            self._readers[slot, reader] = 1
+        return SlotRef(self.name, slot, int(self._generations[slot]), tuple(array.shape), array.dtype.str)
+
+    def read(self, ref: SlotRef) -> np.ndarray:
+        """Return a view of the array stored in a slot.
+
+        Raises
+        ------
+            ValueError: If the slot was reused after the reference was created.
+
+        """
+        if self._generations[ref.slot] != ref.generation:
+            msg = f"Slot {ref.slot} of {self.name} was overwritten"
+            raise ValueError(msg)
+        return self._slot_view(ref.slot, ref.shape, np.dtype(ref.dtype))
+
+    def release(self, ref: SlotRef, reader: int) -> None:
+        """Drop the hold of a reader on a slot. No-op once the ring is closed."""
+        if self.closed:
+            return
+        self._readers[ref.slot, reader] = 0
+
+    def release_reader(self, reader: int) -> None:
+        """Drop every hold of a reader that was disconnected."""
+        if self.closed:
+            return
+        self._readers[:, reader] = 0
+
+    def free_slots(self) -> int:
+        """Return the number of slots not held by any reader."""
+        return int(self.slot_count - np.count_nonzero(self._readers.any(axis=1)))
+
+    def close(self) -> None:
+        """Unmap the ring and unlink it if this process created it."""
+        if self.closed:
+            return
+        self.closed = True
+        _LOCAL_RINGS.pop(self.name, None)
+        del self._geometry, self._generations, self._readers
+        if self._owner:
+            self._shm.unlink()
+        try:
+            self._shm.close()
+        except BufferError:
+            # Arrays handed out by read() are still alive; the mapping is released with them.
+            pass
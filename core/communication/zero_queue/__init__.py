@@ -4,12 +4,17 @@ This module implements the following classes:
 - ZeroQueue: A PUB/SUB-based queue suitable for message passing between processes on a single machine.
 - ZeroQueueProducer: A message producer that employs the REQ/REP pattern, supporting message buffering and automatic retries.
 - ZeroQueueConsumer: A message consumer based on the REQ/REP pattern for receiving messages from a producer.
+- AsyncZeroQueue: A PUB/SUB queue with awaitable put/get built on zmq.asyncio.
+- ZeroQueuePush/ZeroQueuePull: PUSH/PULL queues that spread messages across worker replicas.
 
 These classes facilitate efficient and reliable messaging for distributed system architectures, enabling asynchronous communication and seamless data transfer.
 """
 
+from neudc.core.communication.zero_queue.async_zero_queue import AsyncZeroQueue
 from neudc.core.communication.zero_queue.zero_pub import ZeroQueuePub
+from neudc.core.communication.zero_queue.zero_pull import ZeroQueuePull
+from neudc.core.communication.zero_queue.zero_push import ZeroQueuePush
 from neudc.core.communication.zero_queue.zero_queue import ZeroQueue
 from neudc.core.communication.zero_queue.zero_sub import ZeroQueueSub
 
-__all__ = ["ZeroQueue", "ZeroQueuePub", "ZeroQueueSub"]
+__all__ = ["AsyncZeroQueue", "ZeroQueue", "ZeroQueuePub", "ZeroQueuePull", "ZeroQueuePush", "ZeroQueueSub"]
@@ -0,0 +1,155 @@
+"""asyncio variant of ZeroQueue built on ``zmq.asyncio``.
+
+AsyncZeroQueue keeps the wire format, endpoints and readiness handshake of
+ZeroQueue, but ``put``/``get`` and friends are coroutines that wait on the
+event loop instead of polling with a timeout. One loop can drive many queues
+without a thread per queue.
+
+The sockets are created from an asyncio shadow of the process-wide context, so
+``inproc://`` endpoints connect asyncio queues with regular ones.
+
+Typical usage:
+    queue = AsyncZeroQueue(mode=ZeroQueueMode.SUB, contype=ZeroQueueConnectionType.BIND, address="inproc://frames")
+    message = await queue.get(timeout=1.0)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from itertools import islice
+from typing import Any, Iterable
+
+import zmq
+import zmq.asyncio
+
+from neudc.core.base.base_codec import BaseCodec
+from neudc.core.communication.zero_queue.serialization import dumps_multipart, loads_multipart
+from neudc.core.communication.zero_queue.zero_queue import ZeroQueue, logger
+from neudc.core.communication.zero_queue.zmq_context import get_context
+from neudc.core.communication.zero_queue.zmq_state import ZeroQueueConnectionType, ZeroQueueMode
+
+
+class AsyncZeroQueue(ZeroQueue):
+    """PUB/SUB queue with awaitable ``put``/``get`` methods."""
+
+    def __init__(
+        self,
+        port: int = -1,
+        mode: ZeroQueueMode = ZeroQueueMode.SUB,
+        contype: ZeroQueueConnectionType = ZeroQueueConnectionType.CONNECT,
+        codec: str | BaseCodec | None = None,
+        address: str | list[str] | None = None,
+        context: zmq.Context | None = None,
+        ready_timeout: float = 1.0,
+    ) -> None:
+        """Initialize the AsyncZeroQueue.
+
+        Args:
+        ----
+            port (Optional[int]): Port for PUB/SUB communication. If None, a random free port is chosen.
+            mode (ZeroQueueMode): Mode of the queue (SUB(subscriber) or PUB(publisher)). Default is SUB.
+            contype (ZeroQueueConnectionType): Connection type (bind or connect). Default is CONNECT.
+            codec (str | BaseCodec | None): Codec for sent messages. Default is pickle.
+            address (str | list[str] | None): Endpoints to bind or connect to. If None, TCP on ``port`` is used.
+            context (Optional[zmq.Context]): Context to shadow. Defaults to the process-wide shared context.
+            ready_timeout (float): Max time in seconds the first put waits for subscribers to connect.
+
+        """
+        super().__init__(
+            port,
+            mode=mode,
+            contype=contype,
+            codec=codec,
+            address=address,
+            context=zmq.asyncio.Context.shadow(context or get_context()),
+            ready_timeout=ready_timeout,
+        )
+
+    async def get(self, timeout: float | None = None) -> Any | None:  # type: ignore[override]
+        """Receive a message, waiting up to a timeout.
+
+        Args:
+        ----
+            timeout (Optional[float]): Timeout in seconds. If None, waits until a message arrives.
+
+        Returns:
+        -------
+            Optional[Any]: Received message, or None if the timeout expired.
+
+        """
+        if not self._pending:
+            try:
+                frames = await asyncio.wait_for(self.socket_sub.recv_multipart(copy=False), timeout)
+            except asyncio.TimeoutError:
+                return None
+            self._pending.extend(loads_multipart(frames, self._decoders))
+        return self._pending.popleft()
+
+    def get_nowait(self) -> Any:
+        """Receive a message without waiting."""
+        if not self._pending:
+            try:
+                frames = self.socket_sub.recv_multipart(zmq.NOBLOCK, copy=False).result()
+            except zmq.Again:
+                return None
+            self._pending.extend(loads_multipart(frames, self._decoders))
+        return self._pending.popleft()
+
+    async def get_many(  # type: ignore[override]
+        self, max_items: int = ZeroQueue.MAX_BATCH_SIZE, timeout: float | None = None
+    ) -> list[Any]:
+        """Receive up to ``max_items`` messages, waiting up to a timeout for the first one."""
+        first = await self.get(timeout)
+        if first is None:
+            return []
+        items = [first]
+        while len(items) < max_items:
+            item = self.get_nowait()
+            if item is None:
+                break
+            items.append(item)
+        return items
+
+    async def wait_ready(self, timeout: float | None = None) -> bool:  # type: ignore[override]
+        """Wait until every subscriber this publisher connects to has subscribed."""
+        if self.mode == ZeroQueueMode.PUSH:
+            self._ready = True
+            return True
+        expected = len(self.addresses) if self.contype == ZeroQueueConnectionType.CONNECT else 1
+        deadline = time.monotonic() + (self.ready_timeout if timeout is None else timeout)
+        while self._subscribers < expected:
+            remaining_ms = max(int((deadline - time.monotonic()) * 1000), 0)
+            if not await self.socket_pub.poll(remaining_ms, zmq.POLLIN):
+                break
+            event = (await self.socket_pub.recv())[:1]
+            if event == b"\x01":
+                self._subscribers += 1
+            elif event == b"\x00":
+                self._subscribers -= 1
+        self._ready = self._subscribers >= expected
+        return self._ready
+
+    async def _handshake(self) -> None:  # type: ignore[override]
+        """Run the one-time readiness handshake before the first message."""
+        if not await self.wait_ready():
+            logger.warning(f"{self} sending before all subscribers are connected")
+        self._ready = True
+
+    async def put(self, item: Any) -> None:  # type: ignore[override]
+        """Send a message."""
+        if not self._ready:
+            await self._handshake()
+        await self.socket_pub.send_multipart(dumps_multipart(item, self.codec), copy=False)
+
+    def put_nowait(self, item: Any) -> None:
+        """Send a message without blocking and without waiting for subscribers."""
+        self.socket_pub.send_multipart(dumps_multipart(item, self.codec), zmq.NOBLOCK, copy=False).result()
+
+    async def put_many(self, items: Iterable[Any], max_batch_size: int | None = None) -> None:  # type: ignore[override]
+        """Send several messages as multipart batches."""
+        if not self._ready:
+            await self._handshake()
+        items = iter(items)
+        while batch := list(islice(items, max_batch_size or self.MAX_BATCH_SIZE)):
+            await self.socket_pub.send_multipart(dumps_multipart(batch, self.codec, batch=True), copy=False)
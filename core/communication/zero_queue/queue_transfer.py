@@ -6,6 +6,12 @@ Includes:
 - ZeroQueue: A publish/subscribe queue for communication on a single machine.
 - ZeroQueueConsumer: A message receiver using the REQ/REP pattern.
 - ZeroQueueProducer: A message producer with message buffering using the REQ/REP pattern.
+
+All classes accept a ``codec`` ("pickle", "msgpack", "raw" or a BaseCodec instance)
+used to encode sent messages. Received messages are decoded by their codec tag.
+``put_many`` sends up to ``MAX_BATCH_SIZE`` messages as one multipart message;
+receivers unpack batches transparently.
+Sockets are created from the process-wide context of ``zmq_context``.
 """
 
 from __future__ import annotations
@@ -13,12 +19,23 @@ from __future__ import annotations
 import queue
 import sys
 from collections import deque
+from itertools import islice
 from multiprocessing.util import register_after_fork
-from typing import Any
+from typing import Any, Iterable
 
 import zmq
 
+from neudc.core.base.base_codec import BaseCodec, CodecStats
 from neudc.core.base.base_queue import QueueLike
+from neudc.core.communication.codecs import CodecFactory
+from neudc.core.communication.zero_queue.serialization import recv_multipart, send_multipart
+from neudc.core.communication.zero_queue.zmq_context import get_context
+
+MAX_BATCH_SIZE = 64
+
+
+class _Batch(list):
+    """Buffered batch of messages sent as one multipart message."""
 
 
 class ZeroQueue(QueueLike):
@@ -27,16 +44,20 @@ class ZeroQueue(QueueLike):
     Suitable for inter-process message passing on a single machine.
     """
 
-    def __init__(self, port: int | None = None) -> None:
+    def __init__(self, port: int | None = None, codec: str | BaseCodec | None = None) -> None:
         """Initialize the ZeroQueue.
 
         Args:
         ----
             port (Optional[int]): Port for PUB/SUB communication. If None, a random free port is chosen.
+            codec (str | BaseCodec | None): Codec for sent messages. Default is pickle.
 
         """
         self.port = port
-        self.context = zmq.Context()
+        self.codec: BaseCodec = CodecFactory.create(codec)
+        self._decoders: dict[bytes, BaseCodec] = {self.codec.tag: self.codec}
+        self._pending: deque = deque()
+        self.context = get_context()
         self.socket_pub = self.context.socket(zmq.PUB)
         if not self.port:
             self.port = self.socket_pub.bind_to_random_port("tcp://*")
@@ -69,6 +90,8 @@ class ZeroQueue(QueueLike):
             Optional[Any]: Received message, or None if timeout expired.
 
         """
+        if self._pending:
+            return self._pending.popleft()
         timeout_millis = int(timeout * 1000) if timeout else None
         if self.socket_sub in dict(self.poller.poll(timeout=timeout_millis)):
             return self.get_nowait()
@@ -76,7 +99,30 @@ class ZeroQueue(QueueLike):
 
     def get_nowait(self) -> Any:
         """Receive a message without waiting."""
-        return self.socket_sub.recv_pyobj(zmq.NOBLOCK)
+        if not self._pending:
+            self._pending.extend(recv_multipart(self.socket_sub, self._decoders, zmq.NOBLOCK))
+        return self._pending.popleft()
+
+    def get_many(self, max_items: int = MAX_BATCH_SIZE, timeout: float | None = None) -> list[Any]:
+        """Receive up to ``max_items`` messages, waiting up to a timeout for the first one.
+
+        Args:
+        ----
+            max_items (int): Maximum number of messages to return.
+            timeout (Optional[float]): Timeout in seconds.
+
+        Returns:
+        -------
+            list[Any]: Received messages; empty if the timeout expired.
+
+        """
+        first = self.get(timeout)
+        if first is None:
+            return []
+        items = [first]
+        while len(items) < max_items and (self._pending or self.socket_sub in dict(self.poller.poll(timeout=0))):
+            items.append(self.get_nowait())
+        return items
 
     def put(self, item: Any) -> None:
         """Send a message.
@@ -86,7 +132,7 @@ class ZeroQueue(QueueLike):
             item (Any): Object to send.
 
         """
-        self.socket_pub.send_pyobj(item)
+        send_multipart(self.socket_pub, item, self.codec)
 
     def put_nowait(self, item: Any) -> None:
         """Send a message without blocking.
@@ -96,7 +142,24 @@ class ZeroQueue(QueueLike):
             item (Any): Object to send.
 
         """
-        self.socket_pub.send_pyobj(item, zmq.NOBLOCK)
+        send_multipart(self.socket_pub, item, self.codec, zmq.NOBLOCK)
+
+    def put_many(self, items: Iterable[Any], max_batch_size: int = MAX_BATCH_SIZE) -> None:
+        """Send several messages as multipart batches.
+
+        Args:
+        ----
+            items (Iterable[Any]): Objects to send, in order.
+            max_batch_size (int): Max messages per batch.
+
+        """
+        items = iter(items)
+        while batch := list(islice(items, max_batch_size)):
+            send_multipart(self.socket_pub, batch, self.codec, batch=True)
+
+    def codec_stats(self) -> dict[str, CodecStats]:
+        """Get encode/decode timings of every codec used by this queue."""
+        return {codec.name: codec.stats for codec in self._decoders.values()}
 
     def _after_fork(self) -> None:
         """Reset sockets after fork (Unix only)."""
@@ -104,6 +167,7 @@ class ZeroQueue(QueueLike):
 
     def _reset(self) -> None:
         """Recreate PUB/SUB sockets."""
+        self.context = get_context()
         self.socket_pub = self.context.socket(zmq.PUB)
         self.socket_pub.connect(f"tcp://*:{self.port}")
 
@@ -112,6 +176,7 @@ class ZeroQueue(QueueLike):
         self.socket_sub.subscribe("")
 
         self.poller = zmq.Poller()
+        self._pending.clear()
 
 
 class ZeroQueueConsumer(QueueLike):
@@ -120,7 +185,7 @@ class ZeroQueueConsumer(QueueLike):
     This class is used to receive messages from a producer.
     """
 
-    def __init__(self, port: int | None = None) -> None:
+    def __init__(self, port: int | None = None, codec: str | BaseCodec | None = None) -> None:
         """Initialize the ZeroQueueConsumer.
 
         This class is used to receive messages from a producer using the REQ/REP pattern.
@@ -128,10 +193,14 @@ class ZeroQueueConsumer(QueueLike):
         Args:
         ----
             port (Optional[int]): Server port. If None, the server creates and binds a socket.
+            codec (str | BaseCodec | None): Expected codec. Messages in other codecs are decoded by tag.
 
         """
         self.port = port
-        self.context = zmq.Context()
+        self.codec: BaseCodec = CodecFactory.create(codec)
+        self._decoders: dict[bytes, BaseCodec] = {self.codec.tag: self.codec}
+        self._pending: deque = deque()
+        self.context = get_context()
         self.socket_sub = self.context.socket(zmq.REP)
         if not self.port:
             self.port = self.socket_sub.bind_to_random_port("tcp://*")
@@ -146,9 +215,12 @@ class ZeroQueueConsumer(QueueLike):
         return f"{self.__class__.__name__}(port={self.port})"
 
     def __del__(self) -> None:
-        """Magic method to remove the socket and context with destructor."""
+        """Magic method to close the socket with destructor."""
         self.socket_sub.close()
-        self.context.term()
+
+    def codec_stats(self) -> dict[str, CodecStats]:
+        """Get decode timings of every codec used by this queue."""
+        return {codec.name: codec.stats for codec in self._decoders.values()}
 
     def get(self, timeout: float | None = None) -> Any | None:
         """Receive a message with a timeout.
@@ -162,12 +234,14 @@ class ZeroQueueConsumer(QueueLike):
             Optional[Any]: Received message, or None if timeout expired.
 
         """
+        if self._pending:
+            return self._pending.popleft()
         if timeout:
             timeout = timeout * 1000
         if self.socket_sub in dict(self.poller.poll(timeout=timeout)):
-            data = self.socket_sub.recv_pyobj(zmq.NOBLOCK)
+            self._pending.extend(recv_multipart(self.socket_sub, self._decoders, zmq.NOBLOCK))
             self.socket_sub.send(b"0", zmq.NOBLOCK)
-            return data
+            return self._pending.popleft()
         return None
 
     def get_nowait(self) -> Any:
@@ -182,16 +256,19 @@ class ZeroQueueConsumer(QueueLike):
             queue.Empty: If no message is available.
 
         """
+        if self._pending:
+            return self._pending.popleft()
         if self.socket_sub in dict(self.poller.poll(timeout=1)):
             # socket is ready — but still might fail, so minimal try block
             try:
-                data = self.socket_sub.recv_pyobj(zmq.NOBLOCK)
+                data = recv_multipart(self.socket_sub, self._decoders, zmq.NOBLOCK)
                 self.socket_sub.send(b"0", zmq.NOBLOCK)
             except zmq.Again as err:  # more specific than ZMQError
                 raise queue.Empty from err
             except zmq.ZMQError as err:
                 raise queue.Empty from err
-            return data
+            self._pending.extend(data)
+            return self._pending.popleft()
         raise queue.Empty
 
     def put(self, item: Any) -> None:
@@ -207,22 +284,30 @@ class ZeroQueueProducer(QueueLike):
     """Message producer using REQ/REP pattern.
 
     Supports message buffering and automatic retries if the connection is lost.
+    Batches from ``put_many`` are buffered and retried as a whole.
     """
 
     DEQUE_LEN = 100
     TIMEOUT_MS = 100
     TMP_N = 40
 
-    def __init__(self, port: int | None = None, deque_len: int | None = None) -> None:
+    def __init__(
+        self,
+        port: int | None = None,
+        deque_len: int | None = None,
+        codec: str | BaseCodec | None = None,
+    ) -> None:
         """Initialize the ZeroQueueProducer.
 
         Args:
         ----
             port (Optional[int]): Port to connect to the Consumer.
             deque_len (Optional[int]): Maximum size of the message buffer.
+            codec (str | BaseCodec | None): Codec for sent messages. Default is pickle.
 
         """
         self.port = port
+        self.codec: BaseCodec = CodecFactory.create(codec)
         self.deque: deque = deque(maxlen=deque_len or self.DEQUE_LEN)
         self.init()
 
@@ -231,8 +316,8 @@ class ZeroQueueProducer(QueueLike):
         return f"{self.__class__.__name__}(port={self.port})"
 
     def init(self) -> None:
-        """Initialize sockets and context."""
-        self.context = zmq.Context()
+        """Initialize sockets."""
+        self.context = get_context()
 
         self.socket_pub = self.context.socket(zmq.REQ)
         self.socket_pub.setsockopt(zmq.LINGER, 0)
@@ -245,13 +330,16 @@ class ZeroQueueProducer(QueueLike):
         self.poller.register(self.socket_pub, zmq.POLLIN)
 
     def __del__(self) -> None:
-        """Magic method to remove the socket and context with destructor."""
+        """Magic method to close the socket with destructor."""
         self.stop()
 
     def stop(self) -> None:
-        """Close sockets and terminate context."""
+        """Close sockets. The shared context stays alive for other queues."""
         self.socket_pub.close()
-        self.context.term()
+
+    def codec_stats(self) -> dict[str, CodecStats]:
+        """Get encode timings of the codec used by this queue."""
+        return {self.codec.name: self.codec.stats}
 
     def _put_from_deque(self, timeout: int = TIMEOUT_MS) -> bool:
         """Try to send the first item from the buffer.
@@ -266,7 +354,7 @@ class ZeroQueueProducer(QueueLike):
 
         """
         _item = self.deque[0]
-        self.socket_pub.send_pyobj(_item)
+        send_multipart(self.socket_pub, _item, self.codec, batch=isinstance(_item, _Batch))
         if self.socket_pub in dict(self.poller.poll(timeout=timeout)):
             self.socket_pub.recv()
             self.deque.popleft()
@@ -291,6 +379,25 @@ class ZeroQueueProducer(QueueLike):
                 # retry once on the fresh connection
                 continue
 
+    def put_many(
+        self,
+        items: Iterable[Any],
+        timeout: float | None = None,
+        max_batch_size: int = MAX_BATCH_SIZE,
+    ) -> None:
+        """Buffer several messages as multipart batches and attempt to send them.
+
+        Args:
+        ----
+            items (Iterable[Any]): The objects to send, in order.
+            timeout (Optional[float]): Max duration to attempt sending each batch (in seconds).
+            max_batch_size (int): Max messages per batch.
+
+        """
+        items = iter(items)
+        while batch := _Batch(islice(items, max_batch_size)):
+            self.put(batch, timeout=timeout)
+
     def put_nowait(self, item: Any) -> None:
         """Send a message immediately without blocking.
 
@@ -303,7 +410,7 @@ class ZeroQueueProducer(QueueLike):
             queue.Full: If sending fails.
 
         """
-        self.socket_pub.send_pyobj(item)
+        send_multipart(self.socket_pub, item, self.codec)
         if self.socket_pub in dict(self.poller.poll(timeout=self.TIMEOUT_MS // 5 + 1)):
             self.socket_pub.recv()
         else:
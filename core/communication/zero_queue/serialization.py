@@ -0,0 +1,93 @@
+"""Multipart framing helpers for ZeroQueue transports.
+
+Every message is sent as ``[codec tag, *codec frames]`` with ``copy=False``, so
+buffers the codec emits out-of-band (``Frame.image``, ``Segmentation.image`` and
+any other numpy array with the default pickle codec) are never copied on send.
+The receiver looks the codec up by its tag and rebuilds arrays as views over the
+received frames.
+
+A batch of messages travels as one multipart message: the codec encodes the
+list of messages and the tag frame gets a ``*`` suffix. Receivers always get a
+list of messages back, with a single element for non-batched sends.
+
+Senders taking part in credit-based flow control append ``@<source>`` to the
+tag frame, so receivers can return credits to the right producer (see
+``message_source``).
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import zmq
+
+from neudc.core.base.base_codec import BaseCodec
+from neudc.core.communication.codecs import CodecFactory
+
+BATCH_FLAG = b"*"
+SOURCE_SEPARATOR = b"@"
+
+
+def dumps_multipart(item: Any, codec: BaseCodec, batch: bool = False, source: bytes = b"") -> list[Any]:
+    """Encode an object into a list of ZeroMQ frames.
+
+    Args:
+    ----
+        item (Any): Object to encode, or a list of objects if ``batch`` is set.
+        codec (BaseCodec): Codec used for encoding.
+        batch (bool): Mark the message as a batch of messages.
+        source (bytes): Name of the sender, added to the tag frame if not empty.
+
+    Returns:
+    -------
+        list[Any]: Codec tag followed by the codec frames. Frames may reference the
+        original memory, so the payload must not be modified until it is sent.
+
+    """
+    tag = codec.tag + BATCH_FLAG if batch else codec.tag
+    if source:
+        tag += SOURCE_SEPARATOR + source
+    return [tag, *codec.encode(list(item) if batch else item)]
+
+
+def loads_multipart(frames: list[zmq.Frame], decoders: dict[bytes, BaseCodec]) -> list[Any]:
+    """Decode an object from frames received with ``copy=False``.
+
+    Args:
+    ----
+        frames (list[zmq.Frame]): Frames produced by ``dumps_multipart``.
+        decoders (dict[bytes, BaseCodec]): Codecs by tag. Missing codecs are created and cached.
+
+    Returns:
+    -------
+        list[Any]: Restored messages; one element unless the sender sent a batch.
+
+    """
+    tag = frames[0].bytes.partition(SOURCE_SEPARATOR)[0]
+    batch = tag.endswith(BATCH_FLAG)
+    if batch:
+        tag = tag[: -len(BATCH_FLAG)]
+    codec = decoders.get(tag)
+    if codec is None:
+        codec = decoders[tag] = CodecFactory.create_from_tag(tag)
+    item = codec.decode([frame.buffer for frame in frames[1:]])
+    if not batch:
+        return [item]
+    return item if isinstance(item, list) else [item]
+
+
+def message_source(frames: list[zmq.Frame]) -> bytes:
+    """Return the sender name of a message, or empty bytes if the sender did not set one."""
+    return frames[0].bytes.partition(SOURCE_SEPARATOR)[2]
+
+
+def send_multipart(
+    socket: zmq.Socket, item: Any, codec: BaseCodec, flags: int = 0, batch: bool = False, source: bytes = b""
+) -> None:
+    """Encode and send an object (or a batch of objects) over a socket without copying its buffers."""
+    socket.send_multipart(dumps_multipart(item, codec, batch, source), flags, copy=False)
+
+
+def recv_multipart(socket: zmq.Socket, decoders: dict[bytes, BaseCodec], flags: int = 0) -> list[Any]:
+    """Receive and decode a message or batch of messages without copying their buffers."""
+    return loads_multipart(socket.recv_multipart(flags, copy=False), decoders)
@@ -3,8 +3,13 @@
 This class extends the ZeroQueue class to publish data to a ZeroQueueSubscriber.
 """
 
+from __future__ import annotations
+
 from typing import NoReturn
 
+import zmq
+
+from neudc.core.base.base_codec import BaseCodec
 from neudc.core.communication.zero_queue.zero_queue import ZeroQueue
 from neudc.core.communication.zero_queue.zmq_state import ZeroQueueConnectionType, ZeroQueueMode
 
@@ -15,16 +20,36 @@ class ZeroQueuePub(ZeroQueue):
     Extends the ZeroQueue class to publish data to a ZeroQueueSubscriber.
     """
 
-    def __init__(self, port=-1, contype=ZeroQueueConnectionType.CONNECT) -> None:
+    def __init__(
+        self,
+        port=-1,
+        contype=ZeroQueueConnectionType.CONNECT,
+        codec: str | BaseCodec | None = None,
+        address: str | list[str] | None = None,
+        context: zmq.Context | None = None,
+        ready_timeout: float = 1.0,
+    ) -> None:
         """Initialize the ZeroQueuePub.
 
         Args:
         ----
             port (Optional[int]): Port for PUB/SUB communication. If None, a random free port is chosen.
             contype (ZeroQueueConnectionType): Connection type (bind or connect). Default is CONNECT.
+            codec (str | BaseCodec | None): Codec for sent messages. Default is pickle.
+            address (str | list[str] | None): Endpoints of the subscribers. If None, TCP on ``port`` is used.
+            context (Optional[zmq.Context]): Context for the socket. Defaults to the process-wide shared context.
+            ready_timeout (float): Max time in seconds the first put waits for the subscriber to connect.
 
         """
-        super().__init__(port, mode=ZeroQueueMode.PUB, contype=contype)
+        super().__init__(
+            port,
+            mode=ZeroQueueMode.PUB,
+            contype=contype,
+            codec=codec,
+            address=address,
+            context=context,
+            ready_timeout=ready_timeout,
+        )
 
     def get(self, timeout=None) -> NoReturn:
         """Protect get method not supported for ZeroQueuePub."""
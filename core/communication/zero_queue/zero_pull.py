@@ -0,0 +1,47 @@
+"""ZeroQueuePull class for receiving a share of the data of ZeroQueuePush queues.
+
+This class extends the ZeroQueue class to receive the messages a ZeroQueuePush
+assigns to this worker.
+"""
+
+from __future__ import annotations
+
+from typing import NoReturn
+
+import zmq
+
+from neudc.core.communication.zero_queue.zero_queue import ZeroQueue
+from neudc.core.communication.zero_queue.zmq_state import ZeroQueueConnectionType, ZeroQueueMode
+
+
+class ZeroQueuePull(ZeroQueue):
+    """Receive the messages a ZeroQueuePush assigns to this worker."""
+
+    def __init__(self, address: str | list[str] | None = None, context: zmq.Context | None = None) -> None:
+        """Initialize the ZeroQueuePull.
+
+        Binds to the given endpoints, or to a random TCP port if none are given.
+
+        Args:
+        ----
+            address (str | list[str] | None): Endpoints to bind. ``tcp://*:*`` picks a random port.
+            context (Optional[zmq.Context]): Context for the socket. Defaults to the process-wide shared context.
+
+        """
+        super().__init__(
+            port=-1,
+            mode=ZeroQueueMode.PULL,
+            contype=ZeroQueueConnectionType.BIND,
+            address=address,
+            context=context,
+        )
+
+    def put(self, item) -> NoReturn:
+        """Protect put method not supported for ZeroQueuePull."""
+        msg = "ZeroQueuePull does not support put() method."
+        raise NotImplementedError(msg)
+
+    def put_nowait(self, item) -> NoReturn:
+        """Protect put_nowait method not supported for ZeroQueuePull."""
+        msg = "ZeroQueuePull does not support put_nowait() method."
+        raise NotImplementedError(msg)
@@ -0,0 +1,55 @@
+"""ZeroQueuePush class for distributing data across ZeroQueuePull workers.
+
+This class extends the ZeroQueue class to send every message to exactly one of
+the connected ZeroQueuePull queues.
+"""
+
+from __future__ import annotations
+
+from typing import NoReturn
+
+import zmq
+
+from neudc.core.base.base_codec import BaseCodec
+from neudc.core.communication.zero_queue.zero_queue import ZeroQueue
+from neudc.core.communication.zero_queue.zmq_state import ZeroQueueConnectionType, ZeroQueueMode
+
+
+class ZeroQueuePush(ZeroQueue):
+    """Distribute data across ZeroQueuePull workers.
+
+    Extends the ZeroQueue class to load-balance messages over the connected pullers.
+    """
+
+    def __init__(
+        self,
+        address: str | list[str],
+        codec: str | BaseCodec | None = None,
+        context: zmq.Context | None = None,
+    ) -> None:
+        """Initialize the ZeroQueuePush.
+
+        Args:
+        ----
+            address (str | list[str]): Endpoints of the pullers to connect to.
+            codec (str | BaseCodec | None): Codec for sent messages. Default is pickle.
+            context (Optional[zmq.Context]): Context for the socket. Defaults to the process-wide shared context.
+
+        """
+        super().__init__(
+            mode=ZeroQueueMode.PUSH,
+            contype=ZeroQueueConnectionType.CONNECT,
+            codec=codec,
+            address=address,
+            context=context,
+        )
+
+    def get(self, timeout=None) -> NoReturn:
+        """Protect get method not supported for ZeroQueuePush."""
+        msg = "ZeroQueuePush does not support get() method."
+        raise NotImplementedError(msg)
+
+    def get_nowait(self) -> NoReturn:
+        """Protect get_nowait method not supported for ZeroQueuePush."""
+        msg = "ZeroQueuePush does not support get_nowait() method."
+        raise NotImplementedError(msg)
@@ -15,16 +15,56 @@ hiding the underlying details of the ZeroMQ library. The interface is
 thread-safe, meaning that multiple threads can call the same methods
 concurrently without worrying about race conditions.
 
+Messages are sent as multipart frames: numpy payloads such as ``Frame.image``
+travel as separate zero-copy frames next to a small codec header (see
+``serialization``). The codec is selected per queue; receivers decode any
+codec by its tag.
+
+Besides a TCP port, a queue can be given explicit endpoint addresses
+(``inproc://``, ``ipc://`` or ``tcp://``). A subscriber may bind several
+endpoints at once, so producers in the same process, on the same host and on
+other hosts can each use the cheapest transport. ``inproc://`` endpoints only
+work between sockets created from the same ``zmq.Context``; by default every
+queue uses the process-wide context from ``zmq_context``, and another one can
+be passed in through ``context``. ZeroMQ leaves the socket file of a bound
+``ipc://`` endpoint behind, so ``stop`` removes the files the queue bound.
+
+Publishers use an XPUB socket in verbose mode: every subscriber announces
+itself with a subscription frame once its connection is up. The first ``put``
+waits for these announcements (see ``wait_ready``), so messages are not lost to
+the PUB/SUB slow-joiner problem and later sends go out without any delay.
+A publisher may be connected to several subscribers (``connect``/``disconnect``);
+each message is then encoded once and fanned out by the socket.
+
+In PUSH/PULL mode a message goes to exactly one of the connected peers (round
+robin, skipping peers whose queue is full), which spreads work across replicas.
+PUSH queues messages until its peers connect, so it needs no handshake.
+
+``put_many`` sends up to ``MAX_BATCH_SIZE`` messages as a single multipart
+message, so per-message poll, syscall and codec overhead is paid once per batch.
+``get``/``get_many`` unpack batches transparently.
+
+For credit-based flow control a publisher stamps its messages with ``source``
+and a receiver reports every message it reads to ``on_receive`` together with
+the source name of its sender.
+
 """
 
 from __future__ import annotations
 
 import logging
+import os
 import time
-from typing import Any
+from collections import deque
+from itertools import islice
+from typing import Any, Callable, Iterable
 
 import zmq
 
+from neudc.core.base.base_codec import BaseCodec, CodecStats
+from neudc.core.communication.codecs import CodecFactory
+from neudc.core.communication.zero_queue.serialization import loads_multipart, message_source, send_multipart
+from neudc.core.communication.zero_queue.zmq_context import get_context
 from neudc.core.communication.zero_queue.zmq_state import ZeroQueueConnectionType, ZeroQueueMode
 
 logger = logging.getLogger(__name__)
@@ -36,12 +76,18 @@ class ZeroQueue:
     Suitable for inter-process message passing on a single machine.
     """
 
+    MAX_BATCH_SIZE = 64
+
     def __init__(
         self,
         port: int = -1,
         mode: ZeroQueueMode = ZeroQueueMode.SUB,
         contype: ZeroQueueConnectionType = ZeroQueueConnectionType.CONNECT,
         queue_size: int = 100,
+        codec: str | BaseCodec | None = None,
+        address: str | list[str] | None = None,
+        context: zmq.Context | None = None,
+        ready_timeout: float = 1.0,
     ) -> None:
         """Initialize the ZeroQueue.
 
@@ -50,16 +96,30 @@ class ZeroQueue:
             port (Optional[int]): Port for PUB/SUB communication. If None, a random free port is chosen.
             mode (ZeroQueueMode): Mode of the queue (SUB(subscriber) or PUB(publisher)). Default is SUB.
             contype (ZeroQueueConnectionType): Connection type (bind or connect). Default is CONNECT.
+            codec (str | BaseCodec | None): Codec for sent messages ("pickle", "msgpack", "raw"). Default is pickle.
+            address (str | list[str] | None): Endpoints to bind or connect to. If None, TCP on ``port`` is used.
+            context (Optional[zmq.Context]): Context for the sockets. Defaults to the process-wide shared context.
+            ready_timeout (float): Max time in seconds the first put waits for subscribers to connect.
 
         """
         self._port: int = port  # type: ignore[assignment]
-        self.context: zmq.Context = zmq.Context()
+        self.addresses: list[str] = [address] if isinstance(address, str) else list(address or [])
+        self.codec: BaseCodec = CodecFactory.create(codec)
+        self._decoders: dict[bytes, BaseCodec] = {self.codec.tag: self.codec}
+        self.context: zmq.Context = context or get_context()
         self.mode: ZeroQueueMode = mode
         self.contype: ZeroQueueConnectionType = contype
-
-        if mode == ZeroQueueMode.SUB:
+        self.ready_timeout = ready_timeout
+        self._ready = False
+        self._subscribers = 0
+        self._pending: deque = deque()
+        self.source: bytes = b""
+        self.on_receive: Callable[[bytes, int], None] | None = None
+        self._ipc_paths: list[str] = []
+
+        if mode in (ZeroQueueMode.SUB, ZeroQueueMode.PULL):
             self._init_sub(contype)
-        elif mode == ZeroQueueMode.PUB:
+        elif mode in (ZeroQueueMode.PUB, ZeroQueueMode.PUSH):
             self._init_pub(contype)
         else:
             msg = f"Invalid mode: {mode}"
@@ -77,10 +137,12 @@ class ZeroQueue:
 
         """
         self.socket_pub: zmq.Context.socket | None = None
-        self.socket_sub: zmq.Context.socket | None = self.context.socket(zmq.SUB)
+        socket_type = zmq.PULL if self.mode == ZeroQueueMode.PULL else zmq.SUB
+        self.socket_sub: zmq.Context.socket | None = self.context.socket(socket_type)
         self.socket_sub.setsockopt(zmq.LINGER, 100)
         self._set_connection(self.socket_sub, contype)
-        self.socket_sub.subscribe("")
+        if socket_type == zmq.SUB:
+            self.socket_sub.subscribe("")
         self.poller = zmq.Poller()
         self.poller.register(self.socket_sub, zmq.POLLIN)
 
@@ -92,8 +154,12 @@ class ZeroQueue:
             contype (ZeroQueueConnectionType): Connection type (bind or connect).
 
         """
-        self.socket_pub: zmq.Context.socket | None = self.context.socket(zmq.PUB)
+        socket_type = zmq.PUSH if self.mode == ZeroQueueMode.PUSH else zmq.XPUB
+        self.socket_pub: zmq.Context.socket | None = self.context.socket(socket_type)
         self.socket_pub.setsockopt(zmq.LINGER, 100)
+        if socket_type == zmq.XPUB:
+            self.socket_pub.setsockopt(zmq.XPUB_VERBOSE, 1)
+            self.socket_pub.setsockopt(zmq.XPUB_VERBOSER, 1)
         self._set_connection(self.socket_pub, contype)
         self.socket_sub: zmq.Context.socket | None = None
 
@@ -107,27 +173,67 @@ class ZeroQueue:
         logger.info(f"ZeroQueue bound to random port {port}")
         return port
 
+    def _bind_address(self, address: str, socket: zmq.Context.socket) -> str:
+        """Bind the socket to an endpoint and return the address peers should connect to."""
+        socket.bind(address)
+        endpoint = socket.getsockopt_string(zmq.LAST_ENDPOINT)
+        if endpoint.startswith("tcp://"):
+            self.port = int(endpoint.rsplit(":", 1)[1])
+            endpoint = f"tcp://localhost:{self.port}"
+        elif endpoint.startswith("ipc://"):
+            self._ipc_paths.append(endpoint[len("ipc://") :])
+        logger.info(f"ZeroQueue bound to {endpoint}")
+        return endpoint
+
     def _set_connection(self, socket: zmq.Context.socket, contype: ZeroQueueConnectionType) -> None:
         """Set the connection type for the socket.
 
         Sets the connection type for the socket based on the provided
         connection type. If the connection type is CONNECT, the socket
-        connects to the specified port. If the connection type is BIND,
-        the socket binds to a random port.
+        connects to the specified addresses or port. If the connection type
+        is BIND, the socket binds to the specified addresses or to a port.
         """
         if contype == ZeroQueueConnectionType.CONNECT:
-            if self.port != -1:
+            if self.addresses:
+                for address in self.addresses:
+                    socket.connect(address)
+                    logger.debug(f"ZeroQueue connected to {address}")
+            elif self.port != -1:
                 socket.connect(f"tcp://localhost:{self.port}")
                 logger.debug(f"ZeroQueue connected to port {self.port}")
             else:
                 msg = "Port is not set"
                 raise ValueError(msg)
         elif contype == ZeroQueueConnectionType.BIND:
-            self.port = self._bind_port(self.port, socket)
+            if self.addresses:
+                self.addresses = [self._bind_address(address, socket) for address in self.addresses]
+            else:
+                self.port = self._bind_port(self.port, socket)
+                self.addresses = [f"tcp://localhost:{self.port}"]
         else:
             msg = f"Invalid connection type: {contype}"
             raise ValueError(msg)
 
+    def connect(self, address: str) -> None:
+        """Connect the queue to one more endpoint.
+
+        A publisher serves every connected subscriber from one socket, so each
+        message is encoded once however many subscribers there are. The next
+        put waits for the new subscriber (see ``wait_ready``).
+        """
+        socket = self.socket_pub or self.socket_sub
+        socket.connect(address)
+        self.addresses.append(address)
+        self._ready = False
+        logger.debug(f"ZeroQueue connected to {address}")
+
+    def disconnect(self, address: str) -> None:
+        """Disconnect the queue from an endpoint added with ``connect``."""
+        socket = self.socket_pub or self.socket_sub
+        socket.disconnect(address)
+        self.addresses.remove(address)
+        logger.debug(f"ZeroQueue disconnected from {address}")
+
     def __str__(self) -> str:
         """Magic methods for string representation of queue."""
         return f"{self.__class__.__name__}(port={self.port})"
@@ -143,6 +249,10 @@ class ZeroQueue:
         if self._port != value:
             self._port = value
 
+    def codec_stats(self) -> dict[str, CodecStats]:
+        """Get encode/decode timings of every codec used by this queue."""
+        return {codec.name: codec.stats for codec in self._decoders.values()}
+
     def get(self, timeout: float | None = None) -> Any | None:
         """Receive an item from the queue with timeout.
 
@@ -155,6 +265,8 @@ class ZeroQueue:
             Optional[Any]: Received message, or None if timeout expired.
 
         """
+        if self._pending:
+            return self._pending.popleft()
         timeout_millis = int(timeout * 1000) if timeout else None
         if self.socket_sub in dict(self.poller.poll(timeout=timeout_millis)):
             return self.get_nowait()
@@ -162,10 +274,74 @@ class ZeroQueue:
 
     def get_nowait(self) -> Any:
         """Receive a message without waiting."""
-        socks = dict(self.poller.poll(timeout=0))
-        if self.socket_sub in socks:
-            return self.socket_sub.recv_pyobj(zmq.NOBLOCK)
-        return None
+        if not self._pending:
+            socks = dict(self.poller.poll(timeout=0))
+            if self.socket_sub in socks:
+                frames = self.socket_sub.recv_multipart(zmq.NOBLOCK, copy=False)
+                messages = loads_multipart(frames, self._decoders)
+                if self.on_receive is not None:
+                    self.on_receive(message_source(frames), len(messages))
+                self._pending.extend(messages)
+        return self._pending.popleft() if self._pending else None
+
+    def get_many(self, max_items: int = MAX_BATCH_SIZE, timeout: float | None = None) -> list[Any]:
+        """Receive up to ``max_items`` messages, waiting up to a timeout for the first one.
+
+        Args:
+        ----
+            max_items (int): Maximum number of messages to return.
+            timeout (Optional[float]): Timeout in seconds.
+
+        Returns:
+        -------
+            list[Any]: Received messages; empty if the timeout expired.
+
+        """
+        first = self.get(timeout)
+        if first is None:
+            return []
+        items = [first]
+        while len(items) < max_items:
+            item = self.get_nowait()
+            if item is None:
+                break
+            items.append(item)
+        return items
+
+    def wait_ready(self, timeout: float | None = None) -> bool:
+        """Wait until every subscriber this publisher connects to has subscribed.
+
+        Args:
+        ----
+            timeout (Optional[float]): Max time to wait in seconds. If None, ``ready_timeout`` is used.
+
+        Returns:
+        -------
+            bool: True if all expected subscribers are connected.
+
+        """
+        if self.mode == ZeroQueueMode.PUSH:
+            self._ready = True
+            return True
+        expected = len(self.addresses) if self.contype == ZeroQueueConnectionType.CONNECT else 1
+        deadline = time.monotonic() + (self.ready_timeout if timeout is None else timeout)
+        while self._subscribers < expected:
+            remaining_ms = max(int((deadline - time.monotonic()) * 1000), 0)
+            if not self.socket_pub.poll(remaining_ms, zmq.POLLIN):
+                break
+            event = self.socket_pub.recv()[:1]
+            if event == b"\x01":
+                self._subscribers += 1
+            elif event == b"\x00":
+                self._subscribers -= 1
+        self._ready = self._subscribers >= expected
+        return self._ready
+
+    def _handshake(self) -> None:
+        """Run the one-time readiness handshake before the first message."""
+        if not self.wait_ready():
+            logger.warning(f"{self} sending before all subscribers are connected")
+        self._ready = True
 
     def put(self, item: Any) -> None:
         """Send a message.
@@ -175,8 +351,9 @@ class ZeroQueue:
             item (Any): Object to send.
 
         """
-        time.sleep(0.001)
-        self.socket_pub.send_pyobj(item)
+        if not self._ready:
+            self._handshake()
+        send_multipart(self.socket_pub, item, self.codec, source=self.source)
 
     def put_nowait(self, item: Any) -> None:
         """Send a message without blocking.
@@ -186,7 +363,24 @@ class ZeroQueue:
             item (Any): Object to send.
 
         """
-        self.socket_pub.send_pyobj(item, zmq.NOBLOCK)
+        if not self._ready:
+            self.wait_ready(0)
+        send_multipart(self.socket_pub, item, self.codec, zmq.NOBLOCK, source=self.source)
+
+    def put_many(self, items: Iterable[Any], max_batch_size: int | None = None) -> None:
+        """Send several messages as multipart batches.
+
+        Args:
+        ----
+            items (Iterable[Any]): Objects to send, in order.
+            max_batch_size (Optional[int]): Max messages per batch. Default is ``MAX_BATCH_SIZE``.
+
+        """
+        if not self._ready:
+            self._handshake()
+        items = iter(items)
+        while batch := list(islice(items, max_batch_size or self.MAX_BATCH_SIZE)):
+            send_multipart(self.socket_pub, batch, self.codec, batch=True, source=self.source)
 
     def _after_fork(self) -> None:
         """Reset sockets after fork (Unix only)."""
@@ -194,19 +388,33 @@ class ZeroQueue:
 
     def _reset(self) -> None:
         """Recreate PUB/SUB sockets."""
-        self.socket_pub = self.context.socket(zmq.PUB)
+        self.context = get_context()
+        self.socket_pub = self.context.socket(zmq.XPUB)
+        self.socket_pub.setsockopt(zmq.XPUB_VERBOSE, 1)
+        self.socket_pub.setsockopt(zmq.XPUB_VERBOSER, 1)
         self.socket_pub.connect(f"tcp://*:{self.port}")
+        self._ready = False
+        self._subscribers = 0
 
         self.socket_sub = self.context.socket(zmq.SUB)
         self.socket_sub.connect(f"tcp://localhost:{self.port}")
         self.socket_sub.subscribe("")
 
         self.poller = zmq.Poller()
+        self._pending.clear()
 
     def stop(self) -> None:
-        """Close sockets and terminate context."""
+        """Close sockets and remove bound ipc:// files.
+
+        The context is left to its owner (see ``zmq_context.shutdown_context``).
+        """
         if self.socket_pub:
             self.socket_pub.close()
         if self.socket_sub:
             self.socket_sub.close()
-        self.context.term()
+        for path in self._ipc_paths:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+        self._ipc_paths.clear()
@@ -3,8 +3,12 @@
 This class extends the ZeroQueue class to receive data from a ZeroQueuePublisher.
 """
 
+from __future__ import annotations
+
 from typing import NoReturn
 
+import zmq
+
 from neudc.core.communication.zero_queue.zero_queue import ZeroQueue
 from neudc.core.communication.zero_queue.zmq_state import ZeroQueueConnectionType, ZeroQueueMode
 
@@ -21,13 +25,25 @@ class ZeroQueueSub(ZeroQueue):
 
     """
 
-    def __init__(self) -> None:
+    def __init__(self, address: str | list[str] | None = None, context: zmq.Context | None = None) -> None:
         """Initialize the ZeroQueueSub.
 
-        This class is used to receive data from a ZeroQueuePublisher. It always binds to a random port.
+        This class is used to receive data from a ZeroQueuePublisher. It binds to the given
+        endpoints, or to a random TCP port if none are given.
+
+        Args:
+        ----
+            address (str | list[str] | None): Endpoints to bind. ``tcp://*:*`` picks a random port.
+            context (Optional[zmq.Context]): Context for the socket. Defaults to the process-wide shared context.
 
         """
-        super().__init__(port=-1, mode=ZeroQueueMode.SUB, contype=ZeroQueueConnectionType.BIND)
+        super().__init__(
+            port=-1,
+            mode=ZeroQueueMode.SUB,
+            contype=ZeroQueueConnectionType.BIND,
+            address=address,
+            context=context,
+        )
 
     def put(self, item) -> NoReturn:
         """Protect put method not supported for ZeroQueueSub."""
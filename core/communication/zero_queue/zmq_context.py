@@ -0,0 +1,108 @@
+"""Process-wide shared ZeroMQ context.
+
+All queues and mailboxes use one ``zmq.Context`` per process instead of one
+each, so a large graph runs on a small, configurable number of I/O threads and
+``inproc://`` endpoints work between any two sockets of the process.
+
+Typical usage:
+    configure_context(io_threads=2)  # optional, before the first socket is created
+    context = get_context()
+    ...
+    shutdown_context()  # after every queue and mailbox was stopped
+
+Teardown order matters: ``shutdown_context`` terminates the context, which
+blocks until every socket is closed, so stop nodes and mailboxes first.
+
+After a fork the child must not touch the parent's context. The registry drops
+it in the child (through ``register_after_fork`` and a pid check) and lazily
+creates a fresh one on the next ``get_context`` call.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sys
+import threading
+from multiprocessing.util import register_after_fork
+
+import zmq
+
+logger = logging.getLogger(__name__)
+
+
+class ZMQContextRegistry:
+    """Holder of the shared context of the current process."""
+
+    DEFAULT_IO_THREADS = 1
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._lock = threading.Lock()
+        self._context: zmq.Context | None = None
+        self._pid = os.getpid()
+        self.io_threads = self.DEFAULT_IO_THREADS
+        if sys.platform != "win32":
+            register_after_fork(self, ZMQContextRegistry._after_fork)
+
+    def configure(self, io_threads: int) -> None:
+        """Set the number of I/O threads of the shared context.
+
+        Takes effect only if called before the context is created.
+        """
+        with self._lock:
+            if self._context is not None and self._pid == os.getpid():
+                if io_threads != self.io_threads:
+                    logger.warning(f"Shared ZMQ context already uses {self.io_threads} I/O threads, ignoring {io_threads}")
+                return
+            self.io_threads = io_threads
+
+    def get(self) -> zmq.Context:
+        """Return the shared context, creating it on first use."""
+        with self._lock:
+            if self._pid != os.getpid():
+                self._reset_in_child()
+            if self._context is None or self._context.closed:
+                self._context = zmq.Context(io_threads=self.io_threads)
+                logger.debug(f"Created shared ZMQ context with {self.io_threads} I/O threads")
+            return self._context
+
+    def shutdown(self, linger_ms: int = 100) -> None:
+        """Terminate the shared context.
+
+        Sockets that are still open are closed with the given linger first.
+        Call this only after every queue and mailbox was stopped.
+        """
+        with self._lock:
+            if self._context is None or self._pid != os.getpid():
+                return
+            self._context.destroy(linger=linger_ms)
+            self._context = None
+
+    def _reset_in_child(self) -> None:
+        """Forget the parent's context without terminating it."""
+        self._context = None
+        self._pid = os.getpid()
+
+    def _after_fork(self) -> None:
+        """Reset the registry after fork (Unix only)."""
+        self._lock = threading.Lock()
+        self._reset_in_child()
+
+
+_registry = ZMQContextRegistry()
+
+
+def configure_context(io_threads: int = ZMQContextRegistry.DEFAULT_IO_THREADS) -> None:
+    """Set the number of I/O threads of the shared context."""
+    _registry.configure(io_threads)
+
+
+def get_context() -> zmq.Context:
+    """Return the shared ZeroMQ context of this process."""
+    return _registry.get()
+
+
+def shutdown_context(linger_ms: int = 100) -> None:
+    """Terminate the shared ZeroMQ context of this process."""
+    _registry.shutdown(linger_ms)
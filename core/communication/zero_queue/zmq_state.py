@@ -8,6 +8,8 @@ class ZeroQueueMode(str, Enum):
 
     SUB = "SUB"
     PUB = "PUB"
+    PUSH = "PUSH"
+    PULL = "PULL"
 
 
 class ZeroQueueConnectionType(str, Enum):
@@ -17,10 +17,10 @@ class SaveImageNode(BaseNode):
     A node that saves incoming Frame images to disk in the specified directory.
     """
 
-    def __init__(self, mailbox: Any, logger: Any, save_dir: str):
+    def __init__(self, mailbox: Any, logger: Any, save_dir: str, **runtime_options: Any):
         self.save_dir = save_dir
         os.makedirs(self.save_dir, exist_ok=True)
-        super().__init__(mailbox, logger)
+        super().__init__(mailbox, logger, **runtime_options)
 
     @staticmethod
     def from_config(config: dict[str, Any]) -> "SaveImageNode":
@@ -36,7 +36,8 @@ class SaveImageNode(BaseNode):
         return SaveImageNode(
             mailbox=config["mailbox"],
             logger=config["logger"],
-            save_dir=config["save_dir"]
+            save_dir=config["save_dir"],
+            **BaseNode.runtime_options(config),
         )
 
     def process(self, frame: Frame) -> Frame:
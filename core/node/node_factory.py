@@ -1,7 +1,10 @@
 from neudc.core.node.readers.image_reader import FolderImageNode
+from neudc.core.node.readers.raw_reader import RawFrameNode
+from neudc.core.node.readers.video_reader import VideoReaderNode
 from neudc.core.node.processors.dummy_resize import ResizeNode
 from neudc.core.node.broadcast.image_saver import SaveImageNode
-from typing import Any
+import logging
+from typing import Any, Iterable
 
 
 class NodeFactory:
@@ -11,6 +14,8 @@ class NodeFactory:
 
     NODE_CLASS_MAP = {
         "FolderImageNode": FolderImageNode,
+        "VideoReaderNode": VideoReaderNode,
+        "RawFrameNode": RawFrameNode,
         "ResizeNode": ResizeNode,
         "SaveImageNode": SaveImageNode,
     }
@@ -38,3 +43,25 @@ class NodeFactory:
         config["mailbox"] = mailbox
         config["logger"] = logger
         return node_class.from_config(config)
+
+    @staticmethod
+    def create_nodes(
+        node_configs: Iterable[dict[str, Any]], mailboxes: dict[str, Any], node_ids: Iterable[str] | None = None
+    ) -> dict[str, Any]:
+        """
+        Create the nodes of a pipeline.
+
+        Args:
+            node_configs (Iterable[dict]): Node configs, e.g. ``RoutingFactory.nodes.values()`` (replicas expanded).
+            mailboxes (dict): Mailboxes by node id, see RoutingFactory.create_mailboxes.
+            node_ids (Iterable[str] | None): Only create these nodes. Defaults to every node with a mailbox.
+
+        Returns:
+            dict[str, Any]: Instantiated nodes by id.
+        """
+        selected = set(mailboxes if node_ids is None else node_ids)
+        return {
+            node_cfg["id"]: NodeFactory.create(node_cfg, mailboxes[node_cfg["id"]], logging.getLogger(node_cfg["id"]))
+            for node_cfg in node_configs
+            if node_cfg["id"] in selected
+        }
@@ -0,0 +1,163 @@
+"""
+ProcessSupervisor runs the nodes of a pipeline in worker processes.
+
+With the top-level "execution": "process" every node runs in its own process;
+nodes that share a "process" value run together in one worker. Each worker is
+started with the "spawn" method and runs its own nodes as a Pipeline. Edges between workers use ipc:// (tcp:// with fixed
+ports on Windows) and all workers share the namespace chosen by the parent, so
+their endpoints match without further coordination.
+
+The parent only supervises: it waits for every worker to report ready, watches
+for workers that exit unexpectedly (optionally restarting them, see
+"max_restarts") and on stop() shuts the workers down one at a time in
+topological order of their process groups: a group is asked to stop (drain
+its nodes) only after every group upstream of it exited, so frames still in
+flight reach the downstream workers. A worker that does not exit within
+"stop_timeout" seconds is terminated.
+
+Typical usage:
+    supervisor = ProcessSupervisor(load_config("pipeline.yaml"))
+    supervisor.start()
+    ...
+    supervisor.stop()
+"""
+
+import logging
+import multiprocessing as mp
+import signal
+import threading
+import time
+import uuid
+from typing import Any, Dict
+
+from neudc.core.communication.messaging.routing_factory import RoutingFactory
+
+
+def _run_worker(config: dict, process_name: str, ready: Any, stop: Any) -> None:
+    """Entry point of a worker process: run the group's nodes as a Pipeline until stop."""
+    # Import here so the node modules (and their optional dependencies) load in the worker only.
+    from neudc.core.runtime.pipeline import Pipeline
+
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # the parent coordinates shutdown
+    logger = logging.getLogger(f"{__name__}.{process_name}")
+    pipeline = Pipeline(config, logger, process=process_name)
+    pipeline.start()
+    logger.info(f"Worker {process_name} running nodes {pipeline.node_ids}")
+    ready.set()
+    stop.wait()
+    pipeline.stop()
+
+
+class ProcessSupervisor:
+    """
+    Start, watch and stop the worker processes of a pipeline.
+    """
+
+    START_METHOD = "spawn"
+    WATCH_INTERVAL = 0.5
+
+    def __init__(self, config: dict, logger: logging.Logger | None = None):
+        """
+        Args:
+            config (dict): Pipeline configuration. "namespace" is filled in if missing.
+            logger (logging.Logger | None): Logger for supervision messages.
+        """
+        self.config = dict(config)
+        self.config.setdefault("namespace", uuid.uuid4().hex[:8])
+        self.logger = logger or logging.getLogger(__name__)
+        self.max_restarts = self.config.get("max_restarts", 0)
+        self.stop_timeout = self.config.get("stop_timeout", 5.0)
+        routing = RoutingFactory(self.config)
+        self.groups = routing.process_groups()
+        order = {node_id: index for index, node_id in enumerate(routing.topological_order())}
+        self.stop_order = sorted(self.groups, key=lambda name: min(order[node_id] for node_id in self.groups[name]))
+        self._mp = mp.get_context(self.START_METHOD)
+        self.workers: Dict[str, Any] = {}
+        self._ready: Dict[str, Any] = {}
+        self._stops: Dict[str, Any] = {}
+        self.restarts: Dict[str, int] = {name: 0 for name in self.groups}
+        self._watcher: threading.Thread | None = None
+        self._stopping = threading.Event()
+
+    def _spawn(self, process_name: str) -> None:
+        ready, stop = self._mp.Event(), self._mp.Event()
+        worker = self._mp.Process(
+            target=_run_worker,
+            args=(self.config, process_name, ready, stop),
+            name=f"pycore-{process_name}",
+        )
+        worker.start()
+        self.workers[process_name] = worker
+        self._ready[process_name] = ready
+        self._stops[process_name] = stop
+        self.logger.info(f"Started worker {process_name} (pid {worker.pid})")
+
+    def start(self, timeout: float = 30.0) -> bool:
+        """
+        Start every worker and wait until all of them built their nodes.
+
+        Args:
+            timeout (float): Max time in seconds to wait for the workers.
+
+        Returns:
+            bool: True if every worker reported ready in time.
+        """
+        for process_name in self.groups:
+            self._spawn(process_name)
+        ready = self.wait_ready(timeout)
+        self._watcher = threading.Thread(target=self._watch, daemon=True)
+        self._watcher.start()
+        return ready
+
+    def wait_ready(self, timeout: float = 30.0) -> bool:
+        """Wait until every worker reported ready."""
+        deadline = time.monotonic() + timeout
+        for process_name, ready in self._ready.items():
+            if not ready.wait(max(deadline - time.monotonic(), 0)):
+                self.logger.warning(f"Worker {process_name} is not ready after {timeout} s")
+                return False
+        return True
+
+    def _watch(self) -> None:
+        """Detect workers that exit on their own and restart them if allowed."""
+        while not self._stopping.wait(self.WATCH_INTERVAL):
+            for process_name, worker in list(self.workers.items()):
+                if worker.is_alive() or self._stopping.is_set():
+                    continue
+                self.logger.error(f"Worker {process_name} exited with code {worker.exitcode}")
+                if self.restarts[process_name] < self.max_restarts:
+                    self.restarts[process_name] += 1
+                    self._spawn(process_name)
+                else:
+                    del self.workers[process_name]
+
+    def is_alive(self) -> bool:
+        """Check whether every worker is running."""
+        return len(self.workers) == len(self.groups) and all(w.is_alive() for w in self.workers.values())
+
+    def stop(self) -> None:
+        """Stop the workers in topological order, each after the upstream ones exited, terminating laggards."""
+        self._stopping.set()
+        if self._watcher is not None:
+            self._watcher.join()
+        for process_name in self.stop_order:
+            worker = self.workers.get(process_name)
+            if worker is None:
+                continue
+            self._stops[process_name].set()
+            worker.join(self.stop_timeout)
+            if worker.is_alive():
+                self.logger.warning(f"Worker {process_name} did not stop in time, terminating")
+                worker.terminate()
+                worker.join(1.0)
+            if worker.is_alive():
+                worker.kill()
+                worker.join()
+        self.logger.info("All workers stopped.")
+
+    def __enter__(self) -> "ProcessSupervisor":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
@@ -29,10 +29,10 @@ class ResizeNode(BaseNode):
     A node that resizes incoming Frame objects to a target resolution.
     """
 
-    def __init__(self, mailbox: Any, logger: Any, target_width: int, target_height: int):
+    def __init__(self, mailbox: Any, logger: Any, target_width: int, target_height: int, **runtime_options: Any):
         self.target_width = target_width
         self.target_height = target_height
-        super().__init__(mailbox, logger)
+        super().__init__(mailbox, logger, **runtime_options)
 
     @staticmethod
     def from_config(config: dict[str, Any]) -> "ResizeNode":
@@ -49,7 +49,8 @@ class ResizeNode(BaseNode):
             mailbox=config["mailbox"],
             logger=config["logger"],
             target_width=config["target_width"],
-            target_height=config["target_height"]
+            target_height=config["target_height"],
+            **BaseNode.runtime_options(config),
         )
 
     def process(self, frame: Frame) -> Frame:
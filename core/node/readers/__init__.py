@@ -8,8 +8,9 @@ media files, allowing users to easily integrate image and video processing capab
 into their applications.
 
 Classes:
-- ImageReader: Handles reading and processing of image files from various formats.
-- VideoReader: Manages video file reading and frame extraction.
+- FolderImageNode (image_reader): Handles reading and processing of image files from various formats.
+- VideoReaderNode (video_reader): Reads frames from video files and capture devices.
+- RawFrameNode (raw_reader): Replays memory-mapped raw frame containers without decoding.
 
 Usage:
 Import this module to create instances of image or video readers based on the required 
@@ -4,17 +4,33 @@ ImageReader class
 This class reads images from a given path and puts them in a queue.
 The class is designed to be used as a node in a dataflow graph.
 The class is thread-safe and can be used with asyncio.
+
+With "decode_workers" > 0 images are decoded ahead on a thread pool
+(cv2.imread releases the GIL): up to "prefetch" images are decoded in
+parallel while the node thread hands out the finished ones in folder order.
+Frames are paced by a Ticker (see neudc.core.utils.ticker) at "target_fps",
+or at 1 / "frame_delay" if no target is given, against absolute deadlines, so
+decode time does not lower the rate. "catch_up" releases frames missed during
+a stall back to back instead of skipping them.
+
+With "cache_mb" > 0 decoded images are kept in a FrameCache of that many
+megabytes, so "loop" mode decodes each file only once while the folder fits
+in the budget. Cached images are read-only.
 """
 
 import os
 import time
 import cv2
 import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any
 import numpy as np
 
 from neudc.core.base.base_node import BaseNode
 from neudc.core.communication.messaging.types import Frame  # Frame class as given
+from neudc.core.utils.frame_cache import FrameCache
+from neudc.core.utils.ticker import Ticker
 
 
 class FolderImageNode(BaseNode):
@@ -28,7 +44,13 @@ class FolderImageNode(BaseNode):
         mailbox: Any,
         logger: Any,
         mode: str = "loop",
-        frame_delay: float = 0.01
+        frame_delay: float = 0.01,
+        decode_workers: int = 0,
+        prefetch: int = 8,
+        cache_mb: float = 0.0,
+        target_fps: float | None = None,
+        catch_up: bool = False,
+        **runtime_options: Any,
     ):
         """
         Initialize FolderImageNode.
@@ -38,7 +60,13 @@ class FolderImageNode(BaseNode):
             mailbox (Any): Mailbox for sending Frame objects.
             logger (Any): Logger for debug/info messages.
             mode (str): Mode of reading images ("loop" or "only_one").
-            frame_delay (float): Delay between sending frames (in seconds).
+            frame_delay (float): Delay between sending frames (in seconds). Used if target_fps is not set.
+            decode_workers (int): Threads decoding images ahead of the node. 0 decodes on the node thread.
+            prefetch (int): Max images decoded ahead when decode_workers > 0.
+            cache_mb (float): Memory budget of the decoded-image cache in megabytes. 0 disables the cache.
+            target_fps (float | None): Frames per second to send. 0 sends as fast as images are read.
+            catch_up (bool): After a stall, send the frames missed meanwhile back to back.
+            **runtime_options: BaseNode runtime options, e.g. ``id``.
         """
         self.folder_path = folder_path
         self.mode = mode  # "loop" or "only_one"
@@ -46,7 +74,15 @@ class FolderImageNode(BaseNode):
         self.image_files = sorted(os.listdir(folder_path))
         self.current_index = 0
         self.frame_id = 0
-        super().__init__(mailbox, logger)
+        self.prefetch = max(prefetch, 1)
+        self._pool = ThreadPoolExecutor(decode_workers, thread_name_prefix="image-decode") if decode_workers > 0 else None
+        self._decoding: deque[tuple[str, Future]] = deque()
+        self._next_decode = 0
+        if target_fps is None:
+            target_fps = 1.0 / frame_delay if frame_delay > 0 else 0.0
+        self.ticker = Ticker(target_fps, catch_up=catch_up, name=runtime_options.get("id", "BaseNode"))
+        self.cache = FrameCache(int(cache_mb * 1e6), name=runtime_options.get("id", "BaseNode")) if cache_mb > 0 else None
+        super().__init__(mailbox, logger, **runtime_options)
 
     @staticmethod
     def from_config(config: dict[str, Any]) -> "FolderImageNode":
@@ -66,12 +102,58 @@ class FolderImageNode(BaseNode):
             mailbox=mailbox,
             logger=logger,
             mode=config.get("mode", "loop"),
-            frame_delay=config.get("frame_delay", 0.01)
+            frame_delay=config.get("frame_delay", 0.01),
+            decode_workers=config.get("decode_workers", 0),
+            prefetch=config.get("prefetch", 8),
+            cache_mb=config.get("cache_mb", 0.0),
+            target_fps=config.get("target_fps"),
+            catch_up=config.get("catch_up", False),
+            **BaseNode.runtime_options(config),
         )
     
     def _collect_data(self):
         return True
 
+    def _read_ahead(self) -> None:
+        """Keep up to ``prefetch`` images decoding, in folder order."""
+        while len(self._decoding) < self.prefetch:
+            if self._next_decode >= len(self.image_files):
+                if self.mode != "loop" or not self.image_files:
+                    return
+                self._next_decode = 0
+            image_path = os.path.join(self.folder_path, self.image_files[self._next_decode])
+            self._decoding.append((image_path, self._pool.submit(self._decode, image_path)))
+            self._next_decode += 1
+
+    def _decode(self, image_path: str) -> np.ndarray | None:
+        """Decode an image, or take it from the cache."""
+        if self.cache is None:
+            return cv2.imread(image_path)
+        image = self.cache.get(image_path)
+        if image is None:
+            image = cv2.imread(image_path)
+            if image is not None:
+                image = self.cache.put(image_path, image)
+        return image
+
+    def _read(self) -> tuple[str, np.ndarray | None] | None:
+        """Next image path and decoded image; None once every image was read in 'only_one' mode."""
+        if self._pool is not None:
+            self._read_ahead()
+            if not self._decoding:
+                return None
+            image_path, future = self._decoding.popleft()
+            self._read_ahead()
+            return image_path, future.result()
+        if self.current_index >= len(self.image_files):
+            if self.mode != "loop":
+                return None
+            self.current_index = 0
+        image_path = os.path.join(self.folder_path, self.image_files[self.current_index])
+        self.current_index += 1
+        self.logger.debug(f"Loading image: {image_path}")
+        return image_path, self._decode(image_path)
+
     def process(self, *args, **kwargs) -> Any:
         """
         Process method that reads an image, wraps it into a Frame, and returns it.
@@ -79,22 +161,16 @@ class FolderImageNode(BaseNode):
         Returns:
             Frame or None: Frame object or None if reading fails or finished.
         """
-        
-        if self.current_index >= len(self.image_files):
-            if self.mode == "only_one":
-                self.logger.info("All images processed in 'only_one' mode.")
-                self.stop()
-                return None
-            elif self.mode == "loop":
-                self.current_index = 0
-
-        # Load image from disk
-        image_path = os.path.join(self.folder_path, self.image_files[self.current_index])
-        self.logger.debug(f"Loading image: {image_path}")
-        image = cv2.imread(image_path)
+        read = self._read()
+        if read is None:
+            self.logger.info("All images processed in 'only_one' mode.")
+            self.stop()
+            return None
+        image_path, image = read
         if image is None:
             self.logger.warning(f"Failed to read image: {image_path}")
             return None
+        self.ticker.wait()
 
         # Create Frame object
         timestamp = time.time()
@@ -107,9 +183,11 @@ class FolderImageNode(BaseNode):
         )
 
         self.logger.debug(f"Sending Frame(id={self.frame_id}) from {image_path}")
-        self.current_index += 1
         self.frame_id += 1
-
-        time.sleep(self.frame_delay)  # Simulate delay between frames
-        self.logger.debug(f"Sleeping for {self.frame_delay:.2f} seconds")
         return frame
+
+    def stop(self):
+        """Stop the node and cancel images still waiting to be decoded."""
+        super().stop()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,124 @@
+"""
+RawFrameReader node
+
+This node replays a raw frame container (see neudc.core.utils.raw_frames)
+and sends Frame objects whose image is a read-only view into the
+memory-mapped file: no decoding and no copy on the node thread. It is meant
+for benchmarks that measure the pipeline itself rather than image decoding.
+
+Convert an image folder first:
+    python -m neudc.core.utils.raw_frames <image folder> <container file>
+"""
+
+import time
+from typing import Any
+
+from neudc.core.base.base_node import BaseNode
+from neudc.core.communication.messaging.types import Frame
+from neudc.core.utils.raw_frames import RawFrameFile
+from neudc.core.utils.ticker import Ticker
+
+
+class RawFrameNode(BaseNode):
+    """
+    A node that replays frames from a memory-mapped raw frame container.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        mailbox: Any,
+        logger: Any,
+        mode: str = "loop",
+        target_fps: float = 0.0,
+        catch_up: bool = False,
+        **runtime_options: Any,
+    ):
+        """
+        Initialize RawFrameNode.
+
+        Args:
+            path (str): Raw frame container written by write_raw_frames.
+            mailbox (Any): Mailbox for sending Frame objects.
+            logger (Any): Logger for debug/info messages.
+            mode (str): Mode of reading frames ("loop" or "only_one").
+            target_fps (float): Frames per second to send. 0 sends as fast as downstream allows.
+            catch_up (bool): After a stall, send the frames missed meanwhile back to back.
+            **runtime_options: BaseNode runtime options, e.g. ``id``.
+
+        Raises:
+            ValueError: If the file is not a raw frame container.
+        """
+        self.frames = RawFrameFile(path)
+        self.mode = mode
+        self.current_index = 0
+        self.frame_id = 0
+        self.ticker = Ticker(target_fps, catch_up=catch_up, name=runtime_options.get("id", "BaseNode"))
+        super().__init__(mailbox, logger, **runtime_options)
+
+    @staticmethod
+    def from_config(config: dict[str, Any]) -> "RawFrameNode":
+        """
+        Create a RawFrameNode from configuration dictionary.
+
+        Args:
+            config (dict): Configuration with keys 'path', 'mailbox', 'logger', etc.
+
+        Returns:
+            RawFrameNode: Instantiated RawFrameNode.
+        """
+        return RawFrameNode(
+            path=config["path"],
+            mailbox=config["mailbox"],
+            logger=config["logger"],
+            mode=config.get("mode", "loop"),
+            target_fps=config.get("target_fps", 0.0),
+            catch_up=config.get("catch_up", False),
+            **BaseNode.runtime_options(config),
+        )
+
+    def _collect_data(self):
+        return True
+
+    def process(self, *args, **kwargs) -> Any:
+        """
+        Wrap the next frame of the container into a Frame.
+
+        Returns:
+            Frame or None: Frame object, or None once every frame was sent in 'only_one' mode.
+        """
+        if self.current_index >= len(self.frames):
+            if not len(self.frames):
+                self.logger.warning(f"No frames in {self.frames.path}, stopping.")
+                self.stop()
+                return None
+            if self.mode != "loop":
+                self.logger.info("All frames sent in 'only_one' mode.")
+                self.stop()
+                return None
+            self.current_index = 0
+        index = self.current_index
+        self.current_index += 1
+        self.ticker.wait()
+        frame = Frame(
+            image=self.frames[index],
+            timestamp=time.time(),
+            source_frame=f"{self.frames.path}@{self.frames.name(index)}",
+            frame_id=self.frame_id,
+            boxes=[],
+        )
+        self.frame_id += 1
+        return frame
+
+    def run(self):
+        """Run the node loop and release the container once it exits, however the node was stopped."""
+        try:
+            super().run()
+        finally:
+            self.frames.close()
+
+    def stop(self):
+        """Stop the node; a node that never ran releases the container here."""
+        super().stop()
+        if self.thread is None:
+            self.frames.close()
@@ -0,0 +1,221 @@
+"""
+VideoReader node
+
+This node reads frames from a video file or a capture device with
+cv2.VideoCapture and sends them as Frame objects.
+
+Frames are grabbed on a background thread into a bounded buffer of
+"buffer_size" frames, so decoding overlaps with sending. With "stride" N only
+every Nth frame is decoded; the frames in between are grabbed without being
+decoded. "start_frame" or "start_ms" seeks into a file before reading.
+
+Two delivery modes:
+    - default: the grab thread waits while the buffer is full, so every
+      (strided) frame is sent and a file is read as fast as downstream allows,
+    - "realtime": the buffer drops its oldest frame for a new one, so a slow
+      downstream gets the freshest frames; a file is paced at its native
+      frame rate, as a camera would deliver it. Dropped frames are counted.
+"target_fps" paces the grab thread explicitly (see neudc.core.utils.ticker).
+In "loop" mode a file that yields no frame after seeking to the start offset
+(empty, undecodable, or the offset lies past its end) ends the node like
+"only_one" instead of seeking again.
+
+Frame.timestamp is the wall-clock grab time, Frame.frame_id counts the sent
+frames and Frame.source_frame is "<source>@<index of the frame in the source>".
+"""
+
+import threading
+import time
+from queue import Empty, Full
+from typing import Any
+
+import cv2
+
+from neudc.core.base.base_node import BaseNode
+from neudc.core.communication.mailbox.qos import BoundedMessageBuffer, DropPolicy
+from neudc.core.communication.messaging.types import Frame
+from neudc.core.utils.metrics import get_registry
+from neudc.core.utils.ticker import Ticker
+
+_END = object()
+
+
+class VideoReaderNode(BaseNode):
+    """
+    A node that reads frames from a video file or capture device and sends Frame objects via mailbox.
+    """
+
+    BUFFER_TIMEOUT = 0.1
+
+    def __init__(
+        self,
+        source: str | int,
+        mailbox: Any,
+        logger: Any,
+        mode: str = "only_one",
+        stride: int = 1,
+        start_frame: int = 0,
+        start_ms: float = 0.0,
+        buffer_size: int = 8,
+        realtime: bool = False,
+        target_fps: float | None = None,
+        **runtime_options: Any,
+    ):
+        """
+        Initialize VideoReaderNode.
+
+        Args:
+            source (str | int): Video file path or URL, or the index of a capture device ("0" works too).
+            mailbox (Any): Mailbox for sending Frame objects.
+            logger (Any): Logger for debug/info messages.
+            mode (str): "only_one" stops at the end of the video, "loop" starts over from the start offset.
+            stride (int): Send every Nth frame; the others are skipped without decoding.
+            start_frame (int): Index of the first frame read from a file.
+            start_ms (float): Position of the first frame read from a file, in milliseconds. Used if start_frame is 0.
+            buffer_size (int): Max frames grabbed ahead of the node.
+            realtime (bool): Drop the oldest buffered frame when downstream is slow, and pace files at their frame rate.
+            target_fps (float | None): Rate of the grab thread. Defaults to the file's frame rate / stride
+                in realtime mode and to no pacing otherwise.
+            **runtime_options: BaseNode runtime options, e.g. ``id``.
+
+        Raises:
+            ValueError: If the source cannot be opened.
+        """
+        self.source = int(source) if isinstance(source, str) and source.isdigit() else source
+        self.is_device = isinstance(self.source, int)
+        self.mode = mode
+        self.stride = max(stride, 1)
+        self.start_frame = start_frame
+        self.start_ms = start_ms
+        self.realtime = realtime
+        self.capture = cv2.VideoCapture(self.source)
+        if not self.capture.isOpened():
+            raise ValueError(f"Cannot open video source: {source}")
+        self._seek()
+        if target_fps is None:
+            native_fps = self.capture.get(cv2.CAP_PROP_FPS)
+            target_fps = native_fps / self.stride if realtime and not self.is_device and native_fps > 0 else 0.0
+        node_id = runtime_options.get("id", "BaseNode")
+        self.ticker = Ticker(target_fps, name=node_id)
+        policy = DropPolicy.DROP_OLDEST if realtime else DropPolicy.FIFO
+        self.buffer = BoundedMessageBuffer(buffer_size, policy)
+        get_registry().gauge("pycore_reader_dropped", lambda: self.buffer.dropped, "Frames dropped in realtime mode", node=node_id)
+        self.frame_id = 0
+        self._grab_thread: threading.Thread | None = None
+        self._grab_stop = threading.Event()
+        super().__init__(mailbox, logger, **runtime_options)
+
+    @staticmethod
+    def from_config(config: dict[str, Any]) -> "VideoReaderNode":
+        """
+        Create a VideoReaderNode from configuration dictionary.
+
+        Args:
+            config (dict): Configuration with keys 'source', 'mailbox', 'logger', etc.
+
+        Returns:
+            VideoReaderNode: Instantiated VideoReaderNode.
+        """
+        return VideoReaderNode(
+            source=config["source"],
+            mailbox=config["mailbox"],
+            logger=config["logger"],
+            mode=config.get("mode", "only_one"),
+            stride=config.get("stride", 1),
+            start_frame=config.get("start_frame", 0),
+            start_ms=config.get("start_ms", 0.0),
+            buffer_size=config.get("buffer_size", 8),
+            realtime=config.get("realtime", False),
+            target_fps=config.get("target_fps"),
+            **BaseNode.runtime_options(config),
+        )
+
+    def _seek(self) -> None:
+        """Move a file to the start offset."""
+        if self.is_device:
+            return
+        if self.start_frame:
+            self.capture.set(cv2.CAP_PROP_POS_FRAMES, self.start_frame)
+        elif self.start_ms:
+            self.capture.set(cv2.CAP_PROP_POS_MSEC, self.start_ms)
+        else:
+            self.capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+
+    def _put(self, item: Any) -> bool:
+        """Buffer an item, waiting for space unless the node is stopping."""
+        while not self._grab_stop.is_set():
+            try:
+                self.buffer.put(item, timeout=self.BUFFER_TIMEOUT)
+                return True
+            except Full:
+                continue
+        return False
+
+    def _grab_loop(self) -> None:
+        """Grab, skip and decode frames into the buffer until the video ends or the node stops."""
+        read_since_seek = False
+        while not self._grab_stop.is_set():
+            self.ticker.wait()
+            index = int(self.capture.get(cv2.CAP_PROP_POS_FRAMES))
+            ok = all(self.capture.grab() for _ in range(self.stride - 1))
+            ok, image = self.capture.read() if ok else (False, None)
+            if not ok:
+                if self.mode == "loop" and not self.is_device and read_since_seek:
+                    self.logger.debug("End of video, starting over.")
+                    self._seek()
+                    read_since_seek = False
+                    continue
+                if self.mode == "loop" and not self.is_device:
+                    self.logger.error(f"No frame could be read from {self.source} after seeking to the start offset.")
+                self._put(_END)
+                return
+            read_since_seek = True
+            if not self._put((index + self.stride - 1, time.time(), image)):
+                return
+
+    def start(self):
+        """Start the grab thread and the node thread."""
+        self._grab_stop.clear()
+        self._grab_thread = threading.Thread(target=self._grab_loop, name="video-grab", daemon=True)
+        self._grab_thread.start()
+        super().start()
+
+    def _collect_data(self):
+        return True
+
+    def process(self, *args, **kwargs) -> Any:
+        """
+        Take the next grabbed frame and wrap it into a Frame.
+
+        Returns:
+            Frame or None: Frame object, or None if no frame was grabbed in time or the video ended.
+        """
+        try:
+            item = self.buffer.get(timeout=self.BUFFER_TIMEOUT)
+        except Empty:
+            return None
+        if item is _END:
+            self.logger.info("End of video reached, stopping.")
+            self.stop()
+            return None
+        index, timestamp, image = item
+        frame = Frame(
+            image=image,
+            timestamp=timestamp,
+            source_frame=f"{self.source}@{index}",
+            frame_id=self.frame_id,
+            boxes=[],
+        )
+        self.logger.debug(f"Sending Frame(id={self.frame_id}) from {frame.source_frame}")
+        self.frame_id += 1
+        return frame
+
+    def stop(self):
+        """Stop the node, then the grab thread, and release the capture."""
+        super().stop()
+        self._grab_stop.set()
+        self.buffer.wake()
+        if self._grab_thread is not None and self._grab_thread is not threading.current_thread():
+            self._grab_thread.join(timeout=self._join_timeout)
+            if not self._grab_thread.is_alive():
+                self.capture.release()
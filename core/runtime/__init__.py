@@ -0,0 +1,4 @@
+"""Runtime for NEUDC pipelines.
+
+This module builds, starts and stops whole node graphs from a pipeline configuration.
+"""
@@ -0,0 +1,193 @@
+"""
+Pipeline runtime that builds, starts and stops a whole node graph.
+
+Pipeline replaces the manual sequence of load_config, RoutingFactory and
+NodeFactory calls:
+    1. RoutingFactory creates and wires the mailboxes of the local nodes.
+    2. Nodes are built in parallel on a thread pool ("build_workers"), so slow
+       constructors (model loading, opening devices) overlap. Nodes are built
+       with autostart disabled.
+    3. Nodes are started in reverse topological order, sinks first. Before a
+       node starts, its mailbox waits until the receivers of all its outgoing
+       edges are connected (readiness barrier), so sources never send into
+       edges that are still connecting and the first frames are not lost.
+On stop() nodes are stopped in topological order, sources first. Every node
+is stopped only after its receive buffer drained or "drain_timeout" expired,
+so frames already in flight still reach the sinks. The process-wide ZeroMQ
+context is shut down at the end.
+
+Per-node startup timings (build, readiness wait and start offset) are kept in
+Pipeline.startup_timings and logged once the pipeline runs. With the
+top-level "metrics_port" key the node and mailbox metrics are served in the
+Prometheus text format on http://127.0.0.1:<metrics_port>/metrics while the
+pipeline runs (see neudc.core.utils.metrics). Worker processes serve on
+"metrics_port" plus the index of their process group. stop() removes the
+metrics of the pipeline's nodes from the registry, so a pipeline rebuilt in
+the same process does not serve the stale series of the previous one.
+
+The top-level "max_age_ms" bounds the age of the frames every node works on:
+frames older than that are skipped before process() and counted (see
+BaseNode). A node's own "max_age_ms" overrides it. The top-level "deadline_ms"
+gives every frame an end-to-end budget instead: sources stamp
+Frame.deadline = timestamp + deadline_ms and every node skips the frame once
+the deadline has passed.
+
+Typical usage:
+    with Pipeline(load_config("pipeline.yaml")) as pipeline:
+        ...
+"""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict
+
+from neudc.core.communication.messaging.routing_factory import RoutingFactory
+from neudc.core.communication.zero_queue.zmq_context import shutdown_context
+from neudc.core.node.node_factory import NodeFactory
+from neudc.core.utils.metrics import get_registry, start_http_server
+
+
+class Pipeline:
+    """
+    Build the nodes of a pipeline in parallel, start them behind a readiness barrier and drain them on stop.
+    """
+
+    DEFAULT_BUILD_WORKERS = 8
+    DEFAULT_READY_TIMEOUT = 5.0
+    DEFAULT_DRAIN_TIMEOUT = 5.0
+    DRAIN_POLL_INTERVAL = 0.01
+    NODE_DEFAULTS = ("trace_sample_rate", "max_age_ms", "deadline_ms")
+
+    def __init__(self, config: dict, logger: logging.Logger | None = None, process: str | None = None):
+        """
+        Args:
+            config (dict): Pipeline configuration with a "nodes" list. Optional top-level keys:
+                "build_workers", "ready_timeout" and "drain_timeout" (seconds), and node options
+                applied to every node unless it sets them itself: "trace_sample_rate", "max_age_ms", "deadline_ms".
+            logger (logging.Logger | None): Logger for startup and shutdown messages.
+            process (str | None): Only run the nodes of this process group (see ProcessSupervisor).
+                Defaults to every local node.
+        """
+        self.config = config
+        self.logger = logger or logging.getLogger(__name__)
+        self.routing = RoutingFactory(config)
+        if any(node_cfg.get("async") for node_cfg in self.routing.nodes.values()):
+            raise ValueError("Pipeline runs threaded nodes only; drive async nodes from an event loop")
+        groups = self.routing.process_groups()
+        self.metrics_port = config.get("metrics_port")
+        if self.metrics_port is not None and process is not None:
+            self.metrics_port += list(groups).index(process)
+        self.node_ids: list[str] = groups.get(process, []) if process is not None else [
+            node_id for node_ids in groups.values() for node_id in node_ids
+        ]
+        self.build_workers = config.get("build_workers", self.DEFAULT_BUILD_WORKERS)
+        self.ready_timeout = config.get("ready_timeout", self.DEFAULT_READY_TIMEOUT)
+        self.drain_timeout = config.get("drain_timeout", self.DEFAULT_DRAIN_TIMEOUT)
+        self.mailboxes: Dict[str, Any] = {}
+        self.nodes: Dict[str, Any] = {}
+        self.startup_timings: Dict[str, Dict[str, float]] = {}
+        self.metrics_server = None
+        self.is_running = False
+
+    def topological_order(self) -> list[str]:
+        """
+        Order the pipeline's nodes so that every node comes before the nodes it sends to.
+
+        Nodes on a cycle keep their config order after the acyclic part.
+        """
+        return self.routing.topological_order(self.node_ids)
+
+    def _build_node(self, node_id: str) -> Any:
+        started = time.monotonic()
+        defaults = {key: self.config[key] for key in self.NODE_DEFAULTS if key in self.config}
+        node_cfg = {**defaults, **self.routing.nodes[node_id], "autostart": False}
+        node = NodeFactory.create(node_cfg, self.mailboxes[node_id], logging.getLogger(node_id))
+        self.startup_timings[node_id] = {"build_s": time.monotonic() - started}
+        return node
+
+    def build(self) -> None:
+        """Create the mailboxes and build every node without starting it."""
+        self.mailboxes = self.routing.create_mailboxes(self.node_ids)
+        try:
+            with ThreadPoolExecutor(max_workers=max(min(self.build_workers, len(self.node_ids)), 1)) as executor:
+                nodes = dict(zip(self.node_ids, executor.map(self._build_node, self.node_ids)))
+        except Exception:
+            for mailbox in self.mailboxes.values():
+                mailbox.stop()
+            raise
+        self.nodes = {node_id: nodes[node_id] for node_id in self.topological_order()}
+
+    def start(self) -> bool:
+        """
+        Build the pipeline if needed and start its nodes, sinks first.
+
+        Returns:
+            bool: True if every edge was connected before its sender started.
+        """
+        started = time.monotonic()
+        if not self.nodes:
+            self.build()
+        all_ready = True
+        for node_id in reversed(list(self.nodes)):
+            waited = time.monotonic()
+            ready = self.mailboxes[node_id].wait_ready(self.ready_timeout)
+            if not ready:
+                all_ready = False
+                self.logger.warning(f"Outputs of {node_id} not connected after {self.ready_timeout} s, starting anyway")
+            self.startup_timings[node_id]["ready_s"] = time.monotonic() - waited
+            self.nodes[node_id].start()
+            self.startup_timings[node_id]["started_at_s"] = time.monotonic() - started
+        if self.metrics_port is not None and self.metrics_server is None:
+            self.metrics_server = start_http_server(self.metrics_port)
+            self.logger.info(f"Serving metrics on port {self.metrics_server.server_port}")
+        self.is_running = True
+        self.logger.info(f"Pipeline with {len(self.nodes)} nodes started in {time.monotonic() - started:.3f} s")
+        for node_id, timings in self.startup_timings.items():
+            self.logger.debug(f"[{node_id}] " + ", ".join(f"{key}={value:.3f}" for key, value in timings.items()))
+        return all_ready
+
+    def _wait_drained(self, node_id: str, deadline: float) -> bool:
+        """Wait until a node's receive buffer stayed empty for one poll interval."""
+        mailbox = self.mailboxes[node_id]
+        while time.monotonic() < deadline:
+            if not mailbox.pending:
+                time.sleep(self.DRAIN_POLL_INTERVAL)
+                if not mailbox.pending:
+                    return True
+            else:
+                time.sleep(self.DRAIN_POLL_INTERVAL)
+        return not mailbox.pending
+
+    def stop(self, drain: bool = True) -> None:
+        """
+        Stop the nodes, sources first, drop their metrics and shut down the ZeroMQ context.
+
+        Args:
+            drain (bool): Let every node process the messages already sent to it before it stops.
+        """
+        deadline = time.monotonic() + self.drain_timeout
+        for node_id, node in self.nodes.items():
+            if drain and not self._wait_drained(node_id, deadline):
+                self.logger.warning(f"{node_id} stopped with {self.mailboxes[node_id].pending} messages left")
+            node.stop()
+        for node_id, mailbox in self.mailboxes.items():
+            if node_id not in self.nodes:
+                mailbox.stop()
+        if self.metrics_server is not None:
+            self.metrics_server.shutdown()
+            self.metrics_server.server_close()
+            self.metrics_server = None
+        registry = get_registry()
+        for node_id in self.mailboxes:
+            registry.remove(node=node_id)
+        self.is_running = False
+        shutdown_context()
+        self.logger.info("Pipeline stopped.")
+
+    def __enter__(self) -> "Pipeline":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
@@ -0,0 +1,98 @@
+"""
+Cache of decoded images with a memory budget.
+
+Readers that replay the same files over and over (FolderImageNode in "loop"
+mode) keep decoded images in a FrameCache instead of decoding them again on
+every pass. The cache holds at most ``max_bytes`` of image data and evicts
+the least recently used images first. Cached arrays are made read-only, so a
+node that tries to modify a cached image in place gets an error instead of
+silently corrupting every later frame made from it; nodes replace
+``frame.image`` instead (as ResizeNode does).
+
+Hits, misses and evictions are counted in the metrics registry, labelled
+with the cache name (see neudc.core.utils.metrics).
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Hashable
+
+import numpy as np
+
+from neudc.core.utils.metrics import get_registry
+
+
+class FrameCache:
+    """
+    Thread-safe LRU cache of decoded images bounded by their total size in bytes.
+    """
+
+    def __init__(self, max_bytes: int, name: str = "frame_cache"):
+        """
+        Args:
+            max_bytes (int): Max total ``nbytes`` of the cached images.
+            name (str): Cache name used as metrics label.
+        """
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._images: OrderedDict[Hashable, np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+        registry = get_registry()
+        self.hits = registry.counter("pycore_frame_cache_hits_total", "Images served from the cache", cache=name)
+        self.misses = registry.counter("pycore_frame_cache_misses_total", "Images not found in the cache", cache=name)
+        self.evictions = registry.counter("pycore_frame_cache_evictions_total", "Images evicted to stay within the budget", cache=name)
+        registry.gauge("pycore_frame_cache_bytes", lambda: self.size, "Bytes of cached image data", cache=name)
+
+    def __len__(self) -> int:
+        return len(self._images)
+
+    def get(self, key: Hashable) -> np.ndarray | None:
+        """Return the cached image for a key and mark it as recently used; None on a miss."""
+        with self._lock:
+            image = self._images.get(key)
+            if image is None:
+                self.misses.inc()
+                return None
+            self._images.move_to_end(key)
+            self.hits.inc()
+            return image
+
+    def put(self, key: Hashable, image: np.ndarray) -> np.ndarray:
+        """
+        Cache an image, evicting the least recently used ones to stay within ``max_bytes``.
+
+        Images larger than the whole budget are not cached.
+
+        Returns:
+            np.ndarray: The image, made read-only.
+        """
+        image.setflags(write=False)
+        if image.nbytes > self.max_bytes:
+            return image
+        with self._lock:
+            previous = self._images.pop(key, None)
+            if previous is not None:
+                self.size -= previous.nbytes
+            while self._images and self.size + image.nbytes > self.max_bytes:
+                _, evicted = self._images.popitem(last=False)
+                self.size -= evicted.nbytes
+                self.evictions.inc()
+            self._images[key] = image
+            self.size += image.nbytes
+        return image
+
+    def stats(self) -> dict[str, int]:
+        """Hits, misses, evictions, cached images and bytes."""
+        return {
+            "hits": self.hits.value,
+            "misses": self.misses.value,
+            "evictions": self.evictions.value,
+            "images": len(self._images),
+            "bytes": self.size,
+        }
+
+    def clear(self) -> None:
+        """Drop every cached image."""
+        with self._lock:
+            self._images.clear()
+            self.size = 0
@@ -0,0 +1,263 @@
+"""
+Runtime metrics for nodes and mailboxes.
+
+Nodes and mailboxes record their metrics into the process-wide
+MetricsRegistry (see get_registry):
+    - Counter: monotonically increasing count, e.g. messages in and out.
+    - Gauge: value read from a callback when metrics are collected, e.g. queue depth.
+    - Histogram: log-linear ("HDR-style") histogram, e.g. process() latency.
+
+Recording is cheap: counters and histograms are plain integer updates without
+locks. Every metric has a single writer (the thread of its node or mailbox);
+readers may see a snapshot that is a few updates behind.
+
+The registry is read through a Python API (MetricsRegistry.snapshot) or in
+the Prometheus text format (MetricsRegistry.render), which
+start_http_server serves on a local port.
+
+Typical usage:
+    server = start_http_server(9100)
+    ...
+    print(get_registry().snapshot())
+    server.shutdown()
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Tuple
+
+
+class Counter:
+    """
+    Monotonically increasing count with a single writer.
+    """
+
+    kind = "counter"
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount: int = 1) -> None:
+        """Add to the counter."""
+        self.value += amount
+
+    def snapshot(self) -> int:
+        return self.value
+
+
+class Gauge:
+    """
+    Value read from a callback whenever metrics are collected.
+    """
+
+    kind = "gauge"
+
+    def __init__(self, read: Callable[[], float]):
+        self.read = read
+
+    def snapshot(self) -> float:
+        return self.read()
+
+
+class Histogram:
+    """
+    Log-linear histogram with bounded relative error, in the spirit of HdrHistogram.
+
+    Values are recorded in multiples of ``unit``. Values below 2**SUB_BUCKET_BITS units
+    are counted exactly; larger values fall into buckets whose width is 1/2**(SUB_BUCKET_BITS-1)
+    of their magnitude, so reported percentiles are within ~3% of the true value.
+    """
+
+    kind = "histogram"
+    SUB_BUCKET_BITS = 6
+    MAX_SHIFT = 40
+    EXPORT_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self, unit: float = 1e-6):
+        """
+        Args:
+            unit (float): Resolution of recorded values, e.g. 1e-6 for seconds recorded in microseconds.
+        """
+        self.unit = unit
+        self.counts = [0] * (self._index(1 << (self.SUB_BUCKET_BITS + self.MAX_SHIFT)) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    @classmethod
+    def _index(cls, units: int) -> int:
+        """Bucket of a value in units."""
+        if units < 1 << cls.SUB_BUCKET_BITS:
+            return units
+        shift = min(units.bit_length() - cls.SUB_BUCKET_BITS, cls.MAX_SHIFT)
+        half = 1 << (cls.SUB_BUCKET_BITS - 1)
+        return shift * half + min(units >> shift, 2 * half - 1)
+
+    @classmethod
+    def _upper(cls, index: int) -> int:
+        """Highest value in units that falls into a bucket."""
+        if index < 1 << cls.SUB_BUCKET_BITS:
+            return index
+        half = 1 << (cls.SUB_BUCKET_BITS - 1)
+        shift, top = divmod(index, half)
+        return ((top + half + 1) << (shift - 1)) - 1
+
+    def record(self, value: float) -> None:
+        """Record a value, e.g. a duration in seconds. Negative values (clock steps) count as 0."""
+        if value < 0:
+            value = 0.0
+        self.counts[self._index(int(value / self.unit))] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, q: float) -> float:
+        """Value below which ``q`` percent of the recorded values fall; 0.0 if empty."""
+        target = max(q / 100 * self.count, 1)
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= target:
+                return min(self._upper(index) * self.unit, self.max)
+        return 0.0
+
+    def count_below(self, value: float) -> int:
+        """Number of recorded values up to ``value`` (at bucket resolution)."""
+        return sum(self.counts[: self._index(int(value / self.unit)) + 1])
+
+    def snapshot(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "max": self.max,
+        }
+
+
+class MetricsRegistry:
+    """
+    Named metric families, each holding one metric per label set.
+    """
+
+    def __init__(self):
+        self._families: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, name: str, help: str, metric: Any, labels: Dict[str, str]) -> Any:
+        """Add a metric, replacing one with the same name and labels."""
+        with self._lock:
+            family = self._families.setdefault(name, {"help": help, "kind": metric.kind, "metrics": {}})
+            if family["kind"] != metric.kind:
+                raise ValueError(f"Metric {name} is a {family['kind']}, not a {metric.kind}")
+            family["metrics"][tuple(sorted(labels.items()))] = metric
+        return metric
+
+    def counter(self, name: str, help: str = "", **labels: str) -> Counter:
+        """Create a counter, e.g. ``registry.counter("pycore_node_messages_in_total", node="reader")``."""
+        return self._register(name, help, Counter(), labels)
+
+    def gauge(self, name: str, read: Callable[[], float], help: str = "", **labels: str) -> Gauge:
+        """Create a gauge whose value is read from ``read`` on every collection."""
+        return self._register(name, help, Gauge(read), labels)
+
+    def histogram(self, name: str, help: str = "", unit: float = 1e-6, **labels: str) -> Histogram:
+        """Create a histogram of values recorded in multiples of ``unit``."""
+        return self._register(name, help, Histogram(unit), labels)
+
+    def remove(self, **labels: str) -> None:
+        """Remove every metric whose labels include the given ones, e.g. all metrics of a node."""
+        wanted = set(labels.items())
+        with self._lock:
+            for family in self._families.values():
+                for key in [key for key in family["metrics"] if wanted <= set(key)]:
+                    del family["metrics"][key]
+
+    def _items(self) -> list[Tuple[str, Dict[str, Any], list[Tuple[Tuple, Any]]]]:
+        with self._lock:
+            return [(name, family, list(family["metrics"].items())) for name, family in self._families.items()]
+
+    def snapshot(self) -> Dict[str, list[Dict[str, Any]]]:
+        """
+        Collect the current value of every metric.
+
+        Returns:
+            Dict[str, list[dict]]: Per metric name, a list of {"labels": {...}, "value": ...};
+                histogram values are dicts with count, sum, p50, p90, p99 and max.
+        """
+        return {
+            name: [{"labels": dict(key), "value": metric.snapshot()} for key, metric in metrics]
+            for name, _, metrics in self._items()
+        }
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        lines = []
+        for name, family, metrics in self._items():
+            if not metrics:
+                continue
+            if family["help"]:
+                lines.append(f"# HELP {name} {family['help']}")
+            lines.append(f"# TYPE {name} {family['kind']}")
+            for key, metric in metrics:
+                if family["kind"] != "histogram":
+                    lines.append(f"{name}{_labels(key)} {metric.snapshot()}")
+                    continue
+                for bound in metric.EXPORT_BUCKETS:
+                    lines.append(f"{name}_bucket{_labels(key, le=bound)} {metric.count_below(bound)}")
+                lines.append(f"{name}_bucket{_labels(key, le='+Inf')} {metric.count}")
+                lines.append(f"{name}_sum{_labels(key)} {metric.sum}")
+                lines.append(f"{name}_count{_labels(key)} {metric.count}")
+        return "\n".join(lines) + "\n"
+
+
+def _labels(key: Tuple, **extra: Any) -> str:
+    items = [*key, *extra.items()]
+    if not items:
+        return ""
+    return "{" + ",".join(f'{name}="{value}"' for name, value in items) + "}"
+
+
+_registry = MetricsRegistry()
+
+
+def get_registry() -> MetricsRegistry:
+    """Return the process-wide metrics registry."""
+    return _registry
+
+
+def start_http_server(port: int, host: str = "127.0.0.1", registry: MetricsRegistry | None = None) -> ThreadingHTTPServer:
+    """
+    Serve the registry in the Prometheus text format on ``http://host:port/metrics``.
+
+    Args:
+        port (int): Port to listen on; 0 picks a free one (see ``server.server_port``).
+        host (str): Interface to listen on. Defaults to the local host only.
+        registry (MetricsRegistry | None): Registry to serve. Defaults to the process-wide one.
+
+    Returns:
+        ThreadingHTTPServer: Running server; call ``shutdown()`` to stop it.
+    """
+    registry = registry or get_registry()
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if self.path.split("?")[0] not in ("/", "/metrics"):
+                self.send_error(404)
+                return
+            body = registry.render().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: Any) -> None:
+            pass  # keep scrapes out of the logs
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    return server
@@ -0,0 +1,120 @@
+"""
+Packed container of raw (decoded) frames for replay without decode cost.
+
+write_raw_frames converts an image folder into a single file:
+    - header (HEADER_SIZE bytes): MAGIC, frame count and offset of the index,
+    - frames: uint8 pixel data, every frame aligned to ALIGNMENT bytes,
+    - index: one INDEX_DTYPE record per frame (offset, height, width, channels, file name).
+Frames may differ in size. RawFrameFile memory-maps the container and
+returns every frame as a read-only numpy view into the mapping, so reading a
+frame costs neither decoding nor copying; the OS pages the data in on first
+access.
+
+Usage:
+    python -m neudc.core.utils.raw_frames <image folder> <container file>
+"""
+
+import argparse
+import mmap
+import os
+import struct
+
+import cv2
+import numpy as np
+
+MAGIC = b"PYCRAW01"
+HEADER = struct.Struct("<8sQQ")
+HEADER_SIZE = 64
+ALIGNMENT = 64
+INDEX_DTYPE = np.dtype(
+    [("offset", "<u8"), ("height", "<u4"), ("width", "<u4"), ("channels", "<u4"), ("name", "S128")]
+)
+
+
+def write_raw_frames(folder_path: str, path: str) -> int:
+    """
+    Decode every image of a folder (in sorted file name order) into a raw frame container.
+
+    Files that cv2 cannot read are skipped.
+
+    Args:
+        folder_path (str): Folder with the images.
+        path (str): Container file to write.
+
+    Returns:
+        int: Number of frames written.
+    """
+    records = []
+    with open(path, "wb") as f:
+        f.write(bytes(HEADER_SIZE))
+        for name in sorted(os.listdir(folder_path)):
+            image = cv2.imread(os.path.join(folder_path, name))
+            if image is None:
+                continue
+            image = image.reshape(image.shape[0], image.shape[1], -1)
+            f.write(bytes(-f.tell() % ALIGNMENT))
+            records.append((f.tell(), *image.shape, name.encode()[: INDEX_DTYPE["name"].itemsize]))
+            f.write(np.ascontiguousarray(image).data)
+        f.write(bytes(-f.tell() % ALIGNMENT))
+        index_offset = f.tell()
+        f.write(np.array(records, dtype=INDEX_DTYPE).tobytes())
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, len(records), index_offset))
+    return len(records)
+
+
+class RawFrameFile:
+    """
+    Read-only memory-mapped raw frame container.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): Container written by write_raw_frames.
+
+        Raises:
+            ValueError: If the file is not a raw frame container.
+        """
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, count, index_offset = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC:
+            self._mmap.close()
+            raise ValueError(f"Not a raw frame container: {path}")
+        self.data = np.frombuffer(self._mmap, dtype=np.uint8)
+        self.index = np.frombuffer(self._mmap, dtype=INDEX_DTYPE, count=count, offset=index_offset)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __getitem__(self, i: int) -> np.ndarray:
+        """Frame ``i`` as a read-only (height, width, channels) view into the mapping."""
+        offset, height, width, channels = (int(value) for value in self.index[i][["offset", "height", "width", "channels"]].item())
+        return self.data[offset : offset + height * width * channels].reshape(height, width, channels)
+
+    def name(self, i: int) -> str:
+        """File name the frame was converted from."""
+        return self.index[i]["name"].decode()
+
+    def close(self) -> None:
+        """Release the mapping; it stays alive until the last frame view returned earlier is gone."""
+        self.data = self.index = None
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass  # frames still in use keep the mapping alive
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Convert an image folder into a raw frame container.")
+    parser.add_argument("folder", help="Folder with the images.")
+    parser.add_argument("path", help="Container file to write.")
+    args = parser.parse_args()
+    count = write_raw_frames(args.folder, args.path)
+    print(f"Wrote {count} frames to {args.path}")
+
+
+if __name__ == "__main__":
+    main()
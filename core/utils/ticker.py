@@ -0,0 +1,117 @@
+"""
+Drift-free pacing for source nodes.
+
+A Ticker releases its caller at a fixed rate. Ticks are scheduled on a grid
+of absolute deadlines (start + n / target_fps), so time spent between two
+wait() calls, e.g. decoding the next image, is absorbed by the next sleep
+instead of adding to the period, and sleep overshoot does not accumulate.
+
+When the caller falls behind by more than a period (a stall):
+    - by default the missed ticks are skipped and counted; the next tick is the
+      next grid deadline still ahead, so the rate stays at the target,
+    - with catch_up=True the missed ticks are released back to back until the
+      schedule is met again, so the average rate over the stall stays at the
+      target. At most CATCH_UP_LIMIT seconds of ticks are caught up.
+
+Lateness (how long after its deadline a tick was released) is kept in a
+histogram as the measure of jitter. With a name the ticker registers its
+lateness histogram and achieved-FPS gauge in the metrics registry, labelled
+node=name (see neudc.core.utils.metrics).
+
+Typical usage:
+    ticker = Ticker(target_fps=30)
+    while running:
+        frame = read()
+        ticker.wait()
+        send(frame)
+"""
+
+import time
+from typing import Any, Dict
+
+from neudc.core.utils.metrics import Histogram, get_registry
+
+
+class Ticker:
+    """
+    Rate limiter scheduling ticks against absolute deadlines.
+    """
+
+    CATCH_UP_LIMIT = 1.0
+
+    def __init__(self, target_fps: float, catch_up: bool = False, name: str | None = None):
+        """
+        Args:
+            target_fps (float): Ticks per second. 0 or less releases every wait() at once (no pacing).
+            catch_up (bool): Release missed ticks back to back after a stall instead of skipping them.
+            name (str | None): Register the ticker's metrics labelled with this node id.
+        """
+        self.target_fps = target_fps
+        self.period = 1.0 / target_fps if target_fps > 0 else 0.0
+        self.catch_up = catch_up
+        self.ticks = 0
+        self.missed = 0
+        self._started: float | None = None
+        self._last = 0.0
+        self._deadline = 0.0
+        if name is None:
+            self.lateness = Histogram()
+        else:
+            registry = get_registry()
+            self.lateness = registry.histogram("pycore_ticker_lateness_seconds", "Delay of ticks past their deadline", node=name)
+            registry.gauge("pycore_ticker_fps", lambda: self.achieved_fps, "Achieved ticks per second", node=name)
+
+    def wait(self) -> float:
+        """
+        Sleep until the next tick is due.
+
+        Returns:
+            float: Lateness of the tick in seconds (0 or more).
+        """
+        now = time.monotonic()
+        if self._started is None:
+            self._started = self._deadline = now
+        delay = self._deadline - now
+        if delay > 0:
+            time.sleep(delay)
+            now = time.monotonic()
+        lateness = max(now - self._deadline, 0.0)
+        self.lateness.record(lateness)
+        self.ticks += 1
+        self._last = now
+        if self.period:
+            self._schedule_next(now)
+        return lateness
+
+    def _schedule_next(self, now: float) -> None:
+        self._deadline += self.period
+        behind = now - self._deadline
+        if behind <= 0:
+            return
+        if self.catch_up:
+            limit = self.CATCH_UP_LIMIT
+            if behind <= limit:
+                return
+            behind -= limit
+        skipped = int(behind / self.period) + (0 if self.catch_up else 1)
+        self._deadline += skipped * self.period
+        self.missed += skipped
+
+    @property
+    def achieved_fps(self) -> float:
+        """Average ticks per second since the first tick."""
+        if self._started is None or self.ticks < 2 or self._last <= self._started:
+            return 0.0
+        return (self.ticks - 1) / (self._last - self._started)
+
+    def stats(self) -> Dict[str, Any]:
+        """Target and achieved FPS, ticks, skipped ticks and lateness percentiles (jitter)."""
+        return {
+            "target_fps": self.target_fps,
+            "achieved_fps": self.achieved_fps,
+            "ticks": self.ticks,
+            "missed": self.missed,
+            "lateness_p50_s": self.lateness.percentile(50),
+            "lateness_p99_s": self.lateness.percentile(99),
+            "lateness_max_s": self.lateness.max,
+        }
@@ -0,0 +1,194 @@
+"""
+End-to-end tracing of sampled messages.
+
+A source node (one whose input has no ``trace`` field) with
+"trace_sample_rate" > 0 starts a trace on that fraction of the messages it
+produces. Every node a traced message passes stamps one hop,
+(node id, start, end), with wall-clock times of its process() call into the
+message's ``trace`` field (see Frame.trace). Untraced messages carry
+``trace=None`` and cost a single attribute lookup per node.
+
+The time between the end of a hop and the start of the next one is queue
+wait: transport, receive buffer and waiting for the node to be free. Time
+inside a hop is processing. Hop ends are the wall-clock start plus the
+perf_counter duration of the call; a negative wait caused by a clock step is
+recorded as 0.
+
+When a traced message reaches a node without outputs, the trace is handed to
+the process-wide TraceCollector (see get_collector), which keeps:
+    - per path (the node ids a message went through) percentiles of end-to-end
+      latency and of every hop's queue wait and processing time,
+    - a critical-path report: the slowest path and where its time goes,
+    - the most recent traces for export as Chrome trace JSON
+      (chrome://tracing or https://ui.perfetto.dev).
+
+Typical usage:
+    collector = get_collector()
+    ...
+    print(collector.critical_path())
+    collector.export_chrome_trace("trace.json")
+"""
+
+import json
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, Iterable, Tuple
+
+from neudc.core.utils.metrics import Histogram
+
+Hop = Tuple[str, float, float]
+
+
+class PathStats:
+    """
+    Latency histograms of one path through the pipeline.
+    """
+
+    def __init__(self, path: Tuple[str, ...]):
+        self.path = path
+        self.total = Histogram()
+        self.queue = {node_id: Histogram() for node_id in path}
+        self.process = {node_id: Histogram() for node_id in path}
+
+    def record(self, trace: list[Hop]) -> None:
+        previous_end = None
+        for node_id, start, end in trace:
+            if previous_end is not None:  # a source has no queue wait
+                self.queue[node_id].record(start - previous_end)
+            self.process[node_id].record(end - start)
+            previous_end = end
+        self.total.record(trace[-1][2] - trace[0][1])
+
+    def segments(self) -> list[Dict[str, Any]]:
+        """Mean queue wait and processing time per node, largest first."""
+        total = sum(h.sum for h in self.queue.values()) + sum(h.sum for h in self.process.values())
+        segments = [
+            {"node": node_id, "kind": kind, "mean_s": histogram.sum / histogram.count, "share": histogram.sum / total if total else 0.0}
+            for kind, histograms in (("queue", self.queue), ("process", self.process))
+            for node_id, histogram in histograms.items()
+            if histogram.count
+        ]
+        return sorted(segments, key=lambda segment: segment["mean_s"], reverse=True)
+
+
+class TraceCollector:
+    """
+    Aggregate finished traces into per-path latency statistics.
+    """
+
+    DEFAULT_KEEP_LAST = 1000
+    PATH_SEPARATOR = ">"
+
+    def __init__(self, keep_last: int = DEFAULT_KEEP_LAST):
+        """
+        Args:
+            keep_last (int): Number of recent traces kept for Chrome trace export.
+        """
+        self.paths: Dict[Tuple[str, ...], PathStats] = {}
+        self.recent: deque = deque(maxlen=keep_last)
+        self._lock = threading.Lock()
+
+    def collect(self, trace: list[Hop]) -> None:
+        """Add a finished trace. Thread-safe."""
+        if not trace:
+            return
+        path = tuple(hop[0] for hop in trace)
+        with self._lock:
+            stats = self.paths.get(path)
+            if stats is None:
+                stats = self.paths[path] = PathStats(path)
+            stats.record(trace)
+            self.recent.append(trace)
+
+    def report(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Latency percentiles per path.
+
+        Returns:
+            Dict[str, dict]: Per path ("reader>resize>saver"), the end-to-end histogram snapshot
+                under "total" and per node the "queue" and "process" histogram snapshots.
+        """
+        with self._lock:
+            return {
+                self.PATH_SEPARATOR.join(path): {
+                    "total": stats.total.snapshot(),
+                    "hops": {
+                        node_id: {"queue": stats.queue[node_id].snapshot(), "process": stats.process[node_id].snapshot()}
+                        for node_id in path
+                    },
+                }
+                for path, stats in self.paths.items()
+            }
+
+    def critical_path(self, percentile: float = 99) -> Dict[str, Any]:
+        """
+        Report the path with the highest end-to-end latency and where its time goes.
+
+        Args:
+            percentile (float): Percentile used to rank the paths.
+
+        Returns:
+            dict: "path", its "latency_s" at the percentile, and "segments" with the mean queue wait
+                and processing time per node, largest first. Empty if nothing was collected.
+        """
+        with self._lock:
+            if not self.paths:
+                return {}
+            stats = max(self.paths.values(), key=lambda path_stats: path_stats.total.percentile(percentile))
+            return {
+                "path": self.PATH_SEPARATOR.join(stats.path),
+                "latency_s": stats.total.percentile(percentile),
+                "segments": stats.segments(),
+            }
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """Recent traces in the Chrome trace event format, one row per node."""
+        with self._lock:
+            traces = list(self.recent)
+        events = []
+        for trace_id, trace in enumerate(traces):
+            previous_end = None
+            for node_id, start, end in trace:
+                if previous_end is not None:
+                    events.append(_event(node_id, "queue", previous_end, start, trace_id))
+                events.append(_event(node_id, "process", start, end, trace_id))
+                previous_end = end
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path: str | Path) -> None:
+        """Write the recent traces as Chrome trace JSON."""
+        with open(path, "w") as f:
+            json.dump(self.chrome_trace(), f)
+
+    def clear(self) -> None:
+        """Drop every collected trace."""
+        with self._lock:
+            self.paths.clear()
+            self.recent.clear()
+
+
+def _event(node_id: str, kind: str, start: float, end: float, trace_id: int) -> Dict[str, Any]:
+    return {
+        "name": f"{node_id} {kind}",
+        "cat": kind,
+        "ph": "X",
+        "ts": start * 1e6,
+        "dur": max(end - start, 0.0) * 1e6,
+        "pid": 0,
+        "tid": node_id,
+        "args": {"trace": trace_id},
+    }
+
+
+def extend_trace(trace: Iterable[Hop] | None, node_id: str, start: float, end: float) -> list[Hop]:
+    """Return a new trace with one more hop; the input trace is left unchanged."""
+    return [*(trace or ()), (node_id, start, end)]
+
+
+_collector = TraceCollector()
+
+
+def get_collector() -> TraceCollector:
+    """Return the process-wide trace collector."""
+    return _collector